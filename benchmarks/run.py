@@ -0,0 +1,239 @@
+"""
+Benchmark suite for the drf-standardized-responses hot paths.
+
+Measures throughput (ops/sec) and allocations (via tracemalloc) for:
+
+- `StandardResponseRenderer.render` across payload sizes
+- `StandardPagination.get_paginated_response` on an in-memory SQLite dataset
+- `standardized_exception_handler` with deep ValidationError trees
+
+Usage:
+    python -m benchmarks.run                          # run and print results
+    python -m benchmarks.run --save baseline.json     # save results as a baseline
+    python -m benchmarks.run --compare baseline.json  # fail on regressions
+    python -m benchmarks.run --filter renderer        # only matching benchmarks
+
+Comparisons exit with status 1 when any benchmark is slower than the baseline
+by more than `--threshold` percent (default 10).
+"""
+import argparse
+import json
+import os
+import sys
+import timeit
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def setup_django():
+    """Configure Django with the test settings and an in-memory database."""
+    for path in (os.path.join(ROOT, 'src'), ROOT):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'tests.settings')
+
+    import django
+    from django.core.management import call_command
+    from django.test.utils import setup_test_environment
+
+    django.setup()
+    setup_test_environment()
+    call_command('migrate', run_syncdb=True, verbosity=0)
+
+
+def measure(func, min_time=0.2):
+    """
+    Measure `func`'s throughput and allocations.
+
+    Returns:
+        dict: `ops_per_sec`, `peak_bytes` (peak memory allocated during one call)
+              and `net_bytes` (memory still allocated after one call).
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    number = max(1, int(number * min_time / 0.2))
+    best = min(timer.repeat(repeat=5, number=number)) / number
+
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        result = func()
+        current, peak = tracemalloc.get_traced_memory()
+        del result
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'ops_per_sec': 1.0 / best if best else float('inf'),
+        'peak_bytes': peak - baseline,
+        'net_bytes': current - baseline,
+    }
+
+
+def renderer_benchmarks():
+    """Yield `StandardResponseRenderer.render` benchmarks across payload sizes."""
+    from rest_framework.response import Response
+
+    from drf_standardized_responses.renderers import StandardResponseRenderer
+    from drf_standardized_responses.responses import StandardResponse
+
+    renderer = StandardResponseRenderer()
+    for size in (1, 100, 10000):
+        data = [{'id': i, 'name': 'Item %d' % i, 'price': '%d.99' % i, 'tags': ['a', 'b']} for i in range(size)]
+        context = {'response': Response(data)}
+        yield 'renderer.success[%d]' % size, lambda d=data, c=context: renderer.render(d, None, c)
+
+        envelope = StandardResponse.success(data=data, meta={'pagination': {'count': size}}).data
+        context = {'response': Response(envelope)}
+        yield 'renderer.envelope[%d]' % size, lambda d=envelope, c=context: renderer.render(d, None, c)
+
+    errors = {'field': ['This field is required.']}
+    context = {'response': Response(errors, status=400)}
+    yield 'renderer.error', lambda: renderer.render(dict(errors), None, context)
+
+
+def pagination_benchmarks():
+    """Yield `StandardPagination.get_paginated_response` benchmarks on SQLite."""
+    from django.contrib.auth.models import Group
+    from django.test import RequestFactory
+    from rest_framework.request import Request
+
+    from drf_standardized_responses.pagination import StandardPagination
+
+    if not Group.objects.exists():
+        Group.objects.bulk_create([Group(name='group-%05d' % i) for i in range(5000)])
+
+    factory = RequestFactory()
+    queryset = Group.objects.order_by('pk')
+
+    for page_size in (10, 100):
+        request = Request(factory.get('/groups/', {'page': 3, 'page_size': page_size}))
+
+        def paginate(request=request):
+            pagination = StandardPagination()
+            page = pagination.paginate_queryset(queryset, request)
+            return pagination.get_paginated_response([{'id': group.pk, 'name': group.name} for group in page])
+
+        yield 'pagination.page[%d]' % page_size, paginate
+
+        pagination = StandardPagination()
+        page = pagination.paginate_queryset(queryset, request)
+        data = [{'id': group.pk, 'name': group.name} for group in page]
+        yield 'pagination.response[%d]' % page_size, lambda p=pagination, d=data: p.get_paginated_response(d)
+
+
+def build_error_tree(depth, breadth):
+    """Build a nested ValidationError detail `depth` levels deep."""
+    if depth == 0:
+        return ['This field is required.', 'Ensure this value is positive.']
+    return {'field_%d' % i: build_error_tree(depth - 1, breadth) for i in range(breadth)}
+
+
+def exception_benchmarks():
+    """Yield `standardized_exception_handler` benchmarks."""
+    from rest_framework.exceptions import NotFound, Throttled, ValidationError
+    from rest_framework.test import APIRequestFactory
+
+    from drf_standardized_responses.exceptions import flatten_errors, standardized_exception_handler
+
+    context = {'request': APIRequestFactory().get('/')}
+    yield 'exceptions.not_found', lambda: standardized_exception_handler(NotFound(), context)
+    yield 'exceptions.throttled', lambda: standardized_exception_handler(Throttled(wait=30), context)
+
+    for depth, breadth in ((1, 5), (3, 5), (5, 4)):
+        detail = build_error_tree(depth, breadth)
+        yield (
+            'exceptions.validation[depth=%d,breadth=%d]' % (depth, breadth),
+            lambda d=detail: standardized_exception_handler(ValidationError(d), context),
+        )
+
+    bulk = [build_error_tree(1, 3) for _ in range(1000)]
+    yield 'exceptions.validation[bulk=1000]', lambda: standardized_exception_handler(ValidationError(bulk), context)
+    bulk_detail = ValidationError(bulk).detail
+    yield 'exceptions.flatten[bulk=1000]', lambda: flatten_errors(bulk_detail)
+    yield 'exceptions.flatten[bulk=1000,limit=100]', lambda: flatten_errors(bulk_detail, 100)
+
+
+SUITES = (renderer_benchmarks, pagination_benchmarks, exception_benchmarks)
+
+
+def run(name_filter=None, suites=SUITES, min_time=0.2):
+    """
+    Run every benchmark whose name contains `name_filter`.
+
+    Returns:
+        dict: Benchmark names mapped to their measurements.
+    """
+    results = {}
+    for suite in suites:
+        for name, func in suite():
+            if name_filter and name_filter not in name:
+                continue
+            results[name] = measure(func, min_time)
+    return results
+
+
+def compare(results, baseline, threshold=10.0):
+    """
+    Compare `results` against `baseline`.
+
+    Returns:
+        list: `(name, change_percent)` for every benchmark slower than `threshold` percent.
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        change = (result['ops_per_sec'] / baseline[name]['ops_per_sec'] - 1) * 100
+        result['change_percent'] = change
+        if change < -threshold:
+            regressions.append((name, change))
+    return regressions
+
+
+def format_results(results):
+    """Format `results` as a plain-text table."""
+    lines = ['%-46s %14s %12s %12s %9s' % ('benchmark', 'ops/sec', 'peak KiB', 'net KiB', 'change')]
+    for name, result in results.items():
+        change = result.get('change_percent')
+        lines.append('%-46s %14.1f %12.1f %12.1f %9s' % (
+            name,
+            result['ops_per_sec'],
+            result['peak_bytes'] / 1024,
+            result['net_bytes'] / 1024,
+            '' if change is None else '%+.1f%%' % change,
+        ))
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--filter', help='only run benchmarks whose name contains this string')
+    parser.add_argument('--save', metavar='PATH', help='write the results to a JSON baseline file')
+    parser.add_argument('--compare', metavar='PATH', help='compare against a JSON baseline file')
+    parser.add_argument('--threshold', type=float, default=10.0, help='allowed slowdown in percent (default: 10)')
+    parser.add_argument('--min-time', type=float, default=0.2, help='minimum seconds per timing round')
+    args = parser.parse_args(argv)
+
+    setup_django()
+    results = run(args.filter, min_time=args.min_time)
+
+    regressions = []
+    if args.compare:
+        with open(args.compare) as fh:
+            regressions = compare(results, json.load(fh), args.threshold)
+
+    print(format_results(results))
+
+    if args.save:
+        with open(args.save, 'w') as fh:
+            json.dump(results, fh, indent=2, sort_keys=True)
+
+    for name, change in regressions:
+        print('REGRESSION: %s is %.1f%% slower than the baseline' % (name, -change), file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
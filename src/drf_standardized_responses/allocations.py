@@ -0,0 +1,202 @@
+"""
+Allocation profiling for the standardized response pipeline.
+
+When the `ALLOCATION_PROFILING` setting is enabled, `tracemalloc` is started
+and the memory allocated by each stage of a request is recorded:
+
+- ``exception_handler``: `standardized_exception_handler`
+- ``paginated_response``: `get_paginated_response` of the standard pagination classes
+- ``render``: `StandardResponseRenderer.render`
+
+For every stage, ``peak`` is the highest number of bytes allocated at once
+while the stage ran and ``net`` the bytes still allocated when it finished
+(negative if it freed more than it allocated). They are sent in one
+`X-Alloc-<Stage>` header per stage and broadcast with the
+`allocations_recorded` signal:
+
+    X-Alloc-Render: peak=48213, net=1520
+
+    @receiver(allocations_recorded)
+    def forward_allocations(sender, request, response, allocations, **kwargs):
+        for stage, (peak, net) in allocations.items():
+            statsd.gauge('api.alloc.%s.peak' % stage, peak)
+
+`tracemalloc` counts the allocations of every thread and slows the process
+down considerably, so this mode is meant for debugging and profiling a single
+worker, not for production traffic. `assert_allocation_budget` and the
+`allocation_budget` pytest fixture (see `drf_standardized_responses.pytest_plugin`)
+use the same measurements to assert allocation budgets in tests.
+"""
+import threading
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+from django.dispatch import Signal
+
+from drf_standardized_responses.settings import response_settings
+
+# Sent by StandardResponseRenderer with `request`, `response` and `allocations`
+# (a dict mapping stage names to `(peak, net)` tuples in bytes).
+allocations_recorded = Signal()
+
+_ALLOCATIONS_ATTR = '_standardized_allocations'
+_DISABLED = nullcontext()
+
+# Not available before Python 3.9; peaks then cover everything since tracing started.
+_reset_peak = getattr(tracemalloc, 'reset_peak', None)
+# Trackers entered and not yet exited, per thread
+_active = threading.local()
+
+
+class AllocationTracker:
+    """
+    Context manager measuring the peak and net allocations of its block.
+
+    Trackers may be nested: entering a tracker resets the `tracemalloc` peak,
+    so the enclosing trackers carry the peak observed so far themselves and
+    are told about the peaks of the trackers nested in them.
+
+    Attributes:
+        peak: Highest number of bytes allocated at once in the block, relative to its start.
+        net: Bytes allocated in the block and still alive at its end.
+    """
+
+    def __init__(self):
+        self.peak = 0
+        self.net = 0
+
+    def __enter__(self):
+        # Tracing started here is stopped again once no tracker is active.
+        self.started = not tracemalloc.is_tracing()
+        if self.started:
+            tracemalloc.start()
+        current, peak = tracemalloc.get_traced_memory()
+        self.stack = _active.__dict__.setdefault('stack', [])
+        for tracker in self.stack:
+            tracker.highest = max(tracker.highest, peak)
+        if _reset_peak is not None:
+            _reset_peak()
+        self.start = current
+        self.highest = current
+        self.stack.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        current, peak = tracemalloc.get_traced_memory()
+        self.stack.remove(self)
+        self.highest = max(self.highest, peak)
+        for tracker in self.stack:
+            tracker.highest = max(tracker.highest, self.highest)
+        self.peak = self.highest - self.start
+        self.net = current - self.start
+        if self.started and not self.stack:
+            tracemalloc.stop()
+
+
+def measure_allocations():
+    """
+    Measure the allocations of a block of code, starting `tracemalloc` if needed.
+
+    Usage:
+        with measure_allocations() as allocations:
+            renderer.render(data)
+        print(allocations.peak, allocations.net)
+    """
+    return AllocationTracker()
+
+
+@contextmanager
+def assert_allocation_budget(peak=None, net=None):
+    """
+    Fail with `AssertionError` if a block of code allocates more than its budget.
+
+    Args:
+        peak: Maximum number of bytes allocated at once, or `None` for no limit.
+        net: Maximum number of bytes still allocated at the end, or `None` for no limit.
+
+    Usage:
+        renderer.render(data)  # warm up the caches first
+        with assert_allocation_budget(peak=4096 + 300 * len(data), net=512):
+            renderer.render(data)
+    """
+    with measure_allocations() as allocations:
+        yield allocations
+    exceeded = [
+        '%s allocations of %d bytes exceed the budget of %d bytes' % (name, used, budget)
+        for name, used, budget in (('peak', allocations.peak, peak), ('net', allocations.net, net))
+        if budget is not None and used > budget
+    ]
+    if exceeded:
+        raise AssertionError('; '.join(exceeded))
+
+
+class StageTracker(AllocationTracker):
+    """
+    Allocation tracker adding its measurements to a stage of a request.
+    """
+
+    def __init__(self, allocations, stage):
+        super().__init__()
+        self.allocations = allocations
+        self.stage = stage
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        super().__exit__(exc_type, exc_value, traceback)
+        peak, net = self.allocations.get(self.stage, (0, 0))
+        self.allocations[self.stage] = (max(peak, self.peak), net + self.net)
+
+
+def get_allocations(request):
+    """
+    Return the allocations recorded so far for `request` (a Django or DRF request).
+
+    Returns:
+        dict: Stage names mapped to `(peak, net)` tuples in bytes.
+    """
+    request = getattr(request, '_request', request)
+    try:
+        return getattr(request, _ALLOCATIONS_ATTR)
+    except AttributeError:
+        allocations = {}
+        setattr(request, _ALLOCATIONS_ATTR, allocations)
+        return allocations
+
+
+def tracked(request, stage):
+    """
+    Track the allocations of a block of code as `stage` of `request`.
+
+    Returns a no-op context manager when profiling is disabled or there is no request.
+
+    Usage:
+        with tracked(request, 'render'):
+            content = renderer.render_envelope(data)
+    """
+    if request is None or not response_settings.ALLOCATION_PROFILING:
+        return _DISABLED
+    return StageTracker(get_allocations(request), stage)
+
+
+def format_alloc_headers(allocations):
+    """
+    Return the `X-Alloc-<Stage>` headers for `allocations`.
+    """
+    return {
+        'X-Alloc-%s' % stage.replace('_', ' ').title().replace(' ', '-'): 'peak=%d, net=%d' % (peak, net)
+        for stage, (peak, net) in allocations.items()
+    }
+
+
+def publish_allocations(request, response):
+    """
+    Attach the `X-Alloc-*` headers to `response` and send `allocations_recorded`.
+    """
+    if request is None or not response_settings.ALLOCATION_PROFILING:
+        return
+    allocations = get_allocations(request)
+    if not allocations:
+        return
+    if response is not None:
+        for header, value in format_alloc_headers(allocations).items():
+            response[header] = value
+    allocations_recorded.send(sender=None, request=request, response=response, allocations=dict(allocations))
@@ -1,7 +1,24 @@
+import tracemalloc
+
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class DrfStandardizedResponsesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'drf_standardized_responses'
     verbose_name = 'DRF Standardized Responses'
+
+    def ready(self):
+        from drf_standardized_responses.exception_logging import install_exception_log_queue
+        from drf_standardized_responses.renderers import prepare_envelope_cache
+        from drf_standardized_responses.settings import response_settings
+
+        # Read and validate every setting once, instead of on the first requests
+        response_settings.load()
+        prepare_envelope_cache(settings.LANGUAGE_CODE)
+
+        if response_settings.ALLOCATION_PROFILING and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        if response_settings.EXCEPTION_LOG_QUEUE:
+            install_exception_log_queue(maxsize=response_settings.EXCEPTION_LOG_QUEUE_SIZE)
@@ -0,0 +1,148 @@
+"""
+Batched sub-operations for generic viewsets.
+
+`BatchMixin` adds a ``POST <prefix>/batch/`` endpoint that runs several
+retrieve, create, update, partial_update or destroy operations in a single
+request and answers with `StandardResponse.batch`:
+
+    POST /products/batch/
+    [
+        {"action": "retrieve", "pk": 1},
+        {"action": "create", "data": {"name": "Lamp"}},
+        {"action": "partial_update", "pk": 7, "data": {"price": "9.99"}},
+        {"action": "destroy", "pk": 3}
+    ]
+
+Each operation goes through the viewset's own action, permission checks and
+serializers, and an error in one operation does not affect the others.
+"""
+from django.db import transaction
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+
+from drf_standardized_responses.responses import StandardResponse
+
+
+class BatchMixin:
+    """
+    Viewset mixin adding a `batch` action that runs several sub-operations at once.
+
+    Every operation is a JSON object with an `action` key naming one of
+    `batch_actions`, the lookup value (under the viewset's lookup URL kwarg,
+    `pk` by default) for detail actions and the request body under `data`.
+    Exceptions raised by an operation are translated with the view's exception
+    handler and reported as a failed item.
+
+    Usage:
+        class ProductViewSet(BatchMixin, viewsets.ModelViewSet):
+            queryset = Product.objects.all()
+            serializer_class = ProductSerializer
+            batch_max_operations = 50
+    """
+    # Actions that may be used in a batch
+    batch_actions = ('retrieve', 'create', 'update', 'partial_update', 'destroy')
+    # Maximum number of operations per batch request
+    batch_max_operations = 100
+    # Run each operation in a savepoint rolled back when it fails
+    batch_atomic = True
+
+    @action(detail=False, methods=['post'], url_path='batch')
+    def batch(self, request, *args, **kwargs):
+        operations = request.data
+        if isinstance(operations, dict):
+            operations = operations.get('operations')
+        if not isinstance(operations, list):
+            raise ValidationError({'operations': ['Expected a list of operations.']})
+        if len(operations) > self.batch_max_operations:
+            raise ValidationError({'operations': [
+                'Ensure this list has at most %d operations.' % self.batch_max_operations
+            ]})
+
+        return StandardResponse.batch([self.run_batch_operation(request, operation) for operation in operations])
+
+    def run_batch_operation(self, request, operation):
+        """
+        Run a single batch operation and return its response.
+
+        The view's `action` and `kwargs` are restored afterwards, so operations
+        cannot leak state into each other.
+        """
+        batch_action = self.action
+        batch_kwargs = self.kwargs
+        try:
+            if self.batch_atomic:
+                with transaction.atomic():
+                    result = self.perform_batch_operation(request, operation)
+                    if result.status_code >= 400:
+                        transaction.set_rollback(True)
+            else:
+                result = self.perform_batch_operation(request, operation)
+        finally:
+            self.action = batch_action
+            self.kwargs = batch_kwargs
+        return result
+
+    def perform_batch_operation(self, request, operation):
+        """
+        Dispatch `operation` to the viewset action it names.
+
+        Returns:
+            The action's `Response`, or the exception translated by the view's
+            exception handler.
+        """
+        try:
+            handler, kwargs, data = self.get_batch_handler(operation)
+            self.action = operation['action']
+            self.kwargs = kwargs
+            sub_request = self.get_batch_request(request, data)
+            self.check_permissions(sub_request)
+            return handler(sub_request, **kwargs)
+        except Exception as exc:
+            response = self.get_exception_handler()(exc, self.get_exception_handler_context())
+            if response is None:
+                raise
+            return response
+
+    def get_batch_request(self, request, data):
+        """
+        Build the request passed to a sub-operation: `request` with `data` as its body.
+
+        A new `Request` wraps the same `HttpRequest` (copying a DRF `Request`
+        recurses through its `__getattr__` on DRF < 3.15) and reuses the
+        outer request's authentication and negotiation results.
+        """
+        sub_request = Request(
+            request._request,
+            parsers=request.parsers,
+            authenticators=request.authenticators,
+            negotiator=request.negotiator,
+            parser_context=request.parser_context,
+        )
+        sub_request._full_data = data
+        sub_request.user = request.user
+        sub_request.auth = request.auth
+        for attr in ('accepted_renderer', 'accepted_media_type', 'version', 'versioning_scheme'):
+            if hasattr(request, attr):
+                setattr(sub_request, attr, getattr(request, attr))
+        return sub_request
+
+    def get_batch_handler(self, operation):
+        """
+        Validate `operation` and return its handler, URL kwargs and request data.
+        """
+        if not isinstance(operation, dict):
+            raise ValidationError({'operation': ['Expected an object.']})
+
+        name = operation.get('action')
+        if name not in self.batch_actions or not hasattr(self, name):
+            raise ValidationError({'action': ['"%s" is not a valid batch action.' % name]})
+
+        kwargs = {}
+        if name != 'create':
+            lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+            if lookup_url_kwarg not in operation:
+                raise ValidationError({lookup_url_kwarg: ['This field is required.']})
+            kwargs[lookup_url_kwarg] = operation[lookup_url_kwarg]
+
+        return getattr(self, name), kwargs, operation.get('data', {})
@@ -0,0 +1,297 @@
+"""
+Whole-response caching for standardized API responses.
+
+This module caches the final rendered envelope bytes in Django's cache
+framework, so repeated requests for the same resource skip serialization and
+rendering entirely. Every cached response carries a strong ETag, and requests
+sending a matching `If-None-Match` header are answered with `304 Not Modified`.
+
+Entries are grouped into namespaces (one per view class by default). Each
+namespace has a version number that is part of every cache key, so bumping
+it with `invalidate_response_cache()` invalidates all of its entries at once.
+
+With the `RESPONSE_CACHE_COMPRESSION` setting enabled, compressed variants of
+each entry are cached as well (see `drf_standardized_responses.compression`).
+"""
+import hashlib
+from functools import partial, wraps
+
+from django.core.cache import caches
+from django.http import HttpResponse
+from django.utils import translation
+from django.utils.cache import get_conditional_response, patch_vary_headers
+
+from drf_standardized_responses import compression, prefetch
+from drf_standardized_responses.settings import response_settings
+
+CACHE_KEY_PREFIX = 'drf_standardized_responses:response'
+
+# Request attributes that may be used to build a cache key
+KEY_COMPONENTS = {
+    'path': lambda request: request.path,
+    'query': lambda request: sorted(request.GET.lists()),
+    'user': lambda request: request.user.pk if request.user.is_authenticated else None,
+    'accept': lambda request: request.META.get('HTTP_ACCEPT', ''),
+    # The language responses are rendered in (e.g. as chosen by LocaleMiddleware), not the raw header
+    'language': lambda request: translation.get_language(),
+}
+
+# Methods whose responses may be cached
+CACHEABLE_METHODS = ('GET', 'HEAD')
+
+# Methods whose successful responses invalidate a CachedResponseMixin view
+INVALIDATING_METHODS = ('POST', 'PUT', 'PATCH', 'DELETE')
+
+# Headers that are recomputed by the view on every request and never cached
+EXCLUDED_HEADERS = ('Vary', 'Set-Cookie')
+
+# Per-request diagnostics (timings and allocations) that must not be replayed on cache hits
+EXCLUDED_HEADER_PREFIXES = ('server-timing', 'x-alloc-')
+
+
+def is_cached_header(name):
+    """Return whether the response header `name` is stored in cache entries."""
+    return name not in EXCLUDED_HEADERS and not name.lower().startswith(EXCLUDED_HEADER_PREFIXES)
+
+
+def make_etag(content):
+    """
+    Compute a strong ETag for rendered response content.
+
+    Args:
+        content (bytes): The rendered response body.
+
+    Returns:
+        str: A quoted entity tag.
+    """
+    return '"%s"' % hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+def get_namespace(view):
+    """
+    Return the cache namespace for a view class, view instance or explicit name.
+    """
+    if isinstance(view, str):
+        return view
+    if not isinstance(view, type):
+        view = type(view)
+    return '%s.%s' % (view.__module__, view.__qualname__)
+
+
+def _version_key(namespace):
+    return '%s:version:%s' % (CACHE_KEY_PREFIX, namespace)
+
+
+def invalidate_response_cache(view, cache_alias=None):
+    """
+    Invalidate every cached response in a namespace.
+
+    Args:
+        view: A view class, view instance or namespace string.
+        cache_alias: The cache alias holding the entries; defaults to the
+                     `RESPONSE_CACHE_ALIAS` setting.
+
+    Usage:
+        @receiver(post_save, sender=Product)
+        def product_changed(sender, **kwargs):
+            invalidate_response_cache(ProductViewSet)
+    """
+    cache = caches[cache_alias or response_settings.RESPONSE_CACHE_ALIAS]
+    key = _version_key(get_namespace(view))
+    if not cache.add(key, 2, None):
+        try:
+            cache.incr(key)
+        except ValueError:
+            # The version was evicted between `add` and `incr`.
+            cache.set(key, 2, None)
+
+
+class ResponseCache:
+    """
+    Cache the rendered output of a view handler.
+
+    Only successful (200) responses to GET and HEAD requests are stored.
+    Cached responses are served without calling the handler, but after
+    authentication, permission checks and throttling have run.
+
+    Args:
+        timeout: Seconds to keep an entry; defaults to the `RESPONSE_CACHE_TIMEOUT` setting.
+        key_components: Names from `KEY_COMPONENTS` the cache key is built from; defaults
+                        to the `RESPONSE_CACHE_KEY_COMPONENTS` setting.
+        namespace: The namespace entries are stored under; defaults to the view class.
+        cache_alias: The Django cache to use; defaults to the `RESPONSE_CACHE_ALIAS` setting.
+    """
+
+    def __init__(self, timeout=None, key_components=None, namespace=None, cache_alias=None):
+        self.timeout = timeout
+        self.key_components = key_components
+        self.namespace = namespace
+        self.cache_alias = cache_alias
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias or response_settings.RESPONSE_CACHE_ALIAS]
+
+    def get_timeout(self):
+        if self.timeout is None:
+            return response_settings.RESPONSE_CACHE_TIMEOUT
+        return self.timeout
+
+    def get_cache_key(self, request, view):
+        """
+        Build the cache key for `request`, including the namespace version.
+        """
+        namespace = get_namespace(self.namespace or view)
+        version = self.cache.get(_version_key(namespace), 1)
+        components = self.key_components or response_settings.RESPONSE_CACHE_KEY_COMPONENTS
+        bits = tuple(KEY_COMPONENTS[name](request) for name in components)
+        digest = hashlib.sha1(repr(bits).encode()).hexdigest()
+        return '%s:%s:%s:%s' % (CACHE_KEY_PREFIX, namespace, version, digest)
+
+    def serve(self, view, request, handler, *args, **kwargs):
+        """
+        Return the cached response for `request`, calling `handler` on a miss.
+
+        Args:
+            view: The view instance handling the request.
+            request: The incoming request.
+            handler: The view handler, called as `handler(request, *args, **kwargs)`.
+
+        Returns:
+            HttpResponse: The (possibly cached) response, or `304 Not Modified`.
+        """
+        if request.method not in CACHEABLE_METHODS:
+            return handler(request, *args, **kwargs)
+
+        key = self.get_cache_key(request, view)
+        entry = self.cache.get(key)
+
+        if entry is None:
+            response = view.finalize_response(request, handler(request, *args, **kwargs), *args, **kwargs)
+            if response.status_code != 200 or response.streaming:
+                return response
+            if hasattr(response, 'render'):
+                response.render()
+
+            response['ETag'] = make_etag(response.content)
+            entry = {
+                'content': response.content,
+                'status': response.status_code,
+                'headers': [
+                    (name, value) for name, value in response.items() if is_cached_header(name)
+                ],
+            }
+            self.cache.set(key, entry, self.get_timeout())
+        else:
+            response = HttpResponse(entry['content'], status=entry['status'])
+            for name, value in entry['headers']:
+                response[name] = value
+
+        if response_settings.RESPONSE_CACHE_COMPRESSION:
+            self.apply_compressed_variant(request, response, key)
+
+        return get_conditional_response(request, etag=response['ETag'], response=response)
+
+    def apply_compressed_variant(self, request, response, key):
+        """
+        Compress `response` for `request`, reusing a cached compressed variant when possible.
+
+        Variants are stored next to the entry under `key` plus the encoding,
+        together with the ETag they were compressed from, so a variant is only
+        served for the exact content it was made from.
+        """
+        if not compression.is_compressible(response):
+            return
+        patch_vary_headers(response, ('Accept-Encoding',))
+        encoding = compression.negotiate_encoding(request)
+        if encoding is None or len(response.content) < response_settings.COMPRESSION_MIN_SIZE:
+            return
+
+        variant_key = '%s:%s' % (key, encoding)
+        variant = self.cache.get(variant_key)
+        if variant is None or variant['etag'] != response['ETag']:
+            variant = {'etag': response['ETag'], 'content': compression.compress(response.content, encoding)}
+            self.cache.set(variant_key, variant, self.get_timeout())
+
+        if len(variant['content']) < len(response.content):
+            compression.apply_encoding(response, variant['content'], encoding)
+
+
+def cache_response(timeout=None, key_components=None, namespace=None, cache_alias=None):
+    """
+    Decorator that caches the rendered response of a view method.
+
+    Accepts the same arguments as `ResponseCache`.
+
+    Usage:
+        class CatalogView(APIView):
+            @cache_response(timeout=60)
+            def get(self, request, *args, **kwargs):
+                return StandardResponse.success(data=build_catalog())
+    """
+    response_cache = ResponseCache(timeout, key_components, namespace, cache_alias)
+
+    def decorator(view_method):
+        @wraps(view_method)
+        def inner(self, request, *args, **kwargs):
+            return response_cache.serve(self, request, partial(view_method, self), *args, **kwargs)
+        return inner
+
+    return decorator
+
+
+class CachedResponseMixin:
+    """
+    Cache the `list` and `retrieve` actions of generic views and viewsets.
+
+    Successful unsafe requests (POST, PUT, PATCH, DELETE) handled by the same
+    view invalidate its namespace automatically. With `prefetch_next_page`
+    enabled on the pagination class, the page after each listed page is
+    rendered into the cache in the background (see
+    `drf_standardized_responses.prefetch`); these prefetch requests are not
+    throttled. Call
+    `invalidate_response_cache(ViewClass)` to invalidate it from elsewhere,
+    e.g. from model signals.
+
+    Usage:
+        class ProductViewSet(CachedResponseMixin, viewsets.ModelViewSet):
+            cache_timeout = 300
+            cache_key_components = ('path', 'query', 'accept')
+    """
+    # Seconds to keep an entry; `None` defers to the RESPONSE_CACHE_TIMEOUT setting
+    cache_timeout = None
+    # Request attributes the cache key is built from
+    cache_key_components = None
+    # Namespace shared with other views; defaults to this view class
+    cache_namespace = None
+    # Django cache alias; `None` defers to the RESPONSE_CACHE_ALIAS setting
+    cache_alias = None
+
+    def get_response_cache(self):
+        return ResponseCache(
+            timeout=self.cache_timeout,
+            key_components=self.cache_key_components,
+            namespace=self.cache_namespace,
+            cache_alias=self.cache_alias,
+        )
+
+    def list(self, request, *args, **kwargs):
+        response_cache = self.get_response_cache()
+        response = response_cache.serve(self, request, super().list, *args, **kwargs)
+        if response.status_code in (200, 304):
+            prefetch.schedule_next_page(self, request, response_cache)
+        return response
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.get_response_cache().serve(self, request, super().retrieve, *args, **kwargs)
+
+    def check_throttles(self, request):
+        # Prefetches are not made by the client, so they must not use up its quota.
+        if not prefetch.is_prefetch_request(request):
+            super().check_throttles(request)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if request.method in INVALIDATING_METHODS and 200 <= response.status_code < 400:
+            invalidate_response_cache(self.cache_namespace or self, self.cache_alias)
+        return response
@@ -0,0 +1,281 @@
+"""
+Content negotiation and compression for rendered responses.
+
+`CompressionMiddleware` compresses responses with the best encoding the
+client accepts, chosen from the `COMPRESSION_ENCODINGS` setting:
+
+- ``'br'``: Brotli, requires the `brotli` package.
+- ``'zstd'``: Zstandard, requires the `zstandard` package.
+- ``'gzip'``: always available.
+
+Encodings whose library is not installed are skipped. Responses smaller than
+`COMPRESSION_MIN_SIZE` bytes, responses that are already encoded and content
+types other than JSON are sent unchanged.
+
+Only JSON API responses are compressed. HTML pages often reflect request
+input next to secrets such as CSRF tokens, which makes compressing them open
+to the BREACH attack; Django's `GZipMiddleware` pads them with random bytes to
+mitigate it, and should keep handling them.
+
+With `RESPONSE_CACHE_COMPRESSION` enabled, the response cache (see
+`drf_standardized_responses.cache`) also stores the compressed variants of
+every cached envelope, so popular responses are compressed once rather than
+on every request.
+"""
+import gzip
+import re
+import zlib
+
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+
+from drf_standardized_responses.settings import response_settings
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Content types compressed, matched against the start of the Content-Type header;
+# HTML is left to GZipMiddleware and its BREACH mitigation
+COMPRESSIBLE_CONTENT_TYPES = (
+    'application/json',
+    'application/x-ndjson',
+)
+
+_QUALITY_RE = re.compile(r'^\s*q\s*=\s*(.*?)\s*$', re.I)
+
+
+class GzipCodec:
+    """Compress with gzip from the standard library."""
+    name = 'gzip'
+    default_level = 6
+
+    def compress(self, content, level):
+        # A fixed mtime keeps the output (and thus cached variants) deterministic.
+        return gzip.compress(content, compresslevel=level, mtime=0)
+
+    def compressor(self, level):
+        compressobj = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        return (lambda chunk: compressobj.compress(chunk) + compressobj.flush(zlib.Z_SYNC_FLUSH)), compressobj.flush
+
+
+class BrotliCodec:
+    """Compress with Brotli."""
+    name = 'br'
+    default_level = 5
+
+    def compress(self, content, level):
+        return brotli.compress(content, quality=level)
+
+    def compressor(self, level):
+        compressor = brotli.Compressor(quality=level)
+        return (lambda chunk: compressor.process(chunk) + compressor.flush()), compressor.finish
+
+
+class ZstdCodec:
+    """Compress with Zstandard."""
+    name = 'zstd'
+    default_level = 3
+
+    def compress(self, content, level):
+        return zstandard.ZstdCompressor(level=level).compress(content)
+
+    def compressor(self, level):
+        compressobj = zstandard.ZstdCompressor(level=level).compressobj()
+        return (
+            lambda chunk: compressobj.compress(chunk) + compressobj.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+        ), compressobj.flush
+
+
+CODECS = {
+    'gzip': GzipCodec(),
+    'br': BrotliCodec() if brotli is not None else None,
+    'zstd': ZstdCodec() if zstandard is not None else None,
+}
+
+
+def get_codec(encoding):
+    """
+    Return the codec for `encoding`, or `None` if its library is not installed.
+
+    Raises:
+        ImproperlyConfigured: If `encoding` is not a supported encoding.
+    """
+    try:
+        return CODECS[encoding]
+    except KeyError:
+        raise ImproperlyConfigured(
+            'Unsupported compression encoding %r; expected one of %s.' % (encoding, ', '.join(CODECS))
+        )
+
+
+def get_level(encoding):
+    """Return the configured compression level for `encoding`."""
+    return response_settings.COMPRESSION_LEVELS.get(encoding, CODECS[encoding].default_level)
+
+
+def parse_accept_encoding(header):
+    """
+    Parse an `Accept-Encoding` header.
+
+    Returns:
+        dict: Lower-cased codings mapped to their quality values.
+    """
+    accepted = {}
+    for item in header.split(','):
+        coding, _, params = item.partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        match = _QUALITY_RE.match(params) if params else None
+        try:
+            accepted[coding] = float(match.group(1)) if match else 1.0
+        except ValueError:
+            accepted[coding] = 0.0
+    return accepted
+
+
+def negotiate_encoding(request):
+    """
+    Choose the content coding for `request`.
+
+    The client's quality values take precedence; ties are broken by the order
+    of the `COMPRESSION_ENCODINGS` setting.
+
+    Returns:
+        str: The chosen encoding, or `None` if the response should not be compressed.
+    """
+    header = request.META.get('HTTP_ACCEPT_ENCODING', '')
+    if not header:
+        return None
+
+    accepted = parse_accept_encoding(header)
+    wildcard = accepted.get('*', 0.0)
+    best, best_quality = None, 0.0
+    for encoding in response_settings.COMPRESSION_ENCODINGS:
+        if get_codec(encoding) is None:
+            continue
+        quality = accepted.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def is_compressible(response):
+    """
+    Return whether `response` is a candidate for compression, ignoring its size.
+    """
+    if response.has_header('Content-Encoding') or response.status_code in (204, 206, 304):
+        return False
+    content_type = response.get('Content-Type', '').lower()
+    return content_type.startswith(COMPRESSIBLE_CONTENT_TYPES) or '+json' in content_type
+
+
+def compress(content, encoding):
+    """
+    Compress `content` with `encoding` at the configured level.
+    """
+    return get_codec(encoding).compress(content, get_level(encoding))
+
+
+def apply_encoding(response, content, encoding):
+    """
+    Replace the body of `response` with its `encoding`-compressed `content` and update the headers.
+
+    A strong ETag is made weak, because the compressed body is a different
+    representation; weak comparison still matches it in `If-None-Match`.
+    """
+    response.content = content
+    response['Content-Length'] = str(len(content))
+    response['Content-Encoding'] = encoding
+    _weaken_etag(response)
+    return response
+
+
+def _weaken_etag(response):
+    etag = response.get('ETag')
+    if etag and etag.startswith('"'):
+        response['ETag'] = 'W/' + etag
+
+
+def _compress_sequence(iterator, feed, finish):
+    for chunk in iterator:
+        data = feed(chunk)
+        if data:
+            yield data
+    yield finish()
+
+
+async def _acompress_sequence(iterator, feed, finish):
+    async for chunk in iterator:
+        data = feed(chunk)
+        if data:
+            yield data
+    yield finish()
+
+
+def compress_response(request, response):
+    """
+    Compress `response` for `request` if the client accepts a supported encoding.
+
+    Streaming responses are compressed chunk by chunk and flushed after every
+    chunk, so clients still receive data incrementally.
+
+    Returns:
+        HttpResponse: `response`, compressed in place when applicable.
+    """
+    if not is_compressible(response):
+        return response
+
+    patch_vary_headers(response, ('Accept-Encoding',))
+    encoding = negotiate_encoding(request)
+    if encoding is None:
+        return response
+
+    if response.streaming:
+        feed, finish = get_codec(encoding).compressor(get_level(encoding))
+        if getattr(response, 'is_async', False):
+            response.streaming_content = _acompress_sequence(response.streaming_content, feed, finish)
+        else:
+            response.streaming_content = _compress_sequence(response.streaming_content, feed, finish)
+        del response['Content-Length']
+        response['Content-Encoding'] = encoding
+        _weaken_etag(response)
+        return response
+
+    if len(response.content) < response_settings.COMPRESSION_MIN_SIZE:
+        return response
+
+    content = compress(response.content, encoding)
+    if len(content) >= len(response.content):
+        return response
+    return apply_encoding(response, content, encoding)
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """
+    Compress JSON responses with Brotli, Zstandard or gzip based on `Accept-Encoding`.
+
+    Place it near the top of `MIDDLEWARE`, so it runs after any middleware that
+    reads or modifies the response body. Sites that also serve HTML keep
+    Django's `GZipMiddleware` just above it: responses already compressed here
+    are skipped by `GZipMiddleware`, which compresses the HTML pages with its
+    BREACH mitigation.
+
+    Usage:
+        MIDDLEWARE = [
+            'django.middleware.gzip.GZipMiddleware',  # HTML pages, if any
+            'drf_standardized_responses.compression.CompressionMiddleware',
+            ...
+        ]
+    """
+
+    def process_response(self, request, response):
+        return compress_response(request, response)
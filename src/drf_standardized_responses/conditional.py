@@ -0,0 +1,51 @@
+"""
+Conditional request support for paginated list endpoints.
+
+This module answers `If-None-Match` requests for list endpoints with
+`304 Not Modified` before any serializer runs. The ETag is computed from the
+current page's pagination metadata, primary keys and modification times,
+which are already in memory once the page has been fetched.
+
+No `Last-Modified` header is sent: the newest modification time on a page
+does not change when a row is deleted or moves off the page, so
+`If-Modified-Since` would answer such pages with a false `304`.
+"""
+from django.utils.cache import get_conditional_response
+from rest_framework.response import Response
+
+
+class ConditionalListMixin:
+    """
+    List view mixin that sends weak ETags for paginated pages.
+
+    The pagination class must provide `get_page_etag()`, as
+    `StandardPagination` and `StandardCursorPagination` do. The modification
+    times it includes are read from the pagination class's
+    `last_modified_field` (`updated_at` by default); pages whose items do not
+    have that field are sent without an ETag, since in-place edits could not
+    be detected.
+
+    Usage:
+        class ArticleViewSet(ConditionalListMixin, viewsets.ReadOnlyModelViewSet):
+            queryset = Article.objects.order_by('-id')
+            serializer_class = ArticleSerializer
+
+    Unpaginated requests are handled exactly as by `ListModelMixin.list`.
+    """
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        if page is None:
+            serializer = self.get_serializer(queryset, many=True)
+            return Response(serializer.data)
+
+        etag = self.paginator.get_page_etag(page)
+        response = get_conditional_response(request, etag=etag) if etag else None
+        if response is None:
+            serializer = self.get_serializer(page, many=True)
+            response = self.get_paginated_response(serializer.data)
+
+        if etag:
+            response['ETag'] = etag
+        return response
@@ -0,0 +1,170 @@
+"""
+JSON encoding backends for StandardResponseRenderer.
+
+Every backend is a callable with the signature
+
+    dumps(data, encoder_class, ensure_ascii, allow_nan, indent, separators) -> bytes
+
+and produces exactly the bytes DRF's `JSONRenderer` would produce for the
+same arguments. The active backend is chosen with the `JSON_BACKEND` setting:
+
+- ``'json'``: the standard library encoder (default).
+- ``'orjson'``: orjson, with a transparent fallback to the standard library
+  for anything orjson would encode differently.
+- ``'auto'``: orjson when it is installed, the standard library otherwise.
+"""
+import json
+import math
+import re
+from decimal import Decimal
+from enum import Enum
+from functools import lru_cache
+
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework.compat import SHORT_SEPARATORS
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    # Types orjson would serialize natively but differently from DRF's
+    # JSONEncoder are passed through to the encoder's `default()` method.
+    ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+else:
+    ORJSON_OPTIONS = 0
+
+# orjson writes `1e-7` where the standard library writes `1e-07`, and older
+# orjson releases write `1e16` where the standard library writes `1e+16`.
+_NON_STDLIB_EXPONENT = re.compile(rb'[0-9]e(?:-[0-9](?![0-9])|[0-9])')
+# orjson writes floats in [1e-5, 1e-4) positionally (`0.00005`) where the
+# standard library writes `5e-05`. The standard library never writes four
+# zeros after a leading `0.`, so any match (even inside a string) falls back.
+_POSITIONAL_SMALL_FLOAT = b'0.0000'
+
+
+class _NonFinite(Exception):
+    """Raised from orjson's `default` hook for values encoding to a non-finite float."""
+
+
+def _is_non_finite(value):
+    return (isinstance(value, float) and not math.isfinite(value)) or (
+        isinstance(value, Decimal) and not value.is_finite()
+    )
+
+
+# Leaf types orjson and the standard library encode identically
+_PLAIN_TYPES = frozenset((str, int, bool, type(None)))
+
+
+def _needs_stdlib(data):
+    """
+    Return whether `data` contains values orjson encodes differently from the standard library.
+
+    These are enums, which orjson encodes natively while the standard library
+    passes them to the encoder's `default()` (DRF's raises `TypeError`), and
+    non-finite numbers, which orjson writes as `null`.
+    """
+    if not isinstance(data, (dict, list, tuple)):
+        return isinstance(data, Enum) or _is_non_finite(data)
+    stack = [data]
+    while stack:
+        container = stack.pop()
+        if isinstance(container, dict):
+            for key in container:
+                if type(key) is not str and isinstance(key, Enum):
+                    return True
+            container = container.values()
+        for value in container:
+            if type(value) in _PLAIN_TYPES:
+                continue
+            if isinstance(value, (dict, list, tuple)):
+                stack.append(value)
+            elif isinstance(value, Enum) or _is_non_finite(value):
+                return True
+    return False
+
+
+def stdlib_dumps(data, encoder_class, ensure_ascii=False, allow_nan=False, indent=None, separators=SHORT_SEPARATORS):
+    """
+    Encode `data` with the standard library `json` module.
+    """
+    ret = json.dumps(
+        data, cls=encoder_class,
+        indent=indent, ensure_ascii=ensure_ascii,
+        allow_nan=allow_nan, separators=separators
+    )
+
+    # We always fully escape \u2028 and \u2029 to ensure we output JSON
+    # that is a strict javascript subset.
+    ret = ret.replace('\u2028', '\\u2028').replace('\u2029', '\\u2029')
+    return ret.encode()
+
+
+@lru_cache(maxsize=None)
+def _default_for(encoder_class):
+    encoder_default = encoder_class().default
+
+    def default(obj):
+        value = encoder_default(obj)
+        if _is_non_finite(value):
+            raise _NonFinite
+        return value
+
+    return default
+
+
+def orjson_dumps(data, encoder_class, ensure_ascii=False, allow_nan=False, indent=None, separators=SHORT_SEPARATORS):
+    """
+    Encode `data` with orjson, falling back to `stdlib_dumps` when needed.
+
+    orjson only produces compact, non-ASCII-escaped output, so pretty-printed
+    or ASCII-only rendering always uses the standard library. Enums, integers
+    wider than 64 bits, floats orjson formats differently (short or unsigned
+    exponents and positional values below 1e-4) and non-finite floats also
+    fall back, so the output bytes, and the errors raised for enums and (when
+    `allow_nan` is false) for NaN and infinity, always match the standard
+    library encoder. Finding enums and non-finite floats takes one pass over
+    the containers in `data`.
+    """
+    if ensure_ascii or indent is not None or separators != SHORT_SEPARATORS or _needs_stdlib(data):
+        return stdlib_dumps(data, encoder_class, ensure_ascii, allow_nan, indent, separators)
+
+    try:
+        ret = orjson.dumps(data, default=_default_for(encoder_class), option=ORJSON_OPTIONS)
+    except orjson.JSONEncodeError:
+        return stdlib_dumps(data, encoder_class, ensure_ascii, allow_nan, indent, separators)
+
+    if _POSITIONAL_SMALL_FLOAT in ret or _NON_STDLIB_EXPONENT.search(ret):
+        return stdlib_dumps(data, encoder_class, ensure_ascii, allow_nan, indent, separators)
+
+    if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+        ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+    return ret
+
+
+@lru_cache(maxsize=None)
+def get_json_backend(name):
+    """
+    Return the `dumps` callable for the backend called `name`.
+
+    Raises:
+        ImproperlyConfigured: If the backend is unknown or not installed.
+    """
+    if name == 'auto':
+        return orjson_dumps if orjson is not None else stdlib_dumps
+    if name == 'json':
+        return stdlib_dumps
+    if name == 'orjson':
+        if orjson is None:
+            raise ImproperlyConfigured("The 'orjson' JSON backend requires the orjson package to be installed.")
+        return orjson_dumps
+    raise ImproperlyConfigured(
+        "Unknown JSON_BACKEND %r; expected one of 'json', 'orjson' or 'auto'." % (name,)
+    )
@@ -0,0 +1,310 @@
+"""
+Bounded logging of unhandled exceptions.
+
+When a dependency fails, every request may end in the same 500 and log the
+same traceback. With `EXCEPTION_LOG_RATE` set, `standardized_exception_handler`
+logs each distinct failure (keyed by exception type and the frame that raised
+it) at most that many times per `EXCEPTION_LOG_PERIOD` seconds, optionally
+sampled with `EXCEPTION_LOG_SAMPLE_RATE`. Suppressed occurrences are reported
+periodically as a single warning per key, at most every
+`EXCEPTION_LOG_SUMMARY_INTERVAL` seconds and even when no further exception
+occurs:
+
+    Suppressed 4211 occurrences of ConnectionError at client.py:88 in fetch in the last 60s
+
+`install_exception_log_queue()` moves the formatting and output of these
+records to a background thread, so a request never waits for a slow handler.
+"""
+import atexit
+import logging
+import random
+import threading
+from collections import OrderedDict
+from logging.handlers import QueueHandler, QueueListener
+from queue import Full, Queue
+from time import monotonic
+
+from django.core.signals import setting_changed
+
+from drf_standardized_responses.settings import SETTINGS_NAME, response_settings
+
+
+def exception_key(exc):
+    """
+    Return the deduplication key for `exc`: its type and the frame that raised it.
+
+    Returns:
+        tuple: `(type name, filename, line number, function name)`.
+    """
+    tb = exc.__traceback__
+    if tb is None:
+        return (type(exc).__qualname__, None, None, None)
+    while tb.tb_next is not None:
+        tb = tb.tb_next
+    code = tb.tb_frame.f_code
+    return (type(exc).__qualname__, code.co_filename, tb.tb_lineno, code.co_name)
+
+
+def describe_key(key):
+    """Format an `exception_key` for summaries."""
+    name, filename, lineno, function = key
+    if filename is None:
+        return name
+    return '%s at %s:%d in %s' % (name, filename.rsplit('/', 1)[-1], lineno, function)
+
+
+class ExceptionLogLimiter:
+    """
+    Decide which exception occurrences are logged, counting the rest.
+
+    Each key may be logged `rate` times per `period` seconds; occurrences are
+    first sampled with probability `sample_rate`. At most `max_keys` keys are
+    tracked, evicting the least recently seen.
+
+    Args:
+        rate: Occurrences logged per key and period, or `None` for no limit.
+        period: Length of a rate-limiting window in seconds.
+        sample_rate: Probability of considering an occurrence for logging.
+        summary_interval: Minimum seconds between suppression summaries.
+        max_keys: Maximum number of keys tracked at once.
+        rate_overrides: Exception type names mapped to their own `rate`.
+    """
+
+    def __init__(
+        self, rate=None, period=60, sample_rate=1.0, summary_interval=60, max_keys=1000, rate_overrides=None
+    ):
+        self.rate = rate
+        self.period = period
+        self.sample_rate = sample_rate
+        self.summary_interval = summary_interval
+        self.max_keys = max_keys
+        self.rate_overrides = rate_overrides or {}
+        # key -> [window start, logged in window, suppressed since last summary]
+        self.windows = OrderedDict()
+        self.last_summary = monotonic()
+        self.lock = threading.Lock()
+        # Pending `threading.Timer` reporting the suppressed counts
+        self.timer = None
+
+    def get_rate(self, key):
+        return self.rate_overrides.get(key[0], self.rate)
+
+    def should_log(self, key):
+        """
+        Record an occurrence of `key` and return whether it should be logged.
+        """
+        rate = self.get_rate(key)
+        if rate is None and self.sample_rate >= 1:
+            return True
+
+        now = monotonic()
+        with self.lock:
+            window = self.windows.get(key)
+            if window is None:
+                window = self.windows[key] = [now, 0, 0]
+                if len(self.windows) > self.max_keys:
+                    self.windows.popitem(last=False)
+            else:
+                self.windows.move_to_end(key)
+                if now - window[0] >= self.period:
+                    window[0], window[1] = now, 0
+
+            if (self.sample_rate < 1 and random.random() >= self.sample_rate) or (
+                rate is not None and window[1] >= rate
+            ):
+                window[2] += 1
+                return False
+            window[1] += 1
+            return True
+
+    def pop_summaries(self, force=False):
+        """
+        Return and reset the suppressed counts once `summary_interval` has elapsed.
+
+        Args:
+            force: Return the counts even if the interval has not elapsed yet.
+
+        Returns:
+            list: `(key, suppressed count, seconds covered)` tuples; empty until
+                  the interval has elapsed.
+        """
+        now = monotonic()
+        if not force and now - self.last_summary < self.summary_interval:
+            return []
+        with self.lock:
+            elapsed, self.last_summary = now - self.last_summary, now
+            summaries = []
+            for key, window in self.windows.items():
+                if window[2]:
+                    summaries.append((key, window[2], elapsed))
+                    window[2] = 0
+            return summaries
+
+    def schedule_summaries(self, callback):
+        """
+        Call `callback` with the suppressed counts once `summary_interval` has elapsed.
+
+        The call happens on a timer thread, so counts are reported even when no
+        further exception occurs. Nothing is scheduled while a call is pending.
+        """
+        with self.lock:
+            if self.timer is not None:
+                return
+            delay = max(self.last_summary + self.summary_interval - monotonic(), 0)
+            self.timer = threading.Timer(delay, self._report_summaries, (callback,))
+            self.timer.daemon = True
+            self.timer.start()
+
+    def cancel_summaries(self):
+        """Cancel the call scheduled by `schedule_summaries`, if any."""
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+
+    def _report_summaries(self, callback):
+        with self.lock:
+            self.timer = None
+        summaries = self.pop_summaries(force=True)
+        if summaries:
+            callback(summaries)
+
+
+_limiter = None
+_limiter_lock = threading.Lock()
+
+
+def get_limiter():
+    """
+    Return the process-wide limiter configured from the settings.
+    """
+    global _limiter
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                _limiter = ExceptionLogLimiter(
+                    rate=response_settings.EXCEPTION_LOG_RATE,
+                    period=response_settings.EXCEPTION_LOG_PERIOD,
+                    sample_rate=response_settings.EXCEPTION_LOG_SAMPLE_RATE,
+                    summary_interval=response_settings.EXCEPTION_LOG_SUMMARY_INTERVAL,
+                    max_keys=response_settings.EXCEPTION_LOG_MAX_KEYS,
+                    rate_overrides=response_settings.EXCEPTION_LOG_RATE_OVERRIDES,
+                )
+    return _limiter
+
+
+def reset_limiter(*args, **kwargs):
+    """Discard the process-wide limiter, e.g. after the settings changed."""
+    global _limiter
+    if kwargs.get('setting', SETTINGS_NAME) == SETTINGS_NAME:
+        if _limiter is not None:
+            _limiter.cancel_summaries()
+        _limiter = None
+
+
+setting_changed.connect(reset_limiter)
+
+
+def log_exception(logger, exc, message="Internal server error occurred"):
+    """
+    Log `exc` with its traceback, subject to the process-wide limiter.
+
+    Pending suppression summaries are logged as warnings first. When `exc` is
+    suppressed, its summary is scheduled for the end of the summary interval.
+    """
+    limiter = get_limiter()
+    log_summaries(logger, limiter.pop_summaries())
+    if limiter.should_log(exception_key(exc)):
+        logger.error(message, exc_info=exc)
+    else:
+        limiter.schedule_summaries(lambda summaries: log_summaries(logger, summaries))
+
+
+def log_summaries(logger, summaries):
+    """Log `ExceptionLogLimiter.pop_summaries()` results as warnings."""
+    for key, count, elapsed in summaries:
+        logger.warning(
+            "Suppressed %d occurrences of %s in the last %ds", count, describe_key(key), elapsed
+        )
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    Queue handler that never blocks and leaves all formatting to the listener thread.
+
+    Records are dropped (and counted in `dropped`) when the queue is full.
+    """
+
+    def __init__(self, queue):
+        super().__init__(queue)
+        self.dropped = 0
+
+    def prepare(self, record):
+        # Unlike QueueHandler, do not format the message and traceback here;
+        # that happens in the listener thread.
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except Full:
+            self.dropped += 1
+
+
+class _ExceptionLogListener(QueueListener):
+    """Queue listener logging the pending suppression summaries before it stops."""
+
+    def __init__(self, queue, handler, logger):
+        super().__init__(queue, handler)
+        self.logger = logger
+
+    def stop(self):
+        # Also called at exit, possibly after an explicit stop().
+        if self._thread is None:
+            return
+        if _limiter is not None:
+            log_summaries(self.logger, _limiter.pop_summaries(force=True))
+        super().stop()
+
+
+class _DispatchHandler(logging.Handler):
+    """Hand records from the queue to the original handlers of a logger and its ancestors."""
+
+    def __init__(self, handlers, parent):
+        super().__init__()
+        self.handlers = handlers
+        self.parent = parent
+
+    def emit(self, record):
+        for handler in self.handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        if self.parent is not None:
+            self.parent.handle(record)
+
+
+def install_exception_log_queue(logger_name='drf_standardized_responses.exceptions', maxsize=10000):
+    """
+    Route the records of `logger_name` through a bounded queue to a background thread.
+
+    The logger's own handlers and its ancestors' handlers (via propagation)
+    still receive every record, but formatting and I/O happen on the listener
+    thread. Call it once at startup, e.g. in `AppConfig.ready()`. The
+    listener is stopped at exit, after logging pending suppression summaries.
+
+    Returns:
+        QueueListener: The started listener; call `stop()` to flush and stop it earlier.
+    """
+    logger = logging.getLogger(logger_name)
+    queue = Queue(maxsize)
+    dispatcher = _DispatchHandler(list(logger.handlers), logger.parent if logger.propagate else None)
+    listener = _ExceptionLogListener(queue, dispatcher, logger)
+
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    logger.addHandler(NonBlockingQueueHandler(queue))
+    logger.propagate = False
+
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
@@ -1,11 +1,17 @@
 import logging
-from typing import Dict, Any
+from typing import Any, Dict, List, Optional, Tuple
 
 from django.http import Http404
-from rest_framework.views import exception_handler
+from rest_framework.exceptions import APIException
+from rest_framework.views import exception_handler, set_rollback
 from rest_framework.response import Response
 
+from drf_standardized_responses.allocations import tracked
+from drf_standardized_responses.exception_logging import log_exception
+from drf_standardized_responses.instrumentation import timed
+from drf_standardized_responses.messages import get_message, get_status_message
 from drf_standardized_responses.responses import StandardResponse
+from drf_standardized_responses.settings import response_settings
 
 # Configure a logger for the module
 logger = logging.getLogger(__name__)
@@ -35,8 +41,107 @@ def standardized_exception_handler(exc: Exception, context: Dict[str, Any]) -> R
             # other settings...
         }
     """
-    # Initialize errors variable to None by default
+    request = context.get('request')
+    with tracked(request, 'exception_handler'), timed(request, 'exception_handler'):
+        if isinstance(exc, APIException) and not isinstance(exc.detail, (list, dict)):
+            return _fast_error_response(exc)
+        return _standardize_exception(exc, context)
+
+
+def get_error_headers(exc: Exception) -> Dict[str, str]:
+    """
+    Return the `WWW-Authenticate` and `Retry-After` headers DRF sends for `exc`.
+    """
+    headers = {}
+    auth_header = getattr(exc, 'auth_header', None)
+    if auth_header:
+        headers['WWW-Authenticate'] = auth_header
+    wait = getattr(exc, 'wait', None)
+    if wait:
+        headers['Retry-After'] = '%d' % wait
+    return headers
+
+
+def escape_pointer_token(token: Any) -> str:
+    """
+    Escape a key or index for use in a JSON pointer (RFC 6901).
+    """
+    return str(token).replace('~', '~0').replace('/', '~1')
+
+
+def flatten_errors(detail: Any, limit: Optional[int] = None) -> Tuple[List[Dict[str, Any]], bool]:
+    """
+    Flatten nested validation errors into a list of `{pointer, code, message}` entries.
+
+    The errors are collected by a single iterative depth-first walk in their
+    original order, which stops as soon as `limit` entries have been found. Empty
+    branches, such as the `{}` DRF reports for every valid item of a bulk
+    request, produce no entries.
+
+    Args:
+        detail: The `detail` of a `ValidationError`: error messages nested in
+                dictionaries and lists.
+        limit: The maximum number of entries to return, or `None` for all.
+
+    Returns:
+        tuple: The list of entries and whether it was truncated at `limit`.
+
+    Usage:
+        >>> flatten_errors({'items': [{}, {'price': [ErrorDetail('Required.', code='required')]}]})
+        ([{'pointer': '/items/1/price', 'code': 'required', 'message': 'Required.'}], False)
+    """
+    errors = []
+    stack = [('', detail)]
+    while stack:
+        pointer, value = stack.pop()
+        if isinstance(value, dict):
+            stack.extend(
+                (pointer + '/' + escape_pointer_token(key), value[key]) for key in reversed(list(value))
+            )
+        elif isinstance(value, (list, tuple)):
+            if all(not isinstance(item, (dict, list, tuple)) for item in value):
+                # A list of messages for a single field
+                children = [(pointer, item) for item in value]
+            else:
+                children = [(pointer + '/' + str(index), item) for index, item in enumerate(value)]
+            stack.extend(reversed(children))
+        else:
+            if limit is not None and len(errors) >= limit:
+                return errors, True
+            errors.append({
+                'pointer': pointer,
+                'code': getattr(value, 'code', None),
+                'message': str(value),
+            })
+    return errors, False
+
+
+def _fast_error_response(exc: APIException) -> Response:
+    """
+    Build the error response for an API exception with a plain message.
+
+    Covers the high-volume cases (NotAuthenticated, PermissionDenied, NotFound,
+    Throttled, ...) without going through DRF's `exception_handler`, so only a
+    single Response is created. The output is identical to the general path,
+    and the renderer serves these envelopes from its cache of encoded bodies.
+    """
+    set_rollback()
+    response = StandardResponse.error(
+        message=str(exc.detail) or get_status_message(exc.status_code),
+        status_code=exc.status_code,
+    )
+    for name, value in get_error_headers(exc).items():
+        response[name] = value
+    return response
+
+
+def _standardize_exception(exc: Exception, context: Dict[str, Any]) -> Response:
+    """
+    Build the standardized error response for `exc`; see `standardized_exception_handler`.
+    """
+    # Initialize errors and meta variables to None by default
     errors = None
+    meta = None
 
     # Call Django REST Framework's default exception handler to get the initial response
     response = exception_handler(exc, context)
@@ -51,24 +156,36 @@ def standardized_exception_handler(exc: Exception, context: Dict[str, Any]) -> R
         # Check if the detail is a list or dictionary (e.g., validation errors)
         elif isinstance(detail, (list, dict)):
             # Use a specific message for validation errors, otherwise a generic one
-            message = "Validation failed" if response.status_code == 400 else "Request failed"
+            if response.status_code == 400:
+                message = get_message('validation_failed')
+            else:
+                message = get_status_message(response.status_code)
             errors = detail  # Include the detailed errors
+            if response_settings.ERROR_FORMAT == 'flat':
+                errors, truncated = flatten_errors(detail, response_settings.ERROR_LIMIT)
+                if truncated:
+                    meta = {'errors': {'count': len(errors), 'truncated': True}}
         else:
             # Handle other types of errors with a generic message
-            message = str(detail) if detail else "Request failed"
+            message = str(detail) if detail else get_status_message(response.status_code)
 
         # Return a standardized error response with the extracted details
-        return StandardResponse.error(
+        standardized = StandardResponse.error(
             message=message,
             status_code=response.status_code,
-            errors=errors
+            errors=errors,
+            meta=meta,
         )
+        # Keep the headers DRF sets, e.g. WWW-Authenticate and Retry-After
+        for name, value in get_error_headers(exc).items():
+            standardized[name] = value
+        return standardized
 
-    # Log the unhandled exception for debugging
-    logger.error("Internal server error occurred", exc_info=exc)
+    # Log the unhandled exception for debugging, subject to the EXCEPTION_LOG_* limits
+    log_exception(logger, exc)
 
     # If no response is generated by the default handler, return a generic 500 error
     return StandardResponse.error(
-        message="Internal server error",
+        message=get_message('server_error'),
         status_code=500
     )
\ No newline at end of file
@@ -0,0 +1,246 @@
+"""
+Sparse fieldsets for standardized responses.
+
+Clients may ask for a subset of the payload and metadata with query parameters:
+
+    GET /products/?fields=id,name,category.name&meta=pagination.count
+
+Field lists are comma-separated and may use dots to reach into nested objects.
+A field names its whole subtree unless more specific paths are given. An empty
+parameter (``?meta=``) selects nothing.
+
+With the `SPARSE_FIELDSETS` setting enabled, `StandardResponseRenderer` drops
+unrequested fields from `data` and `meta` before encoding, and
+`StandardPagination` skips building unrequested links. `SparseFieldsetMixin`
+removes the fields from serializers so they are never serialized at all, and
+`SparseQuerysetMixin` defers the matching columns with `.only()`.
+"""
+from django.core.exceptions import FieldDoesNotExist
+
+from drf_standardized_responses.responses import Envelope
+from drf_standardized_responses.settings import response_settings
+
+_FIELDSETS_ATTR = '_standardized_fieldsets'
+
+
+def parse_fields(value):
+    """
+    Parse a comma-separated list of dotted field paths into a tree.
+
+    Usage:
+        >>> parse_fields('id,author.name,author.id')
+        {'id': {}, 'author': {'name': {}, 'id': {}}}
+
+    Returns:
+        dict: Field names mapped to the subtree of requested nested fields; an
+              empty subtree selects the whole value.
+    """
+    tree = {}
+    for path in value.split(','):
+        parts = [part for part in path.strip().split('.') if part]
+        if not parts:
+            continue
+        node = tree
+        for index, part in enumerate(parts):
+            if part in node and not node[part]:
+                # A shorter path already selected the whole subtree.
+                break
+            is_last = index == len(parts) - 1
+            node = node.setdefault(part, {})
+            if is_last:
+                node.clear()
+    return tree
+
+
+def get_fieldsets(request):
+    """
+    Return the parsed `fields` and `meta` query parameters of `request`.
+
+    Parsing happens once per request. Either tree is `None` when its
+    parameter was not given.
+
+    Returns:
+        tuple: The `(fields, meta)` trees.
+    """
+    request = getattr(request, '_request', request)
+    try:
+        return getattr(request, _FIELDSETS_ATTR)
+    except AttributeError:
+        pass
+
+    fieldsets = tuple(
+        parse_fields(request.GET[param]) if param and param in request.GET else None
+        for param in (response_settings.FIELDS_QUERY_PARAM, response_settings.META_QUERY_PARAM)
+    )
+    setattr(request, _FIELDSETS_ATTR, fieldsets)
+    return fieldsets
+
+
+def get_requested_fields(request):
+    """Return the tree of requested payload fields, or `None` for all fields."""
+    return None if request is None else get_fieldsets(request)[0]
+
+
+def get_requested_meta(request):
+    """Return the tree of requested metadata, or `None` for all metadata."""
+    return None if request is None else get_fieldsets(request)[1]
+
+
+def is_requested(tree, path):
+    """
+    Return whether the dotted `path` is selected by `tree`.
+
+    Usage:
+        is_requested(get_requested_meta(request), 'pagination.next')
+    """
+    if tree is None:
+        return True
+    for part in path.split('.'):
+        if part not in tree:
+            return False
+        tree = tree[part]
+        if not tree:
+            return True
+    return True
+
+
+def project(value, tree):
+    """
+    Return `value` restricted to the fields selected by `tree`.
+
+    Dictionaries keep only the selected keys, lists are projected item by item
+    and other values are returned unchanged. Batch items (`Envelope` instances)
+    have their `data` projected instead.
+    """
+    if not tree:
+        return value
+    if isinstance(value, Envelope):
+        return Envelope(value, data=project(value.get('data'), tree))
+    if isinstance(value, dict):
+        return {key: project(value[key], subtree) for key, subtree in tree.items() if key in value}
+    if isinstance(value, (list, tuple)):
+        return [project(item, tree) for item in value]
+    return value
+
+
+def project_envelope(envelope, request):
+    """
+    Apply the requested `fields` and `meta` of `request` to a success `envelope`.
+
+    Returns:
+        Envelope: A projected copy, or `envelope` itself when nothing was requested.
+    """
+    fields, meta = get_fieldsets(request)
+    if fields is None and meta is None:
+        return envelope
+
+    envelope = Envelope(envelope)
+    if fields:
+        envelope['data'] = project(envelope['data'], fields)
+    if meta is not None and 'meta' in envelope:
+        envelope['meta'] = project(envelope['meta'], meta) if meta else {}
+        if not envelope['meta']:
+            del envelope['meta']
+    return envelope
+
+
+class SparseFieldsetMixin:
+    """
+    Serializer mixin removing every field not listed in the `fields` query parameter.
+
+    Unrequested fields are dropped when the serializer is created, so their
+    values are never fetched or serialized. Dotted paths prune nested serializers
+    too. The field list may also be passed explicitly with the `fields` argument.
+    This mixin does not depend on the `SPARSE_FIELDSETS` setting.
+
+    Usage:
+        class ProductSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+            ...
+
+        ProductSerializer(product, fields='id,name')
+    """
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop('fields', None)
+        super().__init__(*args, **kwargs)
+
+        if fields is not None:
+            tree = parse_fields(fields if isinstance(fields, str) else ','.join(fields))
+        else:
+            request = kwargs.get('context', {}).get('request')
+            tree = get_fieldsets(request)[0] if request is not None else None
+        if tree:
+            prune_fields(self, tree)
+
+    def get_only_fields(self):
+        """
+        Return the model fields needed by the remaining serializer fields.
+
+        Returns:
+            list: Names suitable for `QuerySet.only()`, or `None` when a field's
+                  source is not a concrete model field (e.g. a property or method),
+                  since deferring columns could then cause extra queries.
+        """
+        model = getattr(getattr(self, 'Meta', None), 'model', None)
+        if model is None:
+            return None
+
+        names = [model._meta.pk.name]
+        for field in self.fields.values():
+            if field.source == '*':
+                return None
+            try:
+                model_field = model._meta.get_field(field.source.split('.')[0])
+            except FieldDoesNotExist:
+                return None
+            if model_field.many_to_many or model_field.one_to_many:
+                # Fetched by a separate query regardless of the deferred columns.
+                continue
+            if not model_field.concrete:
+                return None
+            if model_field.name not in names:
+                names.append(model_field.name)
+        return names
+
+
+def prune_fields(serializer, tree):
+    """
+    Remove the fields of `serializer` (and its nested serializers) not selected by `tree`.
+    """
+    fields = serializer.fields
+    for name in list(fields):
+        if name not in tree:
+            fields.pop(name)
+            continue
+        subtree = tree[name]
+        if not subtree:
+            continue
+        nested = getattr(fields[name], 'child', fields[name])
+        if hasattr(nested, 'fields'):
+            prune_fields(nested, subtree)
+
+
+class SparseQuerysetMixin:
+    """
+    View mixin deferring the columns not needed for the requested fields.
+
+    Works with serializers using `SparseFieldsetMixin`: the queryset is limited
+    with `.only()` to the model fields backing the remaining serializer fields.
+    Querysets using `select_related()` are left unchanged.
+
+    Usage:
+        class ProductViewSet(SparseQuerysetMixin, viewsets.ReadOnlyModelViewSet):
+            serializer_class = ProductSerializer  # uses SparseFieldsetMixin
+    """
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if not get_requested_fields(self.request) or queryset.query.select_related:
+            return queryset
+
+        serializer = self.get_serializer()
+        if not isinstance(serializer, SparseFieldsetMixin):
+            return queryset
+
+        names = serializer.get_only_fields()
+        return queryset if names is None else queryset.only(*names)
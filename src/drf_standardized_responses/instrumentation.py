@@ -0,0 +1,145 @@
+"""
+Per-stage timing instrumentation for the standardized response pipeline.
+
+When the `TIMING` setting is enabled, wall time is recorded for each stage a
+request passes through:
+
+- ``exception_handler``: `standardized_exception_handler`
+- ``paginate``: `paginate_queryset` (including ``count``)
+- ``count``: computing the total count in `StandardPagination`
+- ``links``: building the next/previous links
+- ``serialize``: accessing `.data` on serializers using `TimedSerializerMixin`
+- ``render``: `StandardResponseRenderer.render`
+
+Timings are sent in a `Server-Timing` response header, optionally added to
+`meta.timing`, and broadcast with the `timings_recorded` signal so they can be
+forwarded to a metrics backend:
+
+    @receiver(timings_recorded)
+    def forward_timings(sender, request, response, timings, **kwargs):
+        for stage, seconds in timings.items():
+            statsd.timing('api.%s' % stage, seconds * 1000)
+
+Stages may be nested, so durations are not meant to be summed.
+"""
+from contextlib import nullcontext
+from functools import lru_cache
+from time import perf_counter
+
+from django.dispatch import Signal
+
+from drf_standardized_responses.settings import response_settings
+
+# Sent by StandardResponseRenderer with `request`, `response` and `timings`
+# (a dict mapping stage names to durations in seconds).
+timings_recorded = Signal()
+
+_TIMINGS_ATTR = '_standardized_timings'
+_DISABLED = nullcontext()
+
+
+class StageTimer:
+    """
+    Context manager adding the time spent in its block to a stage's total.
+    """
+    __slots__ = ('timings', 'stage', 'start')
+
+    def __init__(self, timings, stage):
+        self.timings = timings
+        self.stage = stage
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.timings[self.stage] = self.timings.get(self.stage, 0.0) + perf_counter() - self.start
+
+
+def get_timings(request):
+    """
+    Return the timings recorded so far for `request` (a Django or DRF request).
+
+    Returns:
+        dict: Stage names mapped to durations in seconds.
+    """
+    request = getattr(request, '_request', request)
+    try:
+        return getattr(request, _TIMINGS_ATTR)
+    except AttributeError:
+        timings = {}
+        setattr(request, _TIMINGS_ATTR, timings)
+        return timings
+
+
+def timed(request, stage):
+    """
+    Time a block of code as `stage` of `request`.
+
+    Returns a no-op context manager when timing is disabled or there is no request.
+
+    Usage:
+        with timed(request, 'serialize'):
+            data = serializer.data
+    """
+    if request is None or not response_settings.TIMING:
+        return _DISABLED
+    return StageTimer(get_timings(request), stage)
+
+
+def format_server_timing(timings):
+    """
+    Format `timings` as a `Server-Timing` header value with millisecond durations.
+    """
+    return ', '.join('%s;dur=%.3f' % (stage, seconds * 1000) for stage, seconds in timings.items())
+
+
+def timings_in_ms(timings):
+    """
+    Return `timings` converted to milliseconds, as reported in `meta.timing`.
+    """
+    return {stage: round(seconds * 1000, 3) for stage, seconds in timings.items()}
+
+
+def publish_timings(request, response):
+    """
+    Attach the `Server-Timing` header to `response` and send `timings_recorded`.
+    """
+    if request is None or not response_settings.TIMING:
+        return
+    timings = get_timings(request)
+    if not timings:
+        return
+    if response is not None:
+        response['Server-Timing'] = format_server_timing(timings)
+    timings_recorded.send(sender=None, request=request, response=response, timings=dict(timings))
+
+
+@lru_cache(maxsize=None)
+def _timed_list_serializer_class(list_serializer_class):
+    return type(list_serializer_class.__name__, (TimedSerializerMixin, list_serializer_class), {})
+
+
+class TimedSerializerMixin:
+    """
+    Serializer mixin recording the time spent producing `.data` as the ``serialize`` stage.
+
+    Works for both single objects and `many=True`. The request is taken from
+    the serializer context, as provided by generic views.
+
+    Usage:
+        class ProductSerializer(TimedSerializerMixin, serializers.ModelSerializer):
+            ...
+    """
+
+    @classmethod
+    def many_init(cls, *args, **kwargs):
+        serializer = super().many_init(*args, **kwargs)
+        if not isinstance(serializer, TimedSerializerMixin):
+            serializer.__class__ = _timed_list_serializer_class(type(serializer))
+        return serializer
+
+    @property
+    def data(self):
+        with timed(self.context.get('request'), 'serialize'):
+            return super().data
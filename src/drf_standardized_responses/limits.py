@@ -0,0 +1,101 @@
+"""
+Response size guardrails for list endpoints.
+
+`StandardPagination` bounds paginated lists with `max_page_size`, but an
+unpaginated list view returns its whole queryset. Two limits guard against
+oversized bodies:
+
+- `StandardResponseRenderer` truncates list payloads with more than
+  `RESPONSE_MAX_ITEMS` items or `RESPONSE_MAX_BYTES` encoded bytes, detecting
+  the overflow while encoding the items.
+- `ResponseLimitMixin` applies `RESPONSE_MAX_ITEMS` while serializing, so
+  objects past the limit are never fetched or serialized, and either truncates
+  the list or streams it (`RESPONSE_LIMIT_ACTION = 'stream'`; MessagePack and
+  CBOR responses, which cannot be streamed, are truncated).
+
+Truncated responses carry `meta.truncated` and a `meta.continuation` link,
+which repeats the request with an `offset` query parameter (see the
+`OFFSET_QUERY_PARAM` setting) skipping the items already received:
+
+    {"success": true, "message": "...", "data": [...],
+     "meta": {"truncated": true, "continuation": "https://api.example.com/events/?offset=1000"}}
+"""
+from itertools import chain, islice
+
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from drf_standardized_responses.responses import StandardResponse
+from drf_standardized_responses.settings import SettingDefault
+from drf_standardized_responses.streaming import StandardStreamingResponse, can_stream, iter_serialized
+
+
+class ResponseLimitMixin:
+    """
+    List view mixin bounding the number of items in a response.
+
+    The `offset` query parameter skips the first items of the list (or of the
+    current page, for paginated views), which is what the `continuation` link
+    of a truncated response uses. Views with this mixin provide the
+    continuation link for lists truncated by the renderer as well.
+
+    Usage:
+        class EventViewSet(ResponseLimitMixin, viewsets.ReadOnlyModelViewSet):
+            pagination_class = None
+            max_response_items = 1000
+            response_limit_action = 'truncate'  # or 'stream'
+    """
+    # Maximum number of items in an unpaginated response, from the RESPONSE_MAX_ITEMS setting
+    max_response_items = SettingDefault('RESPONSE_MAX_ITEMS')
+    # 'truncate' or 'stream' responses with more items, from the RESPONSE_LIMIT_ACTION setting
+    response_limit_action = SettingDefault('RESPONSE_LIMIT_ACTION')
+    # Query parameter skipping the first items, from the OFFSET_QUERY_PARAM setting
+    offset_query_param = SettingDefault('OFFSET_QUERY_PARAM')
+    # Rows fetched per database round trip when serializing lazily
+    stream_chunk_size = 2000
+
+    def get_response_offset(self):
+        """Return the number of items to skip, from the `offset` query parameter."""
+        try:
+            return max(int(self.request.query_params.get(self.offset_query_param, 0)), 0)
+        except (TypeError, ValueError):
+            return 0
+
+    def get_continuation_link(self, returned):
+        """
+        Return the link to the items following the first `returned` items of this response.
+        """
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.offset_query_param, self.get_response_offset() + returned)
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        offset = self.get_response_offset()
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page[offset:], many=True)
+            return self.get_paginated_response(serializer.data)
+
+        if offset:
+            queryset = queryset[offset:]
+        limit = self.max_response_items
+        if limit is None:
+            serializer = self.get_serializer(queryset, many=True)
+            return Response(serializer.data)
+
+        items = iter_serialized(self.get_serializer(), queryset, self.stream_chunk_size)
+        head = list(islice(items, limit + 1))
+        if len(head) <= limit:
+            return Response(head)
+
+        renderer = getattr(request, 'accepted_renderer', None)
+        # Binary formats cannot be streamed and are truncated instead
+        if self.response_limit_action == 'stream' and can_stream(renderer):
+            return StandardStreamingResponse(chain(head, items), renderer=renderer)
+
+        items.close()
+        del head[limit:]
+        return StandardResponse.success(
+            data=head, meta={'truncated': True, 'continuation': self.get_continuation_link(limit)}
+        )
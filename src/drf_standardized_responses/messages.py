@@ -0,0 +1,74 @@
+"""
+Catalog of the default envelope messages.
+
+The default messages (`SUCCESS_MESSAGE`, `VALIDATION_ERROR_MESSAGE`, ...) are
+translatable, so each of them would cost a gettext lookup on every response.
+The catalog resolves a message once per message id and active language and
+keeps the result in an LRU cache:
+
+    get_message('success')              # "Operation successful", or its translation
+    get_status_message(404)             # STATUS_MESSAGES[404] or REQUEST_FAILED_MESSAGE
+
+Because every locale resolves to its own string, the renderer's cache of
+pre-encoded envelope heads (keyed by message) holds the encoded bytes of each
+message per locale, and the message is spliced into responses without being
+encoded again. The caches are cleared when the settings or languages change.
+"""
+from functools import lru_cache
+
+from django.core.signals import setting_changed
+from django.utils import translation
+
+from drf_standardized_responses.settings import SETTINGS_NAME, response_settings
+
+# Message ids mapped to the settings holding their text
+MESSAGE_SETTINGS = {
+    'success': 'SUCCESS_MESSAGE',
+    'error': 'ERROR_MESSAGE',
+    'validation_failed': 'VALIDATION_ERROR_MESSAGE',
+    'request_failed': 'REQUEST_FAILED_MESSAGE',
+    'server_error': 'SERVER_ERROR_MESSAGE',
+    'batch_completed': 'BATCH_COMPLETED_MESSAGE',
+    'batch_failed': 'BATCH_FAILED_MESSAGE',
+}
+
+
+@lru_cache(maxsize=512)
+def _resolve(message_id, language):
+    """
+    Translate a message id (or status code) into `language`.
+    """
+    if isinstance(message_id, int):
+        message = response_settings.status_messages.get(message_id, response_settings.REQUEST_FAILED_MESSAGE)
+    else:
+        message = getattr(response_settings, MESSAGE_SETTINGS[message_id])
+    with translation.override(language):
+        return str(message)
+
+
+def get_message(message_id, language=None):
+    """
+    Return the message `message_id` in `language`, defaulting to the active language.
+
+    Raises:
+        KeyError: If `message_id` is not in `MESSAGE_SETTINGS`.
+    """
+    return _resolve(message_id, language or translation.get_language())
+
+
+def get_status_message(status_code, language=None):
+    """
+    Return the default message for error responses with `status_code`.
+
+    Codes not in the `STATUS_MESSAGES` setting use `REQUEST_FAILED_MESSAGE`.
+    """
+    return _resolve(status_code, language or translation.get_language())
+
+
+def clear_message_cache(*args, **kwargs):
+    """Discard the resolved messages, e.g. after the settings or languages changed."""
+    if kwargs.get('setting', SETTINGS_NAME) in (SETTINGS_NAME, 'LANGUAGE_CODE', 'LANGUAGES', 'LOCALE_PATHS'):
+        _resolve.cache_clear()
+
+
+setting_changed.connect(clear_message_cache)
@@ -4,12 +4,275 @@ Pagination classes for standardizing DRF API responses with pagination.
 This module provides pagination classes that work with StandardResponse
 to deliver consistently formatted paginated responses.
 """
-from rest_framework.pagination import PageNumberPagination
+import hashlib
+import json
+from urllib import parse
 
+from asgiref.sync import sync_to_async
+from django.core.cache import caches
+from django.core.exceptions import EmptyResultSet
+from django.core.paginator import InvalidPage, Paginator
+from django.db import connections
+from django.db.models import QuerySet
+from django.utils.encoding import force_str
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+from drf_standardized_responses.allocations import tracked
+from drf_standardized_responses.fieldsets import get_requested_meta, is_requested
+from drf_standardized_responses.instrumentation import timed
 from drf_standardized_responses.responses import StandardResponse
+from drf_standardized_responses.settings import SettingDefault, response_settings
+from drf_standardized_responses.streaming import StandardStreamingResponse, can_stream, check_async_support
+
+
+class StandardPaginator(Paginator):
+    """
+    Django paginator with a configurable strategy for computing the total count.
+
+    Strategies:
+    - ``'exact'``: run a full count on every request (Django's default).
+    - ``'cached'``: store the exact count in Django's cache framework, keyed by
+      the queryset's SQL, for `cache_timeout` seconds.
+    - ``'estimated'``: use the database planner's row estimate when it is at
+      least `estimate_threshold`, and an exact count below it. Estimates are
+      only available on PostgreSQL; other databases always count exactly.
+
+    `count_is_exact` reports whether `count` was counted exactly for this
+    request; it is false for planner estimates and for counts served from the
+    cache, which may be up to `cache_timeout` seconds old.
+    """
+
+    def __init__(
+        self,
+        object_list,
+        per_page,
+        count_strategy='exact',
+        cache_timeout=300,
+        cache_alias='default',
+        estimate_threshold=100000,
+        **kwargs
+    ):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count_strategy = count_strategy
+        self.cache_timeout = cache_timeout
+        self.cache_alias = cache_alias
+        self.estimate_threshold = estimate_threshold
+        self.count_is_exact = True
+
+    @cached_property
+    def count(self):
+        """Return the total number of objects, across all pages."""
+        if isinstance(self.object_list, QuerySet):
+            if self.count_strategy == 'cached':
+                return self.get_cached_count()
+            if self.count_strategy == 'estimated':
+                estimate = self.estimate_count()
+                if estimate is not None and estimate >= self.estimate_threshold:
+                    self.count_is_exact = False
+                    return estimate
+        return self.get_exact_count()
+
+    def get_exact_count(self):
+        """Count the objects exactly, as Django's `Paginator` does."""
+        return Paginator.count.func(self)
+
+    async def acount(self):
+        """
+        Asynchronously compute and cache `count`, honouring the count strategy.
+
+        Exact and cached counts use `QuerySet.acount()` and the cache's async
+        API. Planner estimates have no async API and run in a worker thread.
+        """
+        if 'count' in self.__dict__:
+            return self.count
+        if not isinstance(self.object_list, QuerySet):
+            return self.count
+
+        if self.count_strategy == 'estimated':
+            return await sync_to_async(lambda: self.count)()
+
+        key = self.get_count_cache_key() if self.count_strategy == 'cached' else None
+        if key is None:
+            count = await self.object_list.acount()
+        else:
+            cache = caches[self.cache_alias]
+            count = await cache.aget(key)
+            if count is None:
+                count = await self.object_list.acount()
+                await cache.aset(key, count, self.cache_timeout)
+            else:
+                self.count_is_exact = False
+
+        self.__dict__['count'] = count
+        return count
+
+    def get_count_cache_key(self):
+        """
+        Derive a cache key from the queryset's database alias and SQL.
+
+        Returns:
+            str: The cache key, or `None` if the query can never return rows.
+        """
+        try:
+            sql, params = self.object_list.query.sql_with_params()
+        except EmptyResultSet:
+            return None
+        digest = hashlib.sha1(repr((self.object_list.db, sql, params)).encode()).hexdigest()
+        return 'drf_standardized_responses:count:%s' % digest
+
+    def get_cached_count(self):
+        """Return the exact count, served from the cache when available."""
+        key = self.get_count_cache_key()
+        if key is None:
+            return self.get_exact_count()
+
+        cache = caches[self.cache_alias]
+        count = cache.get(key)
+        if count is None:
+            count = self.get_exact_count()
+            cache.set(key, count, self.cache_timeout)
+        else:
+            # The cached count may be stale
+            self.count_is_exact = False
+        return count
+
+    def estimate_count(self):
+        """
+        Estimate the number of rows from the query planner.
+
+        Returns:
+            int: The planner's row estimate, or `None` if the database does not provide one.
+        """
+        if connections[self.object_list.db].vendor != 'postgresql':
+            return None
+        try:
+            plan = json.loads(self.object_list.explain(format='json'))
+        except EmptyResultSet:
+            return 0
+        return int(plan[0]['Plan']['Plan Rows'])
+
+
+class StandardEnvelopeMixin:
+    """
+    Shared response building for the standard pagination classes.
+
+    Subclasses implement `get_pagination_meta()` to describe the current page.
+    """
+    # Item attribute holding its modification time, used for page ETags
+    last_modified_field = 'updated_at'
+
+    def get_paginated_response(self, data):
+        """
+        Generate a paginated response using the standardized API response format.
+
+        Args:
+            data: The paginated data to include in the response.
+
+        Returns:
+            Response: A DRF Response object with pagination metadata and data.
+        """
+        with tracked(getattr(self, 'request', None), 'paginated_response'):
+            return StandardResponse.success(
+                data=data,  # The paginated data
+                meta={'pagination': self.get_pagination_meta()}
+            )
+
+    def get_streaming_paginated_response(self, data, renderer=None):
+        """
+        Generate a streamed paginated response using the standardized API response format.
+
+        The items are encoded one at a time as they are produced, and the
+        pagination metadata is sent after the last item.
+
+        Args:
+            data: An iterable of serialized items for the current page.
+            renderer: The `StandardResponseRenderer` used to encode the items.
+                      Binary formats cannot be streamed, so for them the page
+                      is rendered as a regular paginated response.
+
+        Returns:
+            StandardStreamingResponse: A streaming response with pagination metadata as the trailer.
+        """
+        if not can_stream(renderer):
+            return self.get_paginated_response(list(data))
+        return StandardStreamingResponse(
+            data,
+            meta=lambda: {'pagination': self.get_pagination_meta()},
+            renderer=renderer
+        )
+
+    def get_pagination_meta(self):
+        """
+        Build the pagination metadata for the current page.
+
+        Returns:
+            dict: The contents of `meta.pagination`.
+        """
+        raise NotImplementedError('get_pagination_meta() must be implemented.')
+
+    def get_page_last_modified(self, page):
+        """
+        Return the most recent modification time of the items in `page`.
+
+        Args:
+            page: The list of items returned by `paginate_queryset`.
+
+        Returns:
+            datetime: The greatest `last_modified_field` value, or `None` if unavailable.
+        """
+        if not self.last_modified_field:
+            return None
+        values = [
+            item.get(self.last_modified_field) if isinstance(item, dict)
+            else getattr(item, self.last_modified_field, None)
+            for item in page
+        ]
+        values = [value for value in values if value is not None]
+        return max(values) if values else None
+
+    def has_modification_times(self, page):
+        """
+        Return whether every item in `page` has a `last_modified_field`.
+
+        Without one, an item edited in place would keep the page's ETag.
+        """
+        field = self.last_modified_field
+        if not field:
+            return False
+        return all(field in item if isinstance(item, dict) else hasattr(item, field) for item in page)
+
+    def get_page_etag(self, page):
+        """
+        Compute a weak ETag for `page` from the items' keys and modification times.
+
+        The pagination metadata is part of the tag, so the ETag also changes
+        when items are added to or removed from other pages. No serializer runs
+        and no additional query is issued.
+
+        Args:
+            page: The list of items returned by `paginate_queryset`.
+
+        Returns:
+            str: A weak entity tag, or `None` if the items have no
+                 `last_modified_field` to detect changes with.
+        """
+        if not self.has_modification_times(page):
+            return None
+        last_modified = self.get_page_last_modified(page)
+        keys = [
+            item.get('pk', item.get('id')) if isinstance(item, dict)
+            else getattr(item, 'pk', item)
+            for item in page
+        ]
+        digest = hashlib.blake2b(
+            repr((self.get_pagination_meta(), keys, last_modified)).encode(), digest_size=16
+        ).hexdigest()
+        return 'W/"%s"' % digest
 
 
-class StandardPagination(PageNumberPagination):
+class StandardPagination(StandardEnvelopeMixin, PageNumberPagination):
     """
     Standard pagination class that integrates with StandardResponse format.
 
@@ -26,35 +289,291 @@ class StandardPagination(PageNumberPagination):
         class MyViewSet(viewsets.ModelViewSet):
             pagination_class = StandardPagination
     """
-    # Default number of items per page
-    page_size = 10
+    # Default number of items per page, from the PAGE_SIZE setting
+    page_size = SettingDefault('PAGE_SIZE')
     # Query parameter to allow clients to set the page size
     page_size_query_param = 'page_size'
-    # Maximum allowed page size
-    max_page_size = 100
+    # Maximum allowed page size, from the MAX_PAGE_SIZE setting
+    max_page_size = SettingDefault('MAX_PAGE_SIZE')
     # Query parameter for the page number
     page_query_param = 'page'
+    # Django paginator used to split the queryset into pages
+    django_paginator_class = StandardPaginator
+    # How the total count is computed: 'exact', 'cached' or 'estimated'
+    count_strategy = 'exact'
+    # Seconds a count is kept in the cache with the 'cached' strategy
+    count_cache_timeout = 300
+    # Cache alias used by the 'cached' strategy
+    count_cache_alias = 'default'
+    # Minimum planner estimate trusted by the 'estimated' strategy
+    count_estimate_threshold = 100000
+    # Form of the next/previous links: 'absolute', 'relative' or 'template'
+    link_mode = 'absolute'
+    # Render the next page into the response cache in the background (CachedResponseMixin views only)
+    prefetch_next_page = False
 
-    def get_paginated_response(self, data):
+    def paginate_queryset(self, queryset, request, view=None):
         """
-        Generate a paginated response using the standardized API response format.
+        Paginate a queryset if required, either returning a
+        page object, or `None` if pagination is not configured for this view.
+        """
+        page_size = self._start_pagination(request)
+        if not page_size:
+            return None
 
-        Args:
-            data: The paginated data to include in the response.
+        with timed(request, 'paginate'):
+            paginator = self.get_django_paginator(queryset, page_size)
+            with timed(request, 'count'):
+                # Evaluate the (cached) count up front so it is timed on its own
+                paginator.count
+
+            self.page = self._get_page(paginator, request)
+            return list(self.page)
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """
+        Asynchronously paginate a queryset, for async views running under ASGI.
+
+        The count is computed with `acount()` and the page rows are fetched by
+        async iteration, so no thread-pool hop is needed. Afterwards the count
+        and page are cached, and `get_paginated_response` does no further I/O.
 
         Returns:
-            Response: A DRF Response object with pagination metadata and data.
+            list: The items of the requested page, or `None` if pagination is disabled.
+
+        Raises:
+            ImproperlyConfigured: On Django versions older than 4.2.
+        """
+        check_async_support('apaginate_queryset()')
+        page_size = self._start_pagination(request)
+        if not page_size:
+            return None
+
+        with timed(request, 'paginate'):
+            paginator = self.get_django_paginator(queryset, page_size)
+            with timed(request, 'count'):
+                if hasattr(paginator, 'acount'):
+                    await paginator.acount()
+                else:
+                    await sync_to_async(lambda: paginator.count)()
+
+            self.page = self._get_page(paginator, request)
+            if isinstance(self.page.object_list, QuerySet):
+                self.page.object_list = [item async for item in self.page.object_list]
+            return list(self.page)
+
+    def _start_pagination(self, request):
+        """Reset the per-request state and return the page size, or `None` if pagination is disabled."""
+        self.request = request
+        self._link_template = None
+        self.current_page_size = self.get_page_size(request)
+        return self.current_page_size
+
+    def _get_page(self, paginator, request):
+        """
+        Return the requested page of `paginator`, whose count has already been computed.
+
+        Raises:
+            NotFound: If the page number is invalid or out of range.
+        """
+        page_number = self.get_page_number(request, paginator)
+        try:
+            page = paginator.page(page_number)
+        except InvalidPage as exc:
+            msg = self.invalid_page_message.format(
+                page_number=page_number, message=str(exc)
+            )
+            raise NotFound(msg)
+
+        if paginator.num_pages > 1 and self.template is not None:
+            # The browsable API should display pagination controls.
+            self.display_page_controls = True
+        return page
+
+    def get_django_paginator(self, queryset, page_size):
+        """
+        Instantiate the Django paginator for `queryset`.
+
+        `StandardPaginator` subclasses receive the configured count strategy.
+        """
+        if issubclass(self.django_paginator_class, StandardPaginator):
+            return self.django_paginator_class(
+                queryset,
+                page_size,
+                count_strategy=self.count_strategy,
+                cache_timeout=self.count_cache_timeout,
+                cache_alias=self.count_cache_alias,
+                estimate_threshold=self.count_estimate_threshold,
+            )
+        return self.django_paginator_class(queryset, page_size)
+
+    def get_prefetch_page_number(self, request):
+        """
+        Return the number of the page to prefetch after serving `request`.
+
+        Uses the current page when this instance paginated the request, and the
+        page query parameter when the response was served from the cache.
+
+        Returns:
+            int: The next page number, or `None` if there is none.
+        """
+        page = getattr(self, 'page', None)
+        if page is not None:
+            return page.next_page_number() if page.has_next() else None
+        try:
+            page_number = int(request.query_params.get(self.page_query_param, 1))
+        except (TypeError, ValueError):
+            return None
+        return page_number + 1 if page_number > 0 else None
+
+    def get_link_template(self):
         """
-        return StandardResponse.success(
-            data=data,  # The paginated data
-            meta={
-                'pagination': {
-                    'next': self.get_next_link(),  # URL for the next page, if available
-                    'previous': self.get_previous_link(),  # URL for the previous page, if available
-                    'count': self.page.paginator.count,  # Total number of items
-                    'current_page': self.page.number,  # Current page number
-                    'total_pages': self.page.paginator.num_pages,  # Total number of pages
-                    'page_size': self.get_page_size(self.request)  # Number of items per page
-                }
-            }
-        )
\ No newline at end of file
+        Parse the request URL once and return the pieces every page link is built from.
+
+        The result is equivalent to DRF's `replace_query_param()` and
+        `remove_query_param()`, which re-parse and re-encode the URL for every
+        link. Links are absolute in the 'absolute' link mode and relative to
+        the host otherwise.
+
+        Returns:
+            tuple: `(head, tail, first)`, where the link to page `n` is
+                   `head + str(n) + tail` and `first` is the link to the first
+                   page, without the page query parameter.
+        """
+        if getattr(self, '_link_template', None) is not None:
+            return self._link_template
+
+        if self.link_mode == 'absolute':
+            url = self.request.build_absolute_uri()
+        else:
+            url = self.request.get_full_path()
+        scheme, netloc, path, query, fragment = parse.urlsplit(force_str(url))
+        key = force_str(self.page_query_param)
+        query_dict = parse.parse_qs(query, keep_blank_values=True)
+        query_dict.pop(key, None)
+        items = sorted(query_dict.items())
+
+        # The page parameter takes its sorted position among the other parameters.
+        before = parse.urlencode([item for item in items if item[0] < key], doseq=True)
+        after = parse.urlencode([item for item in items if item[0] > key], doseq=True)
+        base = parse.urlunsplit((scheme, netloc, path, '', ''))
+        fragment = '#' + fragment if fragment else ''
+        head = base + '?' + (before + '&' if before else '') + parse.quote_plus(key) + '='
+        tail = ('&' + after if after else '') + fragment
+        first = parse.urlunsplit((scheme, netloc, path, parse.urlencode(items, doseq=True), fragment[1:]))
+
+        self._link_template = (head, tail, first)
+        return self._link_template
+
+    def get_page_link(self, page_number):
+        """Return the link to `page_number`, built from `get_link_template()`."""
+        head, tail, first = self.get_link_template()
+        if page_number == 1:
+            return first
+        return head + str(page_number) + tail
+
+    def get_next_link(self):
+        if not self.page.has_next():
+            return None
+        return self.get_page_link(self.page.next_page_number())
+
+    def get_previous_link(self):
+        if not self.page.has_previous():
+            return None
+        return self.get_page_link(self.page.previous_page_number())
+
+    def get_pagination_meta(self):
+        """
+        Build the pagination metadata for the current page.
+
+        In the 'template' link mode, `next` and `previous` hold page numbers
+        and `link_template` a relative link with a `{page}` placeholder.
+
+        Returns:
+            dict: The contents of `meta.pagination`.
+        """
+        next_link = previous_link = None
+        with timed(self.request, 'links'):
+            requested = get_requested_meta(self.request) if response_settings.SPARSE_FIELDSETS else None
+            if self.link_mode == 'template':
+                if is_requested(requested, 'pagination.next') and self.page.has_next():
+                    next_link = self.page.next_page_number()
+                if is_requested(requested, 'pagination.previous') and self.page.has_previous():
+                    previous_link = self.page.previous_page_number()
+            else:
+                if is_requested(requested, 'pagination.next'):
+                    next_link = self.get_next_link()
+                if is_requested(requested, 'pagination.previous'):
+                    previous_link = self.get_previous_link()
+
+        meta = {
+            'next': next_link,  # URL (or number, in the 'template' link mode) of the next page, if available
+            'previous': previous_link,  # URL (or number) of the previous page, if available
+            'count': self.page.paginator.count,  # Total number of items
+            'count_is_exact': getattr(self.page.paginator, 'count_is_exact', True),  # False for estimates
+            'current_page': self.page.number,  # Current page number
+            'total_pages': self.page.paginator.num_pages,  # Total number of pages
+            # Number of items per page, as computed by paginate_queryset
+            'page_size': getattr(self, 'current_page_size', None) or self.get_page_size(self.request)
+        }
+        if self.link_mode == 'template' and is_requested(requested, 'pagination.link_template'):
+            head, tail, first = self.get_link_template()
+            meta['link_template'] = head + '{page}' + tail  # Link to any page, with a {page} placeholder
+        return meta
+
+
+class StandardCursorPagination(StandardEnvelopeMixin, CursorPagination):
+    """
+    Keyset (cursor) pagination class that integrates with StandardResponse format.
+
+    Pages are located with an opaque cursor instead of an OFFSET, and each page
+    fetches `page_size + 1` rows to find out whether more results exist, so no
+    `SELECT COUNT(*)` is ever issued. Performance stays constant on deep pages,
+    at the cost of `count`, `current_page` and `total_pages` in the metadata,
+    which are replaced by a `has_more` flag.
+
+    The `ordering` must be unique and unchanging, e.g. a primary key or an
+    indexed creation timestamp.
+
+    Usage:
+        class EventViewSet(viewsets.ModelViewSet):
+            pagination_class = StandardCursorPagination
+    """
+    # Default number of items per page, from the PAGE_SIZE setting
+    page_size = SettingDefault('PAGE_SIZE')
+    # Query parameter to allow clients to set the page size
+    page_size_query_param = 'page_size'
+    # Maximum allowed page size, from the MAX_PAGE_SIZE setting
+    max_page_size = SettingDefault('MAX_PAGE_SIZE')
+    # Query parameter for the opaque cursor
+    cursor_query_param = 'cursor'
+    # Field(s) used to order the keyset; must be unique and unchanging
+    ordering = '-pk'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        # DRF only stores the request itself from 3.15 on; the metadata needs it
+        self.request = request
+        with timed(request, 'paginate'):
+            return super().paginate_queryset(queryset, request, view)
+
+    def get_pagination_meta(self):
+        """
+        Build the pagination metadata for the current page.
+
+        Returns:
+            dict: The contents of `meta.pagination`.
+        """
+        next_link = previous_link = None
+        with timed(self.request, 'links'):
+            requested = get_requested_meta(self.request) if response_settings.SPARSE_FIELDSETS else None
+            if is_requested(requested, 'pagination.next'):
+                next_link = self.get_next_link()
+            if is_requested(requested, 'pagination.previous'):
+                previous_link = self.get_previous_link()
+
+        return {
+            'next': next_link,  # URL for the next page, if available
+            'previous': previous_link,  # URL for the previous page, if available
+            'page_size': self.page_size,  # Number of items per page
+            'has_more': self.has_next  # Whether another page follows this one
+        }
@@ -0,0 +1,58 @@
+"""
+Parsers matching the binary envelope renderers.
+
+`MessagePackParser` and `CBORParser` accept request bodies in the formats
+emitted by `StandardMessagePackRenderer` and `StandardCBORRenderer`, so
+service-to-service callers can use a binary format in both directions.
+"""
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:
+    cbor2 = None
+
+
+class MessagePackParser(BaseParser):
+    """
+    Parse MessagePack-encoded request bodies. Requires the `msgpack` package.
+
+    Usage:
+        REST_FRAMEWORK = {
+            'DEFAULT_PARSER_CLASSES': [
+                'rest_framework.parsers.JSONParser',
+                'drf_standardized_responses.parsers.MessagePackParser',
+            ],
+        }
+    """
+    media_type = 'application/msgpack'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if msgpack is None:
+            raise ImproperlyConfigured('MessagePackParser requires the msgpack package.')
+        try:
+            return msgpack.unpackb(stream.read(), raw=False)
+        except Exception as exc:
+            raise ParseError('MessagePack parse error - %s' % exc)
+
+
+class CBORParser(BaseParser):
+    """
+    Parse CBOR-encoded request bodies. Requires the `cbor2` package.
+    """
+    media_type = 'application/cbor'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if cbor2 is None:
+            raise ImproperlyConfigured('CBORParser requires the cbor2 package.')
+        try:
+            return cbor2.loads(stream.read())
+        except Exception as exc:
+            raise ParseError('CBOR parse error - %s' % exc)
@@ -0,0 +1,171 @@
+"""
+Background prefetching of the next page of cached list views.
+
+Infinite-scroll clients almost always request page N+1 right after page N.
+With `prefetch_next_page` enabled on `StandardPagination`, every request for
+a page of a `CachedResponseMixin` list view schedules a background task that
+runs the view for the next page, so its rendered envelope is already in the
+response cache when the client asks for it:
+
+    class FeedPagination(StandardPagination):
+        prefetch_next_page = True
+
+    class FeedViewSet(CachedResponseMixin, viewsets.ReadOnlyModelViewSet):
+        pagination_class = FeedPagination
+
+The prefetch goes through the view like the client's request would
+(authentication, permissions and the cache key), using a copy of the request
+with only the page number changed, rendered in the language active for the
+client's request. It is not throttled, so it does not use up the client's
+quota. Tasks run on a small thread pool (`PREFETCH_MAX_WORKERS` threads)
+unless `PREFETCH_EXECUTOR` names another executor running them in this
+process, e.g. a differently sized thread pool. Task queues that pickle their
+arguments cannot be used: the copied request cannot be pickled.
+"""
+import copy
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import connections
+from django.utils import translation
+from rest_framework.request import Request
+
+from drf_standardized_responses.settings import response_settings
+
+logger = logging.getLogger(__name__)
+
+_PREFETCH_ATTR = '_standardized_prefetch'
+
+# Request headers that would turn the prefetch into a conditional request
+CONDITIONAL_HEADERS = ('HTTP_IF_NONE_MATCH', 'HTTP_IF_MODIFIED_SINCE', 'HTTP_IF_MATCH', 'HTTP_IF_UNMODIFIED_SINCE')
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """
+    Return the executor prefetch tasks are submitted to.
+
+    Returns:
+        The `PREFETCH_EXECUTOR` setting, or a process-wide `ThreadPoolExecutor`
+        with `PREFETCH_MAX_WORKERS` threads.
+    """
+    if response_settings.PREFETCH_EXECUTOR is not None:
+        return response_settings.PREFETCH_EXECUTOR
+
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=response_settings.PREFETCH_MAX_WORKERS,
+                    thread_name_prefix='drf-standardized-prefetch',
+                )
+    return _executor
+
+
+def is_prefetch_request(request):
+    """Return whether `request` (a Django or DRF request) was made by a prefetch task."""
+    return getattr(getattr(request, '_request', request), _PREFETCH_ATTR, False)
+
+
+def make_page_request(request, page_query_param, page_number):
+    """
+    Copy `request` with its page query parameter set to `page_number`.
+
+    Per-request state of this package (timings, fieldsets) and conditional
+    headers are not copied.
+
+    Returns:
+        HttpRequest: The Django request for the other page.
+    """
+    request = getattr(request, '_request', request)
+    page_request = copy.copy(request)
+    for name in [name for name in vars(page_request) if name.startswith('_standardized_')]:
+        delattr(page_request, name)
+
+    page_request.GET = request.GET.copy()
+    page_request.GET[page_query_param] = str(page_number)
+    page_request.META = dict(request.META)
+    page_request.META['QUERY_STRING'] = page_request.GET.urlencode()
+    for header in CONDITIONAL_HEADERS:
+        page_request.META.pop(header, None)
+    setattr(page_request, _PREFETCH_ATTR, True)
+    return page_request
+
+
+def schedule_next_page(view, request, response_cache):
+    """
+    Schedule rendering the page after the current one into `response_cache`.
+
+    Nothing is scheduled unless the view's paginator has `prefetch_next_page`
+    enabled, or when the next page is already cached or being prefetched. A
+    prefetch never schedules another one.
+
+    Args:
+        view: The list view handling `request`.
+        request: The DRF request for the current page.
+        response_cache: The `ResponseCache` the view serves its pages from.
+
+    Returns:
+        Future: The scheduled task, or `None`.
+    """
+    paginator = view.paginator
+    if not getattr(paginator, 'prefetch_next_page', False) or is_prefetch_request(request):
+        return None
+    match = request.resolver_match
+    page_number = paginator.get_prefetch_page_number(request)
+    if match is None or page_number is None:
+        return None
+
+    page_request = make_page_request(request, paginator.page_query_param, page_number)
+    key_request = Request(page_request)
+    key_request.user = request.user
+    key = response_cache.get_cache_key(key_request, view)
+    cache = response_cache.cache
+    lock_key = key + ':prefetch'
+    if cache.has_key(key) or not cache.add(lock_key, True, response_cache.get_timeout()):
+        return None
+
+    # Workers run without middleware, so carry over the language the client's page is rendered in.
+    language = translation.get_language()
+    lock = (cache, lock_key)
+    executor = get_executor()
+    if executor is _executor:
+        return executor.submit(_run_in_worker, match.func, page_request, match.args, match.kwargs, language, lock)
+    return executor.submit(run_prefetch, match.func, page_request, match.args, match.kwargs, language, lock)
+
+
+def run_prefetch(view_func, request, args, kwargs, language=None, lock=None):
+    """
+    Run `view_func` for a prefetch `request`, storing its response in the cache.
+
+    Args:
+        language: The language to render the page in, as active for the
+                  request that scheduled the prefetch.
+        lock: The `(cache, key)` pair marking the page as being prefetched,
+              deleted when the prefetch finishes.
+
+    Returns:
+        HttpResponse: The view's response, or `None` if the view raised.
+    """
+    try:
+        with translation.override(language, deactivate=True):
+            return view_func(request, *args, **kwargs)
+    except Exception:
+        logger.exception("Prefetching %s failed", request.get_full_path())
+        return None
+    finally:
+        if lock is not None:
+            cache, key = lock
+            cache.delete(key)
+
+
+def _run_in_worker(view_func, request, args, kwargs, language=None, lock=None):
+    try:
+        return run_prefetch(view_func, request, args, kwargs, language, lock)
+    finally:
+        # Worker threads open their own database connections; do not leak them.
+        connections.close_all()
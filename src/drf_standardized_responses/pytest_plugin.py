@@ -0,0 +1,30 @@
+"""
+pytest fixtures for allocation budgets of the standardized response pipeline.
+
+Enable the plugin in your root `conftest.py`:
+
+    pytest_plugins = ['drf_standardized_responses.pytest_plugin']
+
+and assert that building an envelope stays within a budget that scales with
+the payload size, so regressions fail in CI instead of showing up as slowly
+climbing worker memory:
+
+    @pytest.mark.parametrize('size', [10, 1000])
+    def test_render_budget(allocation_budget, size):
+        data = [{'id': i} for i in range(size)]
+        renderer = StandardResponseRenderer()
+        renderer.render(data)  # warm up the caches first
+        with allocation_budget(peak=4096 + 300 * size, net=512):
+            renderer.render(data)
+"""
+import pytest
+
+from drf_standardized_responses.allocations import assert_allocation_budget
+
+
+@pytest.fixture
+def allocation_budget():
+    """
+    Return `assert_allocation_budget`, a context manager failing the test if its block exceeds the budget.
+    """
+    return assert_allocation_budget
@@ -4,9 +4,88 @@ Renderers for standardizing DRF API responses.
 This module provides renderers that automatically format API responses
 according to the StandardResponse structure.
 """
+import datetime
+import json
+from functools import lru_cache
+from itertools import islice
+
+from django.core.exceptions import ImproperlyConfigured
 from rest_framework import renderers
+from rest_framework.compat import INDENT_SEPARATORS, LONG_SEPARATORS, SHORT_SEPARATORS
+
+from drf_standardized_responses.allocations import publish_allocations, tracked
+from drf_standardized_responses.encoders import get_json_backend
+from drf_standardized_responses.fieldsets import get_requested_fields, project, project_envelope
+from drf_standardized_responses.instrumentation import get_timings, publish_timings, timed, timings_in_ms
+from drf_standardized_responses.messages import get_message, get_status_message
+from drf_standardized_responses.responses import Envelope, StandardResponse
+from drf_standardized_responses.settings import SettingDefault, response_settings
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:
+    cbor2 = None
+
+
+@lru_cache(maxsize=256, typed=True)
+def _envelope_prefix(success, message, ensure_ascii=False, compact=True):
+    """
+    Build the encoded envelope head that precedes the serialized payload.
+
+    The result looks like ``{"success":true,"message":"...","data":`` and is
+    cached per message, so the wrapper keys are only encoded once.
+    """
+    item_separator, key_separator = SHORT_SEPARATORS if compact else LONG_SEPARATORS
+    prefix = item_separator.join((
+        '{"success"' + key_separator + json.dumps(success),
+        '"message"' + key_separator + json.dumps(message, ensure_ascii=ensure_ascii),
+        '"data"' + key_separator,
+    ))
+    # Mirror JSONRenderer, which always escapes these characters.
+    prefix = prefix.replace('\u2028', '\\u2028').replace('\u2029', '\\u2029')
+    return prefix.encode()
+
+
+@lru_cache(maxsize=256, typed=True)
+def _empty_envelope(success, message, ensure_ascii=False, compact=True):
+    """
+    Build the complete encoded envelope for a response without payload, meta or errors.
+
+    Error responses such as 401, 403, 404 and 429 usually look like this, so
+    their bodies are served straight from this cache.
+    """
+    return _envelope_prefix(success, message, ensure_ascii, compact) + b'{}}'
+
+
+def prepare_envelope_cache(language=None, ensure_ascii=False, compact=True):
+    """
+    Pre-encode the envelope heads for the default messages in `language`.
+
+    Called for the default language when the app is ready, so the first
+    responses do not pay for translating and encoding them.
+    """
+    _envelope_prefix(True, get_message('success', language), ensure_ascii, compact)
+    _empty_envelope(True, get_message('success', language), ensure_ascii, compact)
+    _envelope_prefix(False, get_message('error', language), ensure_ascii, compact)
+    _envelope_prefix(False, get_message('validation_failed', language), ensure_ascii, compact)
+    _empty_envelope(False, get_message('request_failed', language), ensure_ascii, compact)
+    _empty_envelope(False, get_message('server_error', language), ensure_ascii, compact)
+    for status_code in response_settings.status_messages:
+        _empty_envelope(False, get_status_message(status_code, language), ensure_ascii, compact)
 
-from drf_standardized_responses.responses import StandardResponse
+
+@lru_cache(maxsize=64)
+def _member_prefix(key, ensure_ascii=False, compact=True):
+    """
+    Build the encoded separator and key that precede an envelope member, e.g. ``,"meta":``.
+    """
+    item_separator, key_separator = SHORT_SEPARATORS if compact else LONG_SEPARATORS
+    return (item_separator + json.dumps(key, ensure_ascii=ensure_ascii) + key_separator).encode()
 
 
 class StandardResponseRenderer(renderers.JSONRenderer):
@@ -20,7 +99,18 @@ class StandardResponseRenderer(renderers.JSONRenderer):
     Features:
     - Automatically wraps successful responses in the `StandardResponse.success` format
     - Automatically wraps error responses in the `StandardResponse.error` format
-    - Prevents double-wrapping of already formatted responses
+    - Prevents double-wrapping of `Envelope` data built by `StandardResponse`
+    - Splices the serialized payload into a cached envelope prefix instead of
+      re-serializing the wrapper dict (see `splice_envelope`)
+    - Encodes with a pluggable JSON backend (see the `JSON_BACKEND` setting)
+    - Records the ``render`` stage and emits `Server-Timing` headers when the
+      `TIMING` setting is enabled
+    - Records the allocations of the ``render`` stage and emits `X-Alloc-*`
+      headers when the `ALLOCATION_PROFILING` setting is enabled
+    - Drops unrequested `data` and `meta` fields before encoding when the
+      `SPARSE_FIELDSETS` setting is enabled
+    - Truncates list payloads exceeding `max_items` or `max_bytes`, flagging
+      them with `meta.truncated` and a `meta.continuation` link
 
     Usage:
         # In your settings.py
@@ -31,6 +121,15 @@ class StandardResponseRenderer(renderers.JSONRenderer):
             ],
         }
     """
+    # Serialize only the payload and splice it into a pre-encoded envelope.
+    # Falls back to encoding the full envelope dict when pretty-printing.
+    splice_envelope = True
+    # Name of the JSON backend to use; `None` defers to the `JSON_BACKEND` setting.
+    json_backend = None
+    # Maximum number of items in a list payload, from the RESPONSE_MAX_ITEMS setting
+    max_items = SettingDefault('RESPONSE_MAX_ITEMS')
+    # Maximum number of encoded bytes of a list payload, from the RESPONSE_MAX_BYTES setting
+    max_bytes = SettingDefault('RESPONSE_MAX_BYTES')
 
     def render(self, data, accepted_media_type=None, renderer_context=None):
         """
@@ -44,35 +143,400 @@ class StandardResponseRenderer(renderers.JSONRenderer):
         Returns:
             bytes: The rendered response in JSON format.
         """
+        request = renderer_context.get('request', None) if renderer_context else None
+
+        with tracked(request, 'render'), timed(request, 'render'):
+            if request is not None and response_settings.SPARSE_FIELDSETS:
+                data = self.apply_fieldsets(data, request, renderer_context)
+            ret = self.render_envelope(data, accepted_media_type, renderer_context)
+
+        if request is not None:
+            response = renderer_context.get('response', None)
+            publish_timings(request, response)
+            publish_allocations(request, response)
+        return ret
+
+    async def arender(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Async entry point for `render`, for use from async views and middleware.
+
+        Rendering performs no I/O, so it runs directly on the event loop instead
+        of being handed to a worker thread with `sync_to_async`.
+
+        Usage:
+            content = await renderer.arender(data, renderer_context={'response': response})
+        """
+        return self.render(data, accepted_media_type, renderer_context)
+
+    def render_envelope(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render `data` in the standard envelope, using the spliced fast path for success responses.
+        """
+        data = self.add_timing_meta(data, renderer_context)
+        # Extract the response object from the renderer context
+        response = renderer_context.get('response', None) if renderer_context else None
+
+        if (self.max_items is not None or self.max_bytes is not None) and not (
+            response and response.status_code >= 400
+        ):
+            envelope = self.get_envelope(data, renderer_context)
+            if envelope.get('success') and isinstance(envelope.get('data'), list):
+                return self.render_limited_envelope(envelope, accepted_media_type, renderer_context)
+
+        if self.is_envelope(data):
+            return self.render_spliced_envelope(data, accepted_media_type, renderer_context)
+
+        if response and response.status_code >= 400:
+            return self.render_json(self.get_envelope(data, renderer_context), accepted_media_type, renderer_context)
+
+        # Handle success responses (status codes < 400)
+        return self.render_success(data, accepted_media_type, renderer_context)
+
+    def add_timing_meta(self, data, renderer_context=None):
+        """
+        Return `data` as an envelope with the timings recorded so far in `meta.timing`.
+
+        `data` is returned unchanged unless the `TIMING` and `TIMING_IN_META`
+        settings are enabled.
+        """
+        request = renderer_context.get('request', None) if renderer_context else None
+        if request is None or not (response_settings.TIMING and response_settings.TIMING_IN_META):
+            return data
+        envelope = self.get_envelope(data, renderer_context)
+        meta = dict(envelope.get('meta') or {}, timing=timings_in_ms(get_timings(request)))
+        return Envelope(envelope, meta=meta)
+
+    def apply_fieldsets(self, data, request, renderer_context=None):
+        """
+        Restrict success response data to the fields requested with the
+        `fields` and `meta` query parameters (see `drf_standardized_responses.fieldsets`).
+        """
+        response = renderer_context.get('response', None) if renderer_context else None
+        if response is not None and response.status_code >= 400:
+            return data
+        if self.is_envelope(data):
+            return project_envelope(data, request)
+        return project(data, get_requested_fields(request))
+
+    def is_envelope(self, data):
+        """
+        Return whether `data` is already in the standard envelope format.
+        """
+        return isinstance(data, Envelope)
+
+    def get_envelope(self, data, renderer_context=None):
+        """
+        Wrap `data` in the standard envelope structure.
+
+        Args:
+            data (Any): The data to be rendered in the response.
+            renderer_context (dict, optional): Additional context for rendering, including the response object.
+
+        Returns:
+            dict: The envelope with `success`, `message`, `data` and optional `meta`/`errors` keys.
+        """
         # Extract the response object from the renderer context
         response = renderer_context.get('response', None) if renderer_context else None
 
-        # If data already has the expected format structure, assume it's already been wrapped
-        if isinstance(data, dict) and "success" in data and "message" in data:
-            return super().render(data, accepted_media_type, renderer_context)
+        # Envelopes built by StandardResponse are already wrapped
+        if self.is_envelope(data):
+            return data
 
         # Handle error responses (status codes >= 400)
         if response and response.status_code >= 400:
             if isinstance(data, dict):
-                message = data.pop('message', 'An error occurred')
+                message = data.pop('message') if 'message' in data else get_message('error')
                 errors = data if data else None
             else:
-                message = str(data) if data else 'An error occurred'
+                message = str(data) if data else get_message('error')
                 errors = None
 
-            return super().render(
-                StandardResponse.error(
-                    message=message,
-                    status_code=response.status_code,
-                    errors=errors
-                ).data,
+            return StandardResponse.error(
+                message=message,
+                status_code=response.status_code,
+                errors=errors
+            ).data
+
+        # Handle success responses (status codes < 400)
+        return StandardResponse.success(data=data).data
+
+    def render_json(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render `data` into JSON with the configured backend, returning a bytestring.
+
+        This is a drop-in replacement for `JSONRenderer.render`, producing the
+        same bytes regardless of the backend in use.
+        """
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        indent = self.get_indent(accepted_media_type, renderer_context)
+
+        if indent is None:
+            separators = SHORT_SEPARATORS if self.compact else LONG_SEPARATORS
+        else:
+            separators = INDENT_SEPARATORS
+
+        dumps = get_json_backend(self.json_backend or response_settings.JSON_BACKEND)
+        return dumps(
+            data, self.encoder_class,
+            ensure_ascii=self.ensure_ascii, allow_nan=not self.strict,
+            indent=indent, separators=separators
+        )
+
+    def render_limited_envelope(self, envelope, accepted_media_type=None, renderer_context=None):
+        """
+        Render a success `envelope` whose `data` list may exceed `max_items` or `max_bytes`.
+
+        Items are encoded one at a time and encoding stops as soon as a limit
+        is reached, so an oversized payload is never encoded in full. A
+        truncated envelope keeps the items that fit (at least one, even if it
+        alone exceeds `max_bytes`) and gets `meta.truncated` and
+        `meta.continuation` (see `get_continuation_link`). Encoded items are
+        spliced into the envelope rather than encoded a second time.
+        """
+        items = envelope['data']
+        chunks = []
+        size = 0
+        for item in items:
+            if self.max_items is not None and len(chunks) >= self.max_items:
+                break
+            chunk = self.render_json(item, accepted_media_type, renderer_context) if item is not None else b'null'
+            size += len(chunk)
+            # The first item is always returned, so that following the continuation makes progress.
+            if self.max_bytes is not None and size > self.max_bytes and chunks:
+                break
+            chunks.append(chunk)
+
+        if len(chunks) < len(items):
+            meta = dict(
+                envelope.get('meta') or {},
+                truncated=True,
+                continuation=self.get_continuation_link(len(chunks), renderer_context),
+            )
+            envelope = Envelope(
+                [('success', envelope['success']), ('message', envelope['message']), ('data', items[:len(chunks)]),
+                 ('meta', meta)]
+                + [(key, value) for key, value in envelope.items() if key not in ('success', 'message', 'data', 'meta')]
+            )
+
+        if self.render_style == 'binary':
+            return self.render_spliced_envelope(envelope, accepted_media_type, renderer_context)
+        item_separator = (SHORT_SEPARATORS if self.compact else LONG_SEPARATORS)[0].encode()
+        data = b'[' + item_separator.join(chunks) + b']'
+        return self.render_spliced_envelope(envelope, accepted_media_type, renderer_context, encoded={'data': data})
+
+    def get_continuation_link(self, returned, renderer_context=None):
+        """
+        Return the link to the items following the first `returned` items of a truncated list.
+
+        Delegates to `get_continuation_link(returned)` on the view (see
+        `ResponseLimitMixin`); views without it get `None`.
+        """
+        view = renderer_context.get('view', None) if renderer_context else None
+        get_link = getattr(view, 'get_continuation_link', None)
+        return get_link(returned) if get_link is not None else None
+
+    def render_spliced_envelope(self, envelope, accepted_media_type=None, renderer_context=None, encoded=None):
+        """
+        Render an `Envelope` by encoding each member separately and splicing the results.
+
+        The `success`/`message` head comes from the per-message prefix cache, so
+        only the values of `data`, `meta` and `errors` go through the JSON
+        encoder, unless already encoded values are passed in `encoded`. The
+        output is byte-identical to encoding the envelope as a whole, which is
+        done instead when splicing is disabled, indentation is requested or the
+        envelope does not start with `success`, `message`, `data`.
+        """
+        message = envelope.get('message')
+        if (
+            not self.splice_envelope
+            or not isinstance(message, str)
+            or list(islice(envelope, 3)) != ['success', 'message', 'data']
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return self.render_json(envelope, accepted_media_type, renderer_context)
+
+        if len(envelope) == 3 and envelope['data'] == {}:
+            return _empty_envelope(envelope['success'], message, self.ensure_ascii, self.compact)
+
+        members = islice(envelope.items(), 2, None)
+        parts = [_envelope_prefix(envelope['success'], message, self.ensure_ascii, self.compact)]
+        for index, (key, value) in enumerate(members):
+            if index:
+                parts.append(_member_prefix(key, self.ensure_ascii, self.compact))
+            if encoded and key in encoded:
+                parts.append(encoded[key])
+            elif value is None:
+                parts.append(b'null')
+            else:
+                parts.append(self.render_json(value, accepted_media_type, renderer_context))
+        parts.append(b'}')
+        return b''.join(parts)
+
+    def render_success(
+        self, data, accepted_media_type=None, renderer_context=None, message=None
+    ):
+        """
+        Render `data` wrapped in a success envelope.
+
+        When `splice_envelope` is enabled and no indentation is requested, only
+        the payload goes through the JSON encoder; the output is byte-identical
+        to encoding the full `StandardResponse.success` structure.
+
+        Args:
+            data (Any): The payload to place under the `data` key.
+            accepted_media_type (str, optional): The accepted media type for the response.
+            renderer_context (dict, optional): Additional context for rendering.
+            message (str): The success message to include in the envelope; defaults to
+                the `SUCCESS_MESSAGE` setting.
+
+        Returns:
+            bytes: The rendered envelope in JSON format.
+        """
+        if message is None:
+            message = get_message('success')
+        if not self.splice_envelope or self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return self.render_json(
+                StandardResponse.success(data=data, message=message).data,
                 accepted_media_type,
                 renderer_context
             )
 
-        # Handle success responses (status codes < 400)
-        return super().render(
-            StandardResponse.success(data=data).data,
-            accepted_media_type,
-            renderer_context
-        )
\ No newline at end of file
+        payload = self.render_json(data if data is not None else {}, accepted_media_type, renderer_context)
+        prefix = _envelope_prefix(True, message, self.ensure_ascii, self.compact)
+        return b''.join((prefix, payload, b'}'))
+
+class StandardMessagePackRenderer(StandardResponseRenderer):
+    """
+    Render the standard envelope as MessagePack, for service-to-service callers.
+
+    The envelope structure is identical to `StandardResponseRenderer`'s, and
+    values the JSON encoder would convert (dates, decimals, UUIDs, lazy strings)
+    are converted the same way. Requires the `msgpack` package.
+
+    Usage:
+        REST_FRAMEWORK = {
+            'DEFAULT_RENDERER_CLASSES': [
+                'drf_standardized_responses.renderers.StandardResponseRenderer',
+                'drf_standardized_responses.renderers.StandardMessagePackRenderer',
+            ],
+        }
+    """
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+    # Splicing pre-encoded prefixes only applies to JSON output.
+    splice_envelope = False
+
+    def render_json(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Encode `data` as MessagePack; used wherever the JSON renderer would encode JSON.
+        """
+        if data is None:
+            return b''
+        if msgpack is None:
+            raise ImproperlyConfigured('StandardMessagePackRenderer requires the msgpack package.')
+        return msgpack.packb(data, default=self.encoder_class().default, use_bin_type=True)
+
+
+def _convert_naive_datetimes(data, convert):
+    """
+    Return a copy of `data` with naive datetimes in dicts, lists and tuples replaced by `convert(value)`.
+    """
+    if isinstance(data, dict):
+        return {key: _convert_naive_datetimes(value, convert) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [_convert_naive_datetimes(value, convert) for value in data]
+    if isinstance(data, datetime.datetime) and data.tzinfo is None:
+        return convert(data)
+    return data
+
+
+class StandardCBORRenderer(StandardResponseRenderer):
+    """
+    Render the standard envelope as CBOR (RFC 8949).
+
+    The envelope structure is identical to `StandardResponseRenderer`'s. Dates,
+    decimals, UUIDs and bytes are encoded with CBOR's native types; other values,
+    and naive datetimes (which have no CBOR representation), are converted like
+    the JSON encoder does. Requires the `cbor2` package.
+    """
+    media_type = 'application/cbor'
+    format = 'cbor'
+    charset = None
+    render_style = 'binary'
+    # Splicing pre-encoded prefixes only applies to JSON output.
+    splice_envelope = False
+
+    def render_json(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Encode `data` as CBOR; used wherever the JSON renderer would encode JSON.
+        """
+        if data is None:
+            return b''
+        if cbor2 is None:
+            raise ImproperlyConfigured('StandardCBORRenderer requires the cbor2 package.')
+        default = self.encoder_class().default
+
+        def encode_default(encoder, value):
+            encoder.encode(default(value))
+
+        try:
+            return cbor2.dumps(data, default=encode_default)
+        except cbor2.CBOREncodeError:
+            # cbor2 refuses naive datetimes and cannot be told to hand them to
+            # `default`, so convert them up front and encode again.
+            return cbor2.dumps(_convert_naive_datetimes(data, default), default=encode_default)
+
+
+class StandardNDJSONRenderer(StandardResponseRenderer):
+    """
+    Render list responses as newline-delimited JSON (NDJSON / JSON Lines).
+
+    The first line is the envelope header (`success`, `message` and `meta`),
+    followed by one line per item of `data`. Responses whose `data` is not a
+    list, and error responses, are rendered as a single envelope line. Lines
+    are always compact and the `max_items`/`max_bytes` limits do not apply,
+    since the format is meant for exports.
+
+    For large exports, use `NDJSONExportMixin` (see
+    `drf_standardized_responses.streaming`) to stream the lines from a database
+    cursor instead of rendering a list.
+
+    Usage:
+        class EventViewSet(NDJSONExportMixin, viewsets.ReadOnlyModelViewSet):
+            renderer_classes = [StandardResponseRenderer, StandardNDJSONRenderer]
+    """
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+
+    def get_indent(self, accepted_media_type, renderer_context):
+        return None
+
+    def render_envelope(self, data, accepted_media_type=None, renderer_context=None):
+        envelope = self.get_envelope(self.add_timing_meta(data, renderer_context), renderer_context)
+        items = envelope.get('data')
+        if not envelope.get('success') or not isinstance(items, list):
+            return self.render_json(envelope, accepted_media_type, renderer_context) + b'\n'
+
+        header = Envelope((key, value) for key, value in envelope.items() if key != 'data')
+        lines = [self.render_header(header, accepted_media_type, renderer_context)]
+        lines.extend(self.render_line(item, accepted_media_type, renderer_context) for item in items)
+        return b''.join(lines)
+
+    def render_header(self, header, accepted_media_type=None, renderer_context=None):
+        """
+        Encode the header line: the envelope without `data`.
+        """
+        return self.render_json(header, accepted_media_type, renderer_context) + b'\n'
+
+    def render_line(self, item, accepted_media_type=None, renderer_context=None):
+        """
+        Encode one item as a line.
+        """
+        if item is None:
+            return b'null\n'
+        return self.render_json(item, accepted_media_type, renderer_context) + b'\n'
@@ -4,9 +4,61 @@ Standardized response structures for Django REST Framework.
 This module provides classes and utilities to create consistent API responses
 across a Django REST Framework application.
 """
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Iterable, Optional, Union
 from rest_framework.response import Response
 
+from drf_standardized_responses.messages import get_message
+
+
+class Envelope(dict):
+    """
+    A dictionary holding a response that is already in the standard format.
+
+    `StandardResponse` builds its response data as `Envelope` instances so that
+    `StandardResponseRenderer` can recognize them with a single type check and
+    never wraps them a second time. Plain dictionaries are always treated as
+    payload, even if they happen to contain `success` or `message` keys.
+
+    Keys are kept in envelope order: `success`, `message`, `data`, then the
+    optional `meta` and `errors`.
+    """
+    __slots__ = ()
+
+
+def batch_item(result: Union[Response, Exception, Dict]) -> Envelope:
+    """
+    Convert the result of one batch sub-operation into an item envelope.
+
+    Args:
+        result: A DRF `Response`, an exception raised by the sub-operation, or an
+                envelope dictionary.
+
+    Returns:
+        Envelope: The item with `success`, `message`, `data` and optional `errors`,
+                  plus `status` when the result carries an HTTP status code.
+    """
+    if isinstance(result, Exception):
+        from drf_standardized_responses.exceptions import standardized_exception_handler
+        result = standardized_exception_handler(result, {})
+
+    if not isinstance(result, Response):
+        return Envelope(result)
+
+    data = result.data
+    if isinstance(data, Envelope):
+        item = Envelope(data)
+    elif result.status_code >= 400:
+        item = Envelope(success=False, message=get_message('request_failed'), data={})
+        if data:
+            item["errors"] = data
+    else:
+        item = Envelope(
+            success=True, message=get_message('success'), data=data if data is not None else {}
+        )
+
+    item["status"] = result.status_code
+    return item
+
 
 class StandardResponse:
     """
@@ -22,7 +74,7 @@ class StandardResponse:
     @staticmethod
     def success(
         data: Any = None,
-        message: str = "Operation successful",
+        message: Optional[str] = None,
         meta: Optional[Dict[str, Any]] = None,
         status_code: int = 200,
     ) -> Response:
@@ -31,18 +83,18 @@ class StandardResponse:
 
         Args:
             data: The main response data to return.
-            message: A human-readable success message.
+            message: A human-readable success message; defaults to the `SUCCESS_MESSAGE` setting.
             meta: Additional metadata to include in the response.
             status_code: The HTTP status code for the response.
 
         Returns:
-            Response: A DRF Response object with standardized structure.
+            Response: A DRF Response object whose data is an `Envelope`.
         """
-        response_data = {
-            "success": True,
-            "message": message,
-            "data": data if data is not None else {},
-        }
+        response_data = Envelope(
+            success=True,
+            message=get_message('success') if message is None else message,
+            data=data if data is not None else {},
+        )
 
         if meta:
             response_data["meta"] = meta
@@ -51,28 +103,79 @@ class StandardResponse:
 
     @staticmethod
     def error(
-        message: str = "An error occurred",
+        message: Optional[str] = None,
         errors: Optional[Union[Dict, list]] = None,
         status_code: int = 400,
+        meta: Optional[Dict[str, Any]] = None,
     ) -> Response:
         """
         Create a standardized error response.
 
         Args:
-            message: A human-readable error message.
+            message: A human-readable error message; defaults to the `ERROR_MESSAGE` setting.
             errors: Detailed error information (can be a dict or list).
             status_code: The HTTP status code for the response.
+            meta: Additional metadata to include in the response.
 
         Returns:
-            Response: A DRF Response object with standardized structure.
+            Response: A DRF Response object whose data is an `Envelope`.
         """
-        response_data = {
-            "success": False,
-            "message": message,
-            "data": {},
-        }
+        response_data = Envelope(
+            success=False,
+            message=get_message('error') if message is None else message,
+            data={},
+        )
+
+        if meta:
+            response_data["meta"] = meta
 
         if errors:
             response_data["errors"] = errors
 
         return Response(response_data, status=status_code)
+
+    @staticmethod
+    def batch(
+        results: Iterable[Union[Response, Exception, Dict]],
+        message: Optional[str] = None,
+        meta: Optional[Dict[str, Any]] = None,
+        status_code: int = 200,
+    ) -> Response:
+        """
+        Create a standardized response for a batch of sub-operations.
+
+        Each result becomes one item in `data` (see `batch_item`); exceptions are
+        translated with `standardized_exception_handler`. The envelope reports
+        `success` only when every item succeeded, and `meta.batch` holds the
+        `total`, `succeeded` and `failed` counts.
+
+        Args:
+            results: The outcome of each sub-operation, in request order.
+            message: A human-readable message; defaults to the `BATCH_COMPLETED_MESSAGE`
+                     or `BATCH_FAILED_MESSAGE` setting, depending on the outcome.
+            meta: Additional metadata to include alongside `meta.batch`.
+            status_code: The HTTP status code for the response as a whole.
+
+        Returns:
+            Response: A DRF Response object whose data is an `Envelope`.
+
+        Usage:
+            return StandardResponse.batch([StandardResponse.success(data=a), NotFound()])
+        """
+        items = [batch_item(result) for result in results]
+        failed = sum(1 for item in items if not item.get("success"))
+
+        if message is None:
+            message = get_message('batch_failed' if failed else 'batch_completed')
+
+        response_data = Envelope(
+            success=not failed,
+            message=message,
+            data=items,
+        )
+        response_data["meta"] = dict(
+            meta or {},
+            batch={"total": len(items), "succeeded": len(items) - failed, "failed": failed},
+        )
+
+        return Response(response_data, status=status_code)
@@ -0,0 +1,288 @@
+"""
+Settings for drf-standardized-responses.
+
+Settings are read from the `STANDARDIZED_RESPONSES` dictionary in your Django
+settings, for example:
+
+    STANDARDIZED_RESPONSES = {
+        'JSON_BACKEND': 'auto',
+    }
+
+Values are looked up and cached in the same way as DRF's `api_settings`. All
+of them are read and validated once at startup, when the app is ready (see
+`ResponseSettings.load`), so hot paths only read cached attributes. Projects
+that do not add the app to `INSTALLED_APPS` still get their settings validated,
+when the first one is read. The cache is cleared and the settings validated
+again whenever the `STANDARDIZED_RESPONSES` setting is changed (e.g. with
+`override_settings` in tests).
+"""
+from importlib import import_module
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from django.utils.functional import Promise
+from django.utils.translation import gettext_lazy as _
+from rest_framework.settings import APISettings
+
+SETTINGS_NAME = 'STANDARDIZED_RESPONSES'
+
+DEFAULTS = {
+    # Default envelope messages, resolved per language by drf_standardized_responses.messages
+    'SUCCESS_MESSAGE': _("Operation successful"),
+    'ERROR_MESSAGE': _("An error occurred"),
+    'VALIDATION_ERROR_MESSAGE': _("Validation failed"),
+    'REQUEST_FAILED_MESSAGE': _("Request failed"),
+    'SERVER_ERROR_MESSAGE': _("Internal server error"),
+    'BATCH_COMPLETED_MESSAGE': _("Batch completed"),
+    'BATCH_FAILED_MESSAGE': _("Batch completed with errors"),
+    # Status codes mapped to the message of errors without one of their own
+    'STATUS_MESSAGES': {},
+    # Default page size and maximum client-requested page size of the standard pagination classes
+    'PAGE_SIZE': 10,
+    'MAX_PAGE_SIZE': 100,
+    # Response size limits (see drf_standardized_responses.limits)
+    'RESPONSE_MAX_ITEMS': None,
+    'RESPONSE_MAX_BYTES': None,
+    'RESPONSE_LIMIT_ACTION': 'truncate',
+    'OFFSET_QUERY_PARAM': 'offset',
+    # JSON encoder used by StandardResponseRenderer: 'json', 'orjson' or 'auto'
+    'JSON_BACKEND': 'json',
+    # Response caching (see drf_standardized_responses.cache)
+    'RESPONSE_CACHE_ALIAS': 'default',
+    'RESPONSE_CACHE_TIMEOUT': 60,
+    'RESPONSE_CACHE_KEY_COMPONENTS': ('path', 'query', 'user', 'accept', 'language'),
+    'RESPONSE_CACHE_COMPRESSION': False,
+    # Next-page prefetching (see drf_standardized_responses.prefetch)
+    'PREFETCH_EXECUTOR': None,
+    'PREFETCH_MAX_WORKERS': 2,
+    # Response compression (see drf_standardized_responses.compression)
+    'COMPRESSION_ENCODINGS': ('br', 'zstd', 'gzip'),
+    'COMPRESSION_MIN_SIZE': 1024,
+    'COMPRESSION_LEVELS': {'gzip': 6, 'br': 5, 'zstd': 3},
+    # Per-stage timing instrumentation (see drf_standardized_responses.instrumentation)
+    'TIMING': False,
+    'TIMING_IN_META': False,
+    # Per-stage allocation profiling with tracemalloc (see drf_standardized_responses.allocations)
+    'ALLOCATION_PROFILING': False,
+    # Validation error format: 'nested' (as raised) or 'flat' (list of JSON pointer entries)
+    'ERROR_FORMAT': 'nested',
+    # Maximum number of flat errors returned, or None for all of them
+    'ERROR_LIMIT': 100,
+    # Unhandled exception logging (see drf_standardized_responses.exception_logging)
+    'EXCEPTION_LOG_RATE': None,
+    'EXCEPTION_LOG_RATE_OVERRIDES': {},
+    'EXCEPTION_LOG_PERIOD': 60,
+    'EXCEPTION_LOG_SAMPLE_RATE': 1.0,
+    'EXCEPTION_LOG_SUMMARY_INTERVAL': 60,
+    'EXCEPTION_LOG_MAX_KEYS': 1000,
+    'EXCEPTION_LOG_QUEUE': False,
+    'EXCEPTION_LOG_QUEUE_SIZE': 10000,
+    # Sparse fieldsets (see drf_standardized_responses.fieldsets)
+    'SPARSE_FIELDSETS': False,
+    'FIELDS_QUERY_PARAM': 'fields',
+    'META_QUERY_PARAM': 'meta',
+}
+
+# List of settings that may be in string import notation.
+IMPORT_STRINGS = ['PREFETCH_EXECUTOR']
+
+
+def _choice(*choices):
+    return lambda value: value in choices, 'one of %s' % ', '.join(repr(choice) for choice in choices)
+
+
+def _number(minimum, maximum=None, optional=False):
+    def check(value):
+        if value is None:
+            return optional
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return False
+        return value >= minimum and (maximum is None or value <= maximum)
+
+    expected = 'a number >= %s' % minimum if maximum is None else 'a number between %s and %s' % (minimum, maximum)
+    return check, expected + (' or None' if optional else '')
+
+
+def _mapping(check_key, check_value, expected):
+    return lambda value: isinstance(value, dict) and all(
+        check_key(key) and check_value(item) for key, item in value.items()
+    ), expected
+
+
+def _names(module, attribute, expected):
+    """
+    Check for a list or tuple of keys of `module.attribute`, imported when validating.
+    """
+    def check(value):
+        names = getattr(import_module(module), attribute)
+        return isinstance(value, (list, tuple)) and all(name in names for name in value)
+
+    return check, expected
+
+
+_string = (lambda value: isinstance(value, (str, Promise)), 'a string')
+_boolean = (lambda value: isinstance(value, bool), 'True or False')
+_encodings = _names(
+    'drf_standardized_responses.compression', 'CODECS', "a list of encodings among 'gzip', 'br' and 'zstd'"
+)
+
+# Checks run by `ResponseSettings.validate`: setting name -> (predicate, description of valid values)
+VALIDATORS = {
+    'SUCCESS_MESSAGE': _string,
+    'ERROR_MESSAGE': _string,
+    'VALIDATION_ERROR_MESSAGE': _string,
+    'REQUEST_FAILED_MESSAGE': _string,
+    'SERVER_ERROR_MESSAGE': _string,
+    'BATCH_COMPLETED_MESSAGE': _string,
+    'BATCH_FAILED_MESSAGE': _string,
+    'STATUS_MESSAGES': _mapping(
+        lambda code: isinstance(code, int), _string[0], 'a dict mapping status codes to strings'
+    ),
+    'PAGE_SIZE': _number(1),
+    'MAX_PAGE_SIZE': _number(1, optional=True),
+    'RESPONSE_MAX_ITEMS': _number(1, optional=True),
+    'RESPONSE_MAX_BYTES': _number(1, optional=True),
+    'RESPONSE_LIMIT_ACTION': _choice('truncate', 'stream'),
+    'OFFSET_QUERY_PARAM': _string,
+    'JSON_BACKEND': _choice('json', 'orjson', 'auto'),
+    'ERROR_FORMAT': _choice('nested', 'flat'),
+    'ERROR_LIMIT': _number(1, optional=True),
+    'RESPONSE_CACHE_ALIAS': _string,
+    'RESPONSE_CACHE_TIMEOUT': _number(0, optional=True),
+    'RESPONSE_CACHE_KEY_COMPONENTS': _names(
+        'drf_standardized_responses.cache', 'KEY_COMPONENTS',
+        "a list of 'path', 'query', 'user', 'accept' and 'language'",
+    ),
+    'RESPONSE_CACHE_COMPRESSION': _boolean,
+    'COMPRESSION_ENCODINGS': _encodings,
+    'COMPRESSION_MIN_SIZE': _number(0),
+    'COMPRESSION_LEVELS': _mapping(
+        lambda encoding: _encodings[0]([encoding]),
+        lambda level: isinstance(level, int) and not isinstance(level, bool),
+        'a dict mapping encodings to integer compression levels',
+    ),
+    'TIMING': _boolean,
+    'TIMING_IN_META': _boolean,
+    'ALLOCATION_PROFILING': _boolean,
+    'SPARSE_FIELDSETS': _boolean,
+    'FIELDS_QUERY_PARAM': _string,
+    'META_QUERY_PARAM': _string,
+    'PREFETCH_MAX_WORKERS': _number(1),
+    'EXCEPTION_LOG_RATE': _number(0, optional=True),
+    'EXCEPTION_LOG_RATE_OVERRIDES': _mapping(
+        lambda name: isinstance(name, str), _number(0, optional=True)[0],
+        'a dict mapping exception type names to rates or None',
+    ),
+    'EXCEPTION_LOG_PERIOD': _number(0),
+    'EXCEPTION_LOG_SAMPLE_RATE': _number(0, 1),
+    'EXCEPTION_LOG_SUMMARY_INTERVAL': _number(0),
+    'EXCEPTION_LOG_MAX_KEYS': _number(1),
+    'EXCEPTION_LOG_QUEUE': _boolean,
+    'EXCEPTION_LOG_QUEUE_SIZE': _number(0),
+}
+
+
+class ResponseSettings(APISettings):
+    """
+    Settings object that reads from `STANDARDIZED_RESPONSES` instead of `REST_FRAMEWORK`.
+
+    Besides the settings themselves it provides data derived from them, which
+    is computed once and discarded with the settings on reload.
+    """
+
+    @property
+    def user_settings(self):
+        if not hasattr(self, '_user_settings'):
+            user_settings = getattr(settings, SETTINGS_NAME, {})
+            # Validated on first use as well, for projects without the app installed
+            self.validate(user_settings)
+            self._user_settings = user_settings
+        return self._user_settings
+
+    def load(self):
+        """
+        Read, validate and cache every setting and the derived data.
+
+        Called when the app is ready, so no setting is first looked up while
+        serving a request.
+
+        Raises:
+            ImproperlyConfigured: If a setting is unknown or has an invalid value.
+        """
+        self.validate()
+        for name in self.defaults:
+            getattr(self, name)
+        self.status_messages
+
+    def validate(self, user_settings=None):
+        """
+        Check the user settings against `DEFAULTS` and `VALIDATORS`.
+
+        Args:
+            user_settings: The settings dictionary to check, the current user settings by default.
+
+        Raises:
+            ImproperlyConfigured: If a setting is unknown or has an invalid value.
+        """
+        if user_settings is None:
+            user_settings = self.user_settings
+        for name, value in user_settings.items():
+            if name not in self.defaults:
+                raise ImproperlyConfigured('Unknown setting %s[%r].' % (SETTINGS_NAME, name))
+            if name in VALIDATORS:
+                check, expected = VALIDATORS[name]
+                if not check(value):
+                    raise ImproperlyConfigured(
+                        'Invalid value %r for %s[%r]; expected %s.' % (value, SETTINGS_NAME, name, expected)
+                    )
+
+    @property
+    def status_messages(self):
+        """
+        Status codes mapped to the default message of error responses.
+
+        Codes not in `STATUS_MESSAGES` use `REQUEST_FAILED_MESSAGE`; see
+        `drf_standardized_responses.messages.get_status_message`.
+        """
+        try:
+            return self._status_messages
+        except AttributeError:
+            self._status_messages = dict(self.STATUS_MESSAGES)
+            return self._status_messages
+
+    def reload(self):
+        super().reload()
+        if hasattr(self, '_status_messages'):
+            delattr(self, '_status_messages')
+
+
+response_settings = ResponseSettings(None, DEFAULTS, IMPORT_STRINGS)
+
+
+class SettingDefault:
+    """
+    Class attribute whose value is read from `response_settings`.
+
+    Subclasses and instances may still assign a value of their own.
+
+    Usage:
+        class StandardPagination(PageNumberPagination):
+            page_size = SettingDefault('PAGE_SIZE')
+    """
+
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        return getattr(response_settings, self.name)
+
+
+def reload_response_settings(*args, **kwargs):
+    if kwargs['setting'] == SETTINGS_NAME:
+        response_settings.reload()
+        # Fail where invalid settings are applied, not on their first use
+        response_settings.validate()
+
+
+setting_changed.connect(reload_response_settings)
@@ -0,0 +1,407 @@
+"""
+Streaming variants of the standardized response format.
+
+This module provides a `StreamingHttpResponse` that emits the standard envelope
+incrementally: the envelope head first, then one JSON document per item, and
+finally `meta` as a trailer. Peak memory stays bounded by the chunk size rather
+than the size of the full payload, which makes it suitable for export-style
+endpoints returning many thousands of rows.
+
+`NDJSONStreamingResponse` streams the same data as newline-delimited JSON: an
+envelope header line followed by one line per item.
+
+Binary envelope formats (MessagePack, CBOR) cannot be written item by item.
+The list views in this package render the whole payload in those formats
+instead of streaming it (see `can_stream`).
+"""
+import inspect
+
+import django
+from django.core.exceptions import ImproperlyConfigured
+from django.http import StreamingHttpResponse
+from rest_framework.compat import LONG_SEPARATORS, SHORT_SEPARATORS
+from rest_framework.exceptions import NotAcceptable
+from rest_framework.response import Response
+
+from drf_standardized_responses.messages import get_message
+from drf_standardized_responses.renderers import StandardNDJSONRenderer, StandardResponseRenderer, _envelope_prefix
+from drf_standardized_responses.responses import Envelope
+
+
+# Async querysets arrived in Django 4.1, async iterators in StreamingHttpResponse in 4.2.
+ASYNC_MIN_DJANGO_VERSION = (4, 2)
+
+
+def check_async_support(feature):
+    """
+    Raise `ImproperlyConfigured` if the installed Django is too old for the async entry point `feature`.
+    """
+    if django.VERSION < ASYNC_MIN_DJANGO_VERSION:
+        raise ImproperlyConfigured(
+            '%s requires Django %s or later; Django %s is installed.'
+            % (feature, '.'.join(map(str, ASYNC_MIN_DJANGO_VERSION)), django.get_version())
+        )
+
+
+def can_stream(renderer):
+    """
+    Return whether a response negotiated for `renderer` can be streamed.
+
+    Binary envelope formats cannot: views should render their items as a
+    whole for them, e.g. with `get_paginated_response(list(items))`.
+    """
+    return getattr(renderer, 'render_style', 'text') != 'binary'
+
+
+def iter_serialized(serializer, iterable, chunk_size=2000):
+    """
+    Lazily serialize the items of `iterable` one at a time.
+
+    Querysets are consumed with `.iterator(chunk_size=...)` so that rows are
+    fetched from a server-side cursor instead of being cached on the queryset.
+
+    Args:
+        serializer: A serializer instance whose `to_representation` is applied to each item,
+                    or `None` to yield the items unchanged.
+        iterable: A queryset or any other iterable of objects.
+        chunk_size: The number of rows fetched per database round trip.
+
+    Yields:
+        The serialized representation of each item.
+    """
+    if hasattr(iterable, 'iterator'):
+        iterable = iterable.iterator(chunk_size=chunk_size)
+
+    if serializer is None:
+        yield from iterable
+        return
+
+    to_representation = serializer.to_representation
+    for item in iterable:
+        yield to_representation(item)
+
+
+async def aiter_serialized(serializer, iterable, chunk_size=2000):
+    """
+    Asynchronous counterpart of `iter_serialized` for async views.
+
+    Querysets are consumed with `.aiterator(chunk_size=...)`; other async
+    iterables and plain iterables are accepted as well. Requires Django 4.2+.
+    """
+    check_async_support('aiter_serialized()')
+    if hasattr(iterable, 'aiterator'):
+        iterable = iterable.aiterator(chunk_size=chunk_size)
+    if not hasattr(iterable, '__aiter__'):
+        for item in iterable:
+            yield item if serializer is None else serializer.to_representation(item)
+        return
+
+    async for item in iterable:
+        yield item if serializer is None else serializer.to_representation(item)
+
+
+class _EnvelopeWriter:
+    """
+    Incrementally encode the standard success envelope, shared by the sync and async generators.
+    """
+
+    def __init__(self, message, renderer, buffer_size):
+        if message is None:
+            message = get_message('success')
+        self.renderer = renderer or StandardResponseRenderer()
+        item_separator, self.key_separator = SHORT_SEPARATORS if self.renderer.compact else LONG_SEPARATORS
+        self.item_separator = item_separator.encode()
+        self.buffer_size = buffer_size
+        self.buffer = [_envelope_prefix(True, message, self.renderer.ensure_ascii, self.renderer.compact), b'[']
+        self.pending = 0
+        self.first = True
+
+    def write(self, item):
+        """Add `item` to the buffer, returning a chunk once `buffer_size` bytes are pending."""
+        if not self.first:
+            self.buffer.append(self.item_separator)
+        self.first = False
+
+        chunk = self.renderer.render_json(item) if item is not None else b'null'
+        self.buffer.append(chunk)
+        self.pending += len(chunk)
+        if self.pending >= self.buffer_size:
+            return self.flush()
+        return None
+
+    def flush(self):
+        chunk = b''.join(self.buffer)
+        self.buffer = []
+        self.pending = 0
+        return chunk
+
+    def close(self, meta):
+        """Return the final chunk, with `meta` as the trailer."""
+        self.buffer.append(b']')
+        if meta:
+            self.buffer.append(('%s"meta"%s' % (self.item_separator.decode(), self.key_separator)).encode())
+            self.buffer.append(self.renderer.render_json(meta))
+        self.buffer.append(b'}')
+        return self.flush()
+
+
+def iter_envelope(items, message=None, meta=None, renderer=None, buffer_size=65536):
+    """
+    Yield the standard success envelope for `items` as a sequence of byte chunks.
+
+    Args:
+        items: An iterable of JSON-serializable items to place in the `data` list.
+        message: A human-readable success message; defaults to the `SUCCESS_MESSAGE` setting.
+        meta: Metadata emitted after the items, or a callable returning it. A callable
+              is only invoked once every item has been emitted.
+        renderer: The `StandardResponseRenderer` used to encode each item.
+        buffer_size: Encoded items are buffered until this many bytes are pending.
+
+    Yields:
+        bytes: Chunks which concatenate to the same document `StandardResponseRenderer`
+               would render for the full envelope.
+    """
+    writer = _EnvelopeWriter(message, renderer, buffer_size)
+    for item in items:
+        chunk = writer.write(item)
+        if chunk is not None:
+            yield chunk
+
+    if callable(meta):
+        meta = meta()
+    yield writer.close(meta)
+
+
+async def aiter_envelope(items, message=None, meta=None, renderer=None, buffer_size=65536):
+    """
+    Asynchronous counterpart of `iter_envelope`, consuming an async iterable of items.
+
+    A callable `meta` may return an awaitable, which is awaited once every
+    item has been emitted.
+    """
+    writer = _EnvelopeWriter(message, renderer, buffer_size)
+    async for item in items:
+        chunk = writer.write(item)
+        if chunk is not None:
+            yield chunk
+
+    if callable(meta):
+        meta = meta()
+    if inspect.isawaitable(meta):
+        meta = await meta
+    yield writer.close(meta)
+
+
+class StandardStreamingResponse(StreamingHttpResponse):
+    """
+    A streaming response that emits a list payload in the standard success envelope.
+
+    Usage:
+        def list(self, request, *args, **kwargs):
+            queryset = self.filter_queryset(self.get_queryset())
+            return StandardStreamingResponse(
+                iter_serialized(self.get_serializer(), queryset),
+                meta=lambda: {'exported_at': timezone.now()},
+            )
+
+    Async iterables (e.g. from `aiter_serialized`) are streamed with
+    `aiter_envelope`, so async views under ASGI never hop to a worker thread.
+    With a `StandardNDJSONRenderer`, the items are streamed as NDJSON lines
+    (see `iter_ndjson`), and renderers other than `StandardResponseRenderer`
+    fall back to streaming JSON. Binary renderers (MessagePack, CBOR) raise
+    `NotAcceptable` rather than sending a format the client did not ask for;
+    check `can_stream()` first and render a regular response for them.
+
+    Note:
+        The status code and headers are sent before the first item is serialized,
+        so an exception raised while iterating aborts the response mid-stream.
+    """
+
+    def __init__(self, items, message=None, meta=None, status=200, renderer=None, **kwargs):
+        if not can_stream(renderer):
+            raise NotAcceptable('%s responses cannot be streamed.' % renderer.media_type)
+        if not isinstance(renderer, StandardResponseRenderer):
+            renderer = StandardResponseRenderer()
+        kwargs.setdefault('content_type', renderer.media_type)
+        if hasattr(items, '__aiter__'):
+            check_async_support('Streaming async iterables')
+        if isinstance(renderer, StandardNDJSONRenderer):
+            content = (aiter_ndjson if hasattr(items, '__aiter__') else iter_ndjson)(items, message, meta, renderer)
+        elif hasattr(items, '__aiter__'):
+            content = aiter_envelope(items, message, meta, renderer)
+        else:
+            content = iter_envelope(items, message, meta, renderer)
+        super().__init__(content, status=status, **kwargs)
+
+
+class StreamingListMixin:
+    """
+    List a queryset as a streamed standard envelope instead of a single rendered body.
+
+    Paginated views stream the current page with pagination metadata as the
+    trailer; unpaginated views stream the whole queryset from a database cursor.
+    Clients negotiating a binary format get a regular, non-streamed response.
+
+    Usage:
+        class ExportViewSet(StreamingListMixin, viewsets.GenericViewSet):
+            queryset = Order.objects.all()
+            serializer_class = OrderSerializer
+            pagination_class = None
+    """
+    # Rows fetched per database round trip for unpaginated querysets
+    stream_chunk_size = 2000
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        serializer = self.get_serializer()
+        renderer = getattr(request, 'accepted_renderer', None)
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.paginator.get_streaming_paginated_response(
+                iter_serialized(serializer, page), renderer=renderer
+            )
+
+        items = iter_serialized(serializer, queryset, self.stream_chunk_size)
+        if not can_stream(renderer):
+            return Response(list(items))
+        return StandardStreamingResponse(items, renderer=renderer)
+
+
+class _NDJSONWriter:
+    """
+    Incrementally encode NDJSON lines, shared by the sync and async generators.
+    """
+
+    def __init__(self, renderer, buffer_size):
+        self.renderer = renderer or StandardNDJSONRenderer()
+        self.buffer_size = buffer_size
+        self.buffer = []
+        self.pending = 0
+
+    def header(self, message, meta):
+        """Return the header line, evaluating a callable `meta`."""
+        if callable(meta):
+            meta = meta()
+        header = Envelope(success=True, message=get_message('success') if message is None else message)
+        if meta:
+            header['meta'] = meta
+        return header
+
+    def write(self, item):
+        """Add the line for `item`, returning a chunk once `buffer_size` bytes are pending."""
+        line = self.renderer.render_line(item)
+        self.buffer.append(line)
+        self.pending += len(line)
+        if self.pending >= self.buffer_size:
+            return self.flush()
+        return None
+
+    def flush(self):
+        chunk = b''.join(self.buffer)
+        self.buffer = []
+        self.pending = 0
+        return chunk
+
+
+def iter_ndjson(items, message=None, meta=None, renderer=None, buffer_size=65536):
+    """
+    Yield `items` as newline-delimited JSON, after an envelope header line.
+
+    Args:
+        items: An iterable of JSON-serializable items, one per line.
+        message: A human-readable success message; defaults to the `SUCCESS_MESSAGE` setting.
+        meta: Metadata for the header line, or a callable returning it. Unlike
+              `iter_envelope`, the header comes first, so a callable is invoked
+              before any item is emitted.
+        renderer: The `StandardNDJSONRenderer` used to encode each line.
+        buffer_size: Encoded lines are buffered until this many bytes are pending.
+
+    Yields:
+        bytes: Chunks which concatenate to the document `StandardNDJSONRenderer`
+               would render for the full envelope.
+    """
+    writer = _NDJSONWriter(renderer, buffer_size)
+    yield writer.renderer.render_header(writer.header(message, meta))
+    for item in items:
+        chunk = writer.write(item)
+        if chunk is not None:
+            yield chunk
+    yield writer.flush()
+
+
+async def aiter_ndjson(items, message=None, meta=None, renderer=None, buffer_size=65536):
+    """
+    Asynchronous counterpart of `iter_ndjson`, consuming an async iterable of items.
+
+    A callable `meta` may return an awaitable, which is awaited before the header is sent.
+    """
+    writer = _NDJSONWriter(renderer, buffer_size)
+    if callable(meta):
+        meta = meta()
+    if inspect.isawaitable(meta):
+        meta = await meta
+    yield writer.renderer.render_header(writer.header(message, meta))
+    async for item in items:
+        chunk = writer.write(item)
+        if chunk is not None:
+            yield chunk
+    yield writer.flush()
+
+
+class NDJSONStreamingResponse(StandardStreamingResponse):
+    """
+    A streaming response that emits items as newline-delimited JSON after an envelope header line.
+
+    Usage:
+        return NDJSONStreamingResponse(
+            iter_serialized(self.get_serializer(), queryset),
+            meta={'exported_at': timezone.now()},
+        )
+    """
+
+    def __init__(self, items, message=None, meta=None, status=200, renderer=None, **kwargs):
+        super().__init__(items, message, meta, status, renderer or StandardNDJSONRenderer(), **kwargs)
+
+
+class NDJSONExportMixin:
+    """
+    Stream the whole list as NDJSON when the client asks for `application/x-ndjson`.
+
+    Requests negotiating `StandardNDJSONRenderer` (with an `Accept` header or
+    `?format=ndjson`) bypass pagination: every row of the filtered queryset is
+    fetched from a database cursor and streamed as one line, in constant
+    memory and without a `COUNT(*)` query. Other formats are listed as usual.
+    `StandardNDJSONRenderer` is added to the view's renderers if missing.
+
+    Usage:
+        class EventViewSet(NDJSONExportMixin, viewsets.ReadOnlyModelViewSet):
+            queryset = Event.objects.order_by('pk')
+            serializer_class = EventSerializer
+    """
+    # Rows fetched per database round trip
+    stream_chunk_size = 2000
+
+    def get_renderers(self):
+        renderers = super().get_renderers()
+        if not any(isinstance(renderer, StandardNDJSONRenderer) for renderer in renderers):
+            renderers.append(StandardNDJSONRenderer())
+        return renderers
+
+    def get_ndjson_meta(self):
+        """
+        Return the metadata of the header line, or `None`.
+        """
+        return None
+
+    def list(self, request, *args, **kwargs):
+        renderer = getattr(request, 'accepted_renderer', None)
+        if not isinstance(renderer, StandardNDJSONRenderer):
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        return NDJSONStreamingResponse(
+            iter_serialized(self.get_serializer(), queryset, self.stream_chunk_size),
+            meta=self.get_ndjson_meta,
+            renderer=renderer,
+        )
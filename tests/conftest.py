@@ -0,0 +1,4 @@
+"""
+Shared pytest configuration for the test suite.
+"""
+pytest_plugins = ['drf_standardized_responses.pytest_plugin']
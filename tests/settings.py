@@ -20,6 +20,13 @@ ROOT_URLCONF = 'tests.urls'
 REST_FRAMEWORK = {
     'DEFAULT_RENDERER_CLASSES': [
         'drf_standardized_responses.renderers.StandardResponseRenderer',
+        'drf_standardized_responses.renderers.StandardMessagePackRenderer',
+        'drf_standardized_responses.renderers.StandardCBORRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'rest_framework.parsers.JSONParser',
+        'drf_standardized_responses.parsers.MessagePackParser',
+        'drf_standardized_responses.parsers.CBORParser',
     ],
     'DEFAULT_PAGINATION_CLASS': 'drf_standardized_responses.pagination.StandardPagination',
     'EXCEPTION_HANDLER': 'drf_standardized_responses.exceptions.standardized_exception_handler',
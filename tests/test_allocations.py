@@ -0,0 +1,145 @@
+"""
+Tests for the allocation profiling hooks.
+
+This module tests the peak and net measurements of allocation trackers, the
+X-Alloc-* headers and signal of the profiling mode, and allocation budgets.
+"""
+import tracemalloc
+
+import pytest
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from drf_standardized_responses.allocations import (
+    allocations_recorded,
+    assert_allocation_budget,
+    format_alloc_headers,
+    measure_allocations,
+    tracked,
+)
+from drf_standardized_responses.renderers import StandardResponseRenderer
+
+MEGABYTE = 1024 * 1024
+PROFILING = override_settings(STANDARDIZED_RESPONSES={'ALLOCATION_PROFILING': True})
+
+
+class TestMeasureAllocations:
+    """Tests for measure_allocations and assert_allocation_budget."""
+
+    def test_peak_and_net(self):
+        """Test that freed memory counts towards the peak but not the net allocations."""
+        with measure_allocations() as allocations:
+            kept = bytearray(MEGABYTE)
+            freed = bytearray(MEGABYTE)
+            del freed
+
+        assert allocations.peak >= 2 * MEGABYTE
+        assert MEGABYTE <= allocations.net < 2 * MEGABYTE
+        del kept
+
+    def test_nested_peaks(self):
+        """Test that an enclosing tracker includes the peak of nested trackers."""
+        with measure_allocations() as outer:
+            with measure_allocations() as inner:
+                buffer = bytearray(MEGABYTE)
+                del buffer
+
+        assert inner.peak >= MEGABYTE
+        assert outer.peak >= inner.peak
+
+    def test_stops_tracing_it_started(self):
+        """Test that tracing started by a tracker is stopped again."""
+        assert not tracemalloc.is_tracing()
+
+        with measure_allocations():
+            assert tracemalloc.is_tracing()
+
+        assert not tracemalloc.is_tracing()
+
+    def test_budget_exceeded(self):
+        """Test that exceeding a budget raises AssertionError."""
+        with pytest.raises(AssertionError, match='peak allocations'):
+            with assert_allocation_budget(peak=MEGABYTE // 2):
+                buffer = bytearray(MEGABYTE)
+                del buffer
+
+    def test_budget_met(self):
+        """Test that blocks within their budget pass."""
+        with assert_allocation_budget(peak=MEGABYTE, net=MEGABYTE):
+            sum(range(100))
+
+    def test_render_budget(self, allocation_budget):
+        """Test the allocation_budget fixture with a budget scaled from a smaller payload."""
+        small = [{'id': i, 'name': 'Item %d' % i} for i in range(100)]
+        large = [{'id': i, 'name': 'Item %d' % i} for i in range(1000)]
+        renderer = StandardResponseRenderer()
+        renderer.render(small)
+        renderer.render(large)
+
+        with measure_allocations() as baseline:
+            renderer.render(small)
+
+        # Absolute peaks differ between Python versions; they must grow linearly with the payload
+        with allocation_budget(peak=2 * 10 * baseline.peak, net=4096):
+            renderer.render(large)
+
+
+@pytest.mark.django_db
+class TestAllocationProfiling:
+    """Integration tests for the allocation profiling mode."""
+
+    def setup_method(self):
+        """Set up the test client."""
+        self.client = APIClient()
+
+    def test_disabled_by_default(self):
+        """Test that nothing is tracked unless enabled."""
+        response = self.client.get(reverse('paginated-view'))
+
+        assert not [header for header in response.headers if header.startswith('X-Alloc-')]
+        assert tracked(object(), 'render').__class__.__name__ == 'nullcontext'
+
+    @PROFILING
+    def test_headers_for_paginated_view(self):
+        """Test that the pagination and render stages are reported in X-Alloc-* headers."""
+        response = self.client.get(reverse('paginated-view'))
+
+        assert response['X-Alloc-Render'].startswith('peak=')
+        assert ', net=' in response['X-Alloc-Paginated-Response']
+
+    @PROFILING
+    def test_exception_handler_stage(self):
+        """Test that the exception handler stage is reported for error responses."""
+        response = self.client.get(reverse('error-view'))
+
+        assert response.status_code == 400
+        assert response.has_header('X-Alloc-Exception-Handler')
+        assert response.has_header('X-Alloc-Render')
+
+    @PROFILING
+    def test_signal(self):
+        """Test that allocations_recorded receives the stages as (peak, net) tuples."""
+        received = []
+
+        def receiver(sender, request, response, allocations, **kwargs):
+            received.append(allocations)
+
+        allocations_recorded.connect(receiver)
+        try:
+            self.client.get(reverse('paginated-view'))
+        finally:
+            allocations_recorded.disconnect(receiver)
+
+        assert set(received[0]) == {'paginated_response', 'render'}
+        peak, net = received[0]['render']
+        assert peak > 0 and isinstance(net, int)
+
+    def test_format_alloc_headers(self):
+        """Test the header names and values built from stage allocations."""
+        headers = format_alloc_headers({'render': (100, -5), 'exception_handler': (7, 0)})
+
+        assert headers == {
+            'X-Alloc-Render': 'peak=100, net=-5',
+            'X-Alloc-Exception-Handler': 'peak=7, net=0',
+        }
@@ -0,0 +1,107 @@
+"""
+Tests for the batch view mixin.
+
+This module tests that BatchMixin runs each sub-operation through the viewset's
+own actions and reports every outcome in a single batch envelope.
+"""
+import pytest
+from django.contrib.auth.models import Group, User
+from django.urls import reverse
+from rest_framework.test import APIClient, APIRequestFactory, force_authenticate
+
+from tests.urls import GroupBatchViewSet
+
+
+@pytest.mark.django_db
+class TestBatchMixin:
+    """Integration tests for BatchMixin."""
+
+    def setup_method(self):
+        """Set up the test client and an existing group."""
+        self.client = APIClient()
+        self.url = reverse('group-batch')
+        self.group = Group.objects.create(name="existing")
+
+    def test_mixed_operations(self):
+        """Test that each operation's outcome is reported in request order."""
+        response = self.client.post(self.url, [
+            {"action": "retrieve", "pk": self.group.pk},
+            {"action": "create", "data": {"name": "created"}},
+            {"action": "retrieve", "pk": 999},
+        ], format='json')
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is False
+        assert data["message"] == "Batch completed with errors"
+        assert data["meta"]["batch"] == {"total": 3, "succeeded": 2, "failed": 1}
+
+        retrieved, created, missing = data["data"]
+        assert retrieved == {
+            "success": True, "message": "Operation successful",
+            "data": {"id": self.group.pk, "name": "existing"}, "status": 200,
+        }
+        assert created["status"] == 201
+        assert created["data"]["name"] == "created"
+        # Errors are translated by the standardized exception handler
+        assert missing["success"] is False
+        assert missing["status"] == 404
+        assert missing["message"] == "No Group matches the given query."
+
+    def test_failed_operation_is_rolled_back(self):
+        """Test that a failing operation does not leave partial writes behind."""
+        response = self.client.post(self.url, [
+            {"action": "partial_update", "pk": self.group.pk, "data": {"name": ""}},
+            {"action": "destroy", "pk": self.group.pk},
+        ], format='json')
+
+        update, destroy = response.json()["data"]
+        assert update["status"] == 400
+        assert update["message"] == "Validation failed"
+        assert "name" in update["errors"]
+        assert destroy["status"] == 204
+        assert not Group.objects.exists()
+
+    def test_invalid_operations(self):
+        """Test that malformed operations fail individually."""
+        response = self.client.post(self.url, {"operations": [
+            {"action": "list"},
+            {"action": "retrieve"},
+            "nonsense",
+        ]}, format='json')
+
+        items = response.json()["data"]
+        assert [item["status"] for item in items] == [400, 400, 400]
+        assert "action" in items[0]["errors"]
+        assert "pk" in items[1]["errors"]
+
+    def test_too_many_operations(self):
+        """Test that batches larger than `batch_max_operations` are rejected."""
+        response = self.client.post(self.url, [{"action": "retrieve", "pk": 1}] * 6, format='json')
+
+        assert response.status_code == 400
+        assert "operations" in response.json()["errors"]
+
+    def test_all_succeeded(self):
+        """Test the envelope when every operation succeeds."""
+        response = self.client.post(self.url, [{"action": "retrieve", "pk": self.group.pk}], format='json')
+
+        data = response.json()
+        assert data["success"] is True
+        assert data["message"] == "Batch completed"
+
+    def test_sub_request_keeps_user_and_outer_data(self):
+        """Test that sub-requests are new Requests sharing the user but not the body."""
+        user = User.objects.create_user("batcher")
+        http_request = APIRequestFactory().post(self.url, [{"action": "create"}], format='json')
+        force_authenticate(http_request, user=user)
+        view = GroupBatchViewSet(action_map={'post': 'batch'})
+        request = view.initialize_request(http_request)
+        view.request = request
+
+        sub_request = view.get_batch_request(request, {"name": "sub"})
+
+        assert sub_request is not request
+        assert sub_request.data == {"name": "sub"}
+        assert request.data == [{"action": "create"}]
+        assert sub_request.user == user
@@ -0,0 +1,46 @@
+"""
+Smoke tests for the benchmark suite.
+
+These tests run every benchmark once to make sure the suite keeps working as
+the package evolves; they do not measure performance.
+"""
+import pytest
+
+from benchmarks import run as benchmarks
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('suite', benchmarks.SUITES, ids=lambda suite: suite.__name__)
+def test_benchmarks_run(suite):
+    """Test that every benchmark in a suite can be called."""
+    names = []
+    for name, func in suite():
+        func()
+        names.append(name)
+
+    assert names
+    assert len(names) == len(set(names))
+
+
+def test_measure():
+    """Test that measurements report throughput and allocations."""
+    result = benchmarks.measure(lambda: [0] * 1000, min_time=0.01)
+
+    assert result['ops_per_sec'] > 0
+    assert result['peak_bytes'] >= 8000
+
+
+def test_compare_flags_regressions():
+    """Test that only slowdowns beyond the threshold are reported."""
+    baseline = {'fast': {'ops_per_sec': 100.0}, 'slow': {'ops_per_sec': 100.0}}
+    results = {
+        'fast': {'ops_per_sec': 95.0},
+        'slow': {'ops_per_sec': 80.0},
+        'new': {'ops_per_sec': 1.0},
+    }
+
+    regressions = benchmarks.compare(results, baseline, threshold=10)
+
+    assert [name for name, change in regressions] == ['slow']
+    assert results['fast']['change_percent'] == pytest.approx(-5.0)
+    assert 'change_percent' not in results['new']
@@ -0,0 +1,189 @@
+"""
+Tests for the whole-response cache.
+
+This module tests that rendered envelopes are cached, served with strong
+ETags, answered with 304 on matching conditional requests and invalidated
+on demand.
+"""
+import pytest
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import translation
+from rest_framework.test import APIClient, APIRequestFactory
+
+from drf_standardized_responses.cache import (
+    ResponseCache,
+    get_namespace,
+    invalidate_response_cache,
+    is_cached_header,
+    make_etag,
+)
+from tests.urls import CachedListView, CachedView
+
+
+@pytest.mark.django_db
+class TestResponseCache:
+    """Integration tests for cache_response and CachedResponseMixin."""
+
+    def setup_method(self):
+        """Set up the test client and clear cached state."""
+        self.client = APIClient()
+        cache.clear()
+        CachedView.calls = 0
+        CachedListView.calls = 0
+
+    def test_cache_hit_skips_handler(self):
+        """Test that the second request is served from the cache."""
+        first = self.client.get(reverse('cached-view'))
+        second = self.client.get(reverse('cached-view'))
+
+        assert CachedView.calls == 1
+        assert first.content == second.content
+        assert second.json()["data"] == {"calls": 1}
+        assert second['Content-Type'] == 'application/json'
+
+    @override_settings(STANDARDIZED_RESPONSES={'TIMING': True, 'ALLOCATION_PROFILING': True})
+    def test_diagnostic_headers_are_not_cached(self):
+        """Test that timings and allocations of the request filling the cache are not replayed."""
+        first = self.client.get(reverse('cached-view'))
+        second = self.client.get(reverse('cached-view'))
+
+        assert first.has_header('Server-Timing') and first.has_header('X-Alloc-Render')
+        assert not second.has_header('Server-Timing')
+        assert not second.has_header('X-Alloc-Render')
+
+    def test_strong_etag(self):
+        """Test that responses carry a strong ETag derived from the content."""
+        response = self.client.get(reverse('cached-view'))
+
+        assert response['ETag'] == make_etag(response.content)
+        assert not response['ETag'].startswith('W/')
+
+    def test_if_none_match_returns_304(self):
+        """Test that matching conditional requests are answered with 304."""
+        etag = self.client.get(reverse('cached-view'))['ETag']
+
+        response = self.client.get(reverse('cached-view'), HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+        assert response.content == b''
+        assert response['ETag'] == etag
+
+    def test_stale_etag_returns_content(self):
+        """Test that a non-matching ETag returns the full response."""
+        response = self.client.get(reverse('cached-view'), HTTP_IF_NONE_MATCH='"stale"')
+
+        assert response.status_code == 200
+        assert response.json()["success"] is True
+
+    def test_key_includes_query_string(self):
+        """Test that different query strings are cached separately."""
+        self.client.get(reverse('cached-view') + '?a=1&b=2')
+        self.client.get(reverse('cached-view') + '?b=2&a=1')
+        self.client.get(reverse('cached-view') + '?a=2')
+
+        assert CachedView.calls == 2
+
+    def test_key_includes_accept_header(self):
+        """Test that different Accept headers are cached separately."""
+        self.client.get(reverse('cached-view'), HTTP_ACCEPT='application/json')
+        self.client.get(reverse('cached-view'), HTTP_ACCEPT='*/*')
+
+        assert CachedView.calls == 2
+
+    def test_key_includes_active_language(self):
+        """Test that responses rendered in different languages are cached separately."""
+        with translation.override('en'):
+            self.client.get(reverse('cached-view'))
+            self.client.get(reverse('cached-view'), HTTP_ACCEPT_LANGUAGE='de')
+        with translation.override('de'):
+            self.client.get(reverse('cached-view'))
+
+        assert CachedView.calls == 2
+
+    def test_key_includes_user(self):
+        """Test that responses are not shared between users."""
+        alice = User.objects.create(username='alice')
+        bob = User.objects.create(username='bob')
+
+        self.client.force_authenticate(alice)
+        self.client.get(reverse('cached-view'))
+        self.client.force_authenticate(bob)
+        self.client.get(reverse('cached-view'))
+        self.client.force_authenticate(alice)
+        self.client.get(reverse('cached-view'))
+
+        assert CachedView.calls == 2
+
+    def test_error_responses_are_not_cached(self):
+        """Test that unsuccessful responses always reach the handler."""
+        self.client.get(reverse('cached-view') + '?fail=1')
+        response = self.client.get(reverse('cached-view') + '?fail=1')
+
+        assert CachedView.calls == 2
+        assert response.status_code == 400
+        assert not response.has_header('ETag')
+
+    def test_invalidate_response_cache(self):
+        """Test that invalidating a namespace forces a fresh response."""
+        self.client.get(reverse('cached-view'))
+        invalidate_response_cache(CachedView)
+        response = self.client.get(reverse('cached-view'))
+
+        assert CachedView.calls == 2
+        assert response.json()["data"] == {"calls": 2}
+
+    def test_invalidation_is_scoped_to_namespace(self):
+        """Test that invalidating one view leaves other views cached."""
+        self.client.get(reverse('cached-view'))
+        invalidate_response_cache(CachedListView)
+        self.client.get(reverse('cached-view'))
+
+        assert CachedView.calls == 1
+
+    def test_mixin_caches_list(self):
+        """Test that CachedResponseMixin caches the list action."""
+        first = self.client.get(reverse('cached-list-view'))
+        second = self.client.get(reverse('cached-list-view'))
+
+        assert CachedListView.calls == 1
+        assert second.json()["meta"]["pagination"]["count"] == 30
+        assert first['ETag'] == second['ETag']
+
+    def test_mixin_invalidates_on_write(self):
+        """Test that successful unsafe requests invalidate the view's namespace."""
+        self.client.get(reverse('cached-list-view'))
+        self.client.post(reverse('cached-list-view'))
+        self.client.get(reverse('cached-list-view'))
+
+        assert CachedListView.calls == 2
+
+
+class TestCacheHelpers:
+    """Tests for the cache helper functions."""
+
+    def test_get_namespace(self):
+        """Test namespaces derived from classes, instances and strings."""
+        assert get_namespace(CachedView) == 'tests.urls.CachedView'
+        assert get_namespace(CachedView()) == 'tests.urls.CachedView'
+        assert get_namespace('catalog') == 'catalog'
+
+    def test_is_cached_header(self):
+        """Test which response headers are stored in cache entries."""
+        assert is_cached_header('Content-Type')
+        assert is_cached_header('ETag')
+        assert not is_cached_header('Vary')
+        assert not is_cached_header('Server-Timing')
+        assert not is_cached_header('X-Alloc-Paginated-Response')
+
+    def test_cache_key_components(self):
+        """Test that only the configured components affect the cache key."""
+        factory = APIRequestFactory()
+        response_cache = ResponseCache(key_components=('path',))
+
+        first = response_cache.get_cache_key(factory.get('/items/?page=1'), CachedView())
+        second = response_cache.get_cache_key(factory.get('/items/?page=2'), CachedView())
+
+        assert first == second
@@ -0,0 +1,241 @@
+"""
+Tests for response compression.
+
+This module tests Accept-Encoding negotiation, compression of regular and
+streaming responses, and the compressed variants stored by the response cache.
+"""
+import gzip
+import json
+import zlib
+
+import django
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from drf_standardized_responses import compression
+from drf_standardized_responses.compression import (
+    CompressionMiddleware,
+    compress_response,
+    negotiate_encoding,
+    parse_accept_encoding,
+)
+from tests.urls import CachedView
+
+PAYLOAD = json.dumps({"data": ["item-%d" % i for i in range(500)]}).encode()
+
+
+class FakeCodec:
+    """A stand-in for an optional codec whose library is not installed."""
+    default_level = 1
+
+    def compress(self, content, level):
+        return b'fake:' + content[:10]
+
+
+class TestNegotiation:
+    """Tests for Accept-Encoding parsing and negotiation."""
+
+    def setup_method(self):
+        """Set up the request factory."""
+        self.factory = RequestFactory()
+
+    def negotiate(self, header):
+        """Negotiate the encoding for an Accept-Encoding header."""
+        return negotiate_encoding(self.factory.get('/', HTTP_ACCEPT_ENCODING=header))
+
+    def test_parse_accept_encoding(self):
+        """Test that quality values default to 1 and invalid ones to 0."""
+        assert parse_accept_encoding('gzip;q=0.5, BR, zstd;q=x') == {'gzip': 0.5, 'br': 1.0, 'zstd': 0.0}
+
+    def test_gzip(self, monkeypatch):
+        """Test that gzip is chosen when it is the only supported encoding."""
+        monkeypatch.setitem(compression.CODECS, 'br', None)
+        monkeypatch.setitem(compression.CODECS, 'zstd', None)
+
+        assert self.negotiate('gzip, deflate') == 'gzip'
+        assert self.negotiate('*') == 'gzip'
+        assert self.negotiate('gzip;q=0, deflate') is None
+        assert self.negotiate('') is None
+
+    def test_missing_library_is_skipped(self, monkeypatch):
+        """Test that encodings without an installed library are never chosen."""
+        monkeypatch.setitem(compression.CODECS, 'br', None)
+
+        assert self.negotiate('br, gzip') == 'gzip'
+
+    def test_server_preference_breaks_ties(self, monkeypatch):
+        """Test that client quality wins and the settings order breaks ties."""
+        monkeypatch.setitem(compression.CODECS, 'br', FakeCodec())
+
+        assert self.negotiate('gzip, br') == 'br'
+        assert self.negotiate('gzip, br;q=0.5') == 'gzip'
+
+    def test_unknown_encoding(self):
+        """Test that unsupported encodings in the settings are rejected."""
+        with pytest.raises(ImproperlyConfigured):
+            with override_settings(STANDARDIZED_RESPONSES={'COMPRESSION_ENCODINGS': ('deflate',)}):
+                self.negotiate('gzip')
+
+
+class TestCompressResponse:
+    """Tests for compress_response and CompressionMiddleware."""
+
+    def setup_method(self):
+        """Set up a gzip-accepting request."""
+        self.request = RequestFactory().get('/', HTTP_ACCEPT_ENCODING='gzip')
+
+    def test_compresses_large_json(self):
+        """Test that large JSON bodies are gzipped with updated headers."""
+        response = HttpResponse(PAYLOAD, content_type='application/json')
+        response['ETag'] = '"abc"'
+
+        compress_response(self.request, response)
+
+        assert response['Content-Encoding'] == 'gzip'
+        assert response['Vary'] == 'Accept-Encoding'
+        assert response['ETag'] == 'W/"abc"'
+        assert int(response['Content-Length']) == len(response.content)
+        assert gzip.decompress(response.content) == PAYLOAD
+
+    def test_small_responses_are_unchanged(self):
+        """Test that bodies below COMPRESSION_MIN_SIZE are sent as is."""
+        response = compress_response(self.request, HttpResponse(b'{}', content_type='application/json'))
+
+        assert not response.has_header('Content-Encoding')
+        assert response['Vary'] == 'Accept-Encoding'
+
+    def test_skips_incompressible_responses(self):
+        """Test that binary and already-encoded responses are left alone."""
+        image = compress_response(self.request, HttpResponse(PAYLOAD, content_type='image/png'))
+        encoded = HttpResponse(PAYLOAD, content_type='application/json')
+        encoded['Content-Encoding'] = 'br'
+        compress_response(self.request, encoded)
+
+        assert not image.has_header('Content-Encoding')
+        assert encoded.content == PAYLOAD
+
+    def test_skips_html(self):
+        """Test that HTML is left to GZipMiddleware and its BREACH mitigation."""
+        response = compress_response(self.request, HttpResponse(PAYLOAD, content_type='text/html; charset=utf-8'))
+
+        assert not response.has_header('Content-Encoding')
+        assert response.content == PAYLOAD
+
+    def test_compresses_json_subtypes(self):
+        """Test that NDJSON and +json media types are compressed."""
+        for content_type in ('application/x-ndjson', 'application/problem+json'):
+            response = compress_response(self.request, HttpResponse(PAYLOAD, content_type=content_type))
+
+            assert response['Content-Encoding'] == 'gzip'
+
+    @override_settings(STANDARDIZED_RESPONSES={'COMPRESSION_LEVELS': {'gzip': 1}})
+    def test_compression_level(self):
+        """Test that the configured level is used."""
+        response = compress_response(self.request, HttpResponse(PAYLOAD, content_type='application/json'))
+
+        assert response.content == gzip.compress(PAYLOAD, compresslevel=1, mtime=0)
+
+    def test_streaming_response(self):
+        """Test that streaming responses are compressed chunk by chunk."""
+        response = StreamingHttpResponse(iter([PAYLOAD[:100], PAYLOAD[100:]]), content_type='application/json')
+
+        compress_response(self.request, response)
+        chunks = list(response.streaming_content)
+
+        assert response['Content-Encoding'] == 'gzip'
+        assert len(chunks) == 3
+        assert zlib.decompress(b''.join(chunks), 16 + zlib.MAX_WBITS) == PAYLOAD
+
+    @pytest.mark.skipif(django.VERSION < (4, 2), reason="async streaming requires Django 4.2 or later")
+    def test_async_streaming_response(self):
+        """Test that async streaming responses stay async."""
+        async def content():
+            yield PAYLOAD
+
+        async def collect(stream):
+            return [chunk async for chunk in stream]
+
+        response = StreamingHttpResponse(content(), content_type='application/json')
+        compress_response(self.request, response)
+
+        assert response.is_async
+        body = b''.join(async_to_sync(collect)(response.streaming_content))
+        assert gzip.decompress(body) == PAYLOAD
+
+    @pytest.mark.parametrize('encoding, module, decompress', [
+        ('br', 'brotli', lambda module, data: module.decompress(data)),
+        ('zstd', 'zstandard', lambda module, data: module.ZstdDecompressor().decompressobj().decompress(data)),
+    ])
+    def test_optional_encodings(self, encoding, module, decompress):
+        """Test Brotli and Zstandard for regular and streaming responses when installed."""
+        module = pytest.importorskip(module)
+        request = RequestFactory().get('/', HTTP_ACCEPT_ENCODING=encoding)
+
+        response = compress_response(request, HttpResponse(PAYLOAD, content_type='application/json'))
+        streaming = compress_response(
+            request, StreamingHttpResponse(iter([PAYLOAD[:100], PAYLOAD[100:]]), content_type='application/json')
+        )
+
+        assert response['Content-Encoding'] == encoding
+        assert decompress(module, response.content) == PAYLOAD
+        assert decompress(module, b''.join(streaming.streaming_content)) == PAYLOAD
+
+    def test_middleware(self):
+        """Test that the middleware compresses the view's response."""
+        middleware = CompressionMiddleware(lambda request: HttpResponse(PAYLOAD, content_type='application/json'))
+
+        response = middleware(self.request)
+
+        assert gzip.decompress(response.content) == PAYLOAD
+
+
+CACHE_COMPRESSION = override_settings(
+    STANDARDIZED_RESPONSES={'RESPONSE_CACHE_COMPRESSION': True, 'COMPRESSION_MIN_SIZE': 0}
+)
+
+
+@pytest.mark.django_db
+class TestCachedVariants:
+    """Tests for compressed variants in the response cache."""
+
+    def setup_method(self):
+        """Set up the test client and clear cached state."""
+        self.client = APIClient()
+        cache.clear()
+        CachedView.calls = 0
+        self.url = reverse('cached-view') + '?large=1'
+
+    @CACHE_COMPRESSION
+    def test_variant_is_compressed_once(self, monkeypatch):
+        """Test that repeated requests reuse the cached compressed bytes."""
+        calls = []
+        original = compression.compress
+        monkeypatch.setattr(compression, 'compress', lambda *args: calls.append(args) or original(*args))
+
+        first = self.client.get(self.url, HTTP_ACCEPT_ENCODING='gzip')
+        second = self.client.get(self.url, HTTP_ACCEPT_ENCODING='gzip')
+        plain = self.client.get(self.url)
+
+        assert len(calls) == 1
+        assert first.content == second.content
+        assert second['Content-Encoding'] == 'gzip'
+        assert 'Accept-Encoding' in second['Vary']
+        assert json.loads(gzip.decompress(second.content)) == plain.json()
+        assert not plain.has_header('Content-Encoding')
+        assert CachedView.calls == 1
+
+    @CACHE_COMPRESSION
+    def test_conditional_request_matches_compressed_variant(self):
+        """Test that the weak ETag of a compressed variant still yields 304."""
+        etag = self.client.get(self.url, HTTP_ACCEPT_ENCODING='gzip')['ETag']
+
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING='gzip', HTTP_IF_NONE_MATCH=etag)
+
+        assert etag.startswith('W/')
+        assert response.status_code == 304
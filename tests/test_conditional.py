@@ -0,0 +1,144 @@
+"""
+Tests for conditional requests on paginated list endpoints.
+
+This module tests that ConditionalListMixin answers 304 from page-level
+validators before any serializer runs.
+"""
+import datetime
+import time
+
+import pytest
+from django.contrib.auth.models import User
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.http import http_date
+from rest_framework.test import APIClient
+
+from drf_standardized_responses.pagination import StandardPagination
+from tests.urls import LastLoginPagination, UserSerializer
+
+
+@pytest.mark.django_db
+class TestConditionalListMixin:
+    """Integration tests for ConditionalListMixin."""
+
+    def setup_method(self):
+        """Set up the test client and some users."""
+        self.client = APIClient()
+        self.url = reverse('conditional-users-view')
+        self.now = timezone.now().replace(microsecond=0)
+        User.objects.bulk_create([
+            User(username='user-%02d' % i, last_login=self.now - datetime.timedelta(days=i))
+            for i in range(15)
+        ])
+        UserSerializer.serialized = 0
+
+    def test_validators_are_sent(self):
+        """Test that pages carry a weak ETag and no Last-Modified header."""
+        response = self.client.get(self.url)
+
+        assert response.status_code == 200
+        assert response['ETag'].startswith('W/"')
+        assert not response.has_header('Last-Modified')
+        assert len(response.json()["data"]) == 10
+
+    def test_if_none_match_skips_serializer(self):
+        """Test that a matching ETag is answered with 304 without serializing."""
+        etag = self.client.get(self.url)['ETag']
+        UserSerializer.serialized = 0
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+        assert response['ETag'] == etag
+        assert UserSerializer.serialized == 0
+
+    def test_if_modified_since_is_ignored(self):
+        """Test that If-Modified-Since alone never yields a 304, even when a row left the page."""
+        User.objects.filter(username='user-00').delete()
+        since = http_date(time.time() + 3600)
+
+        response = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=since)
+
+        assert response.status_code == 200
+
+    def test_deletion_changes_etag(self):
+        """Test that removing a row from the page changes the ETag."""
+        etag = self.client.get(self.url)['ETag']
+        User.objects.filter(username='user-02').delete()
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert response['ETag'] != etag
+
+    def test_modification_changes_etag(self):
+        """Test that updating an item on the page changes the ETag."""
+        etag = self.client.get(self.url)['ETag']
+        User.objects.filter(username='user-03').update(last_login=self.now + datetime.timedelta(hours=1))
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert response['ETag'] != etag
+
+    def test_change_on_other_page_changes_etag(self):
+        """Test that deleting an item on another page changes the ETag."""
+        etag = self.client.get(self.url)['ETag']
+        User.objects.filter(username='user-14').delete()
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+
+    def test_no_etag_for_models_without_field(self, monkeypatch):
+        """Test that models lacking `last_modified_field` are served without an ETag."""
+        monkeypatch.setattr(LastLoginPagination, 'last_modified_field', 'updated_at')
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH='*')
+
+        assert response.status_code == 200
+        assert not response.has_header('ETag')
+        assert len(response.json()["data"]) == 10
+
+    def test_pages_have_distinct_etags(self):
+        """Test that different pages produce different ETags."""
+        first = self.client.get(self.url)['ETag']
+        second = self.client.get(self.url + '?page=2')['ETag']
+
+        assert first != second
+
+
+class TestPageValidators:
+    """Tests for the pagination helpers behind ConditionalListMixin."""
+
+    def setup_method(self):
+        """Set up the test environment."""
+        self.pagination = StandardPagination()
+        self.pagination.get_pagination_meta = lambda: {'current_page': 1}
+
+    def test_last_modified_from_dicts(self):
+        """Test that modification times are read from dict items."""
+        page = [{'id': 1, 'updated_at': 5}, {'id': 2, 'updated_at': 9}, {'id': 3}]
+
+        assert self.pagination.get_page_last_modified(page) == 9
+
+    def test_last_modified_disabled(self):
+        """Test that an empty `last_modified_field` reports no modification time and no ETag."""
+        self.pagination.last_modified_field = None
+
+        assert self.pagination.get_page_last_modified([{'updated_at': 1}]) is None
+        assert self.pagination.get_page_etag([{'id': 1, 'updated_at': 1}]) is None
+
+    def test_no_etag_without_modification_field(self):
+        """Test that items lacking `last_modified_field` get no ETag, as edits would go unnoticed."""
+        assert self.pagination.get_page_etag([{'id': 1}, {'id': 2}]) is None
+        assert self.pagination.get_page_etag([{'id': 1, 'updated_at': 1}, {'id': 2}]) is None
+        assert self.pagination.get_page_etag([object()]) is None
+
+    def test_etag_is_stable(self):
+        """Test that identical pages produce identical ETags."""
+        page = [{'id': 1, 'updated_at': 1}, {'id': 2, 'updated_at': 2}]
+
+        assert self.pagination.get_page_etag(page) == self.pagination.get_page_etag(list(page))
+        assert self.pagination.get_page_etag(page) != self.pagination.get_page_etag(page[:1])
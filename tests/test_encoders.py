@@ -0,0 +1,238 @@
+"""
+Tests for the JSON encoding backends.
+
+This module is a differential test suite: every backend must produce exactly
+the bytes that DRF's JSONRenderer produces for the same data.
+"""
+import datetime
+import decimal
+import enum
+import ipaddress
+import random
+import uuid
+
+import pytest
+import rest_framework
+from django.contrib.auth.models import Group
+from django.core.exceptions import ImproperlyConfigured
+from django.test import override_settings
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ErrorDetail
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.serializer_helpers import ReturnDict, ReturnList
+
+from drf_standardized_responses import encoders
+from drf_standardized_responses.encoders import get_json_backend, orjson_dumps, stdlib_dumps
+from drf_standardized_responses.renderers import StandardResponseRenderer
+
+requires_orjson = pytest.mark.skipif(encoders.orjson is None, reason="orjson is not installed")
+
+
+class Color(enum.Enum):
+    """A plain enum, which DRF's JSONEncoder cannot encode."""
+    RED = "red"
+
+
+class Size(enum.IntEnum):
+    """An int enum, encoded as its value."""
+    LARGE = 3
+
+
+class Flavour(str, enum.Enum):
+    """A str enum, encoded as its value."""
+    VANILLA = "vanilla"
+
+
+SAMPLES = [
+    None,
+    True,
+    0,
+    -1,
+    2 ** 63,
+    2 ** 64,
+    -(2 ** 70),
+    0.1,
+    -0.0,
+    1e16,
+    1e-7,
+    5e-05,
+    1.5e-05,
+    1.5e-300,
+    float("nan"),
+    123456789.123,
+    "",
+    "plain",
+    "café 中文 \U0001F600",
+    "line\u2028separator\u2029",
+    "control \x00\x1f\x7f \"quoted\" \\ /slash",
+    "a 1e-5, b",
+    [],
+    {},
+    (1, 2, 3),
+    {1: "int key", "b": [1, {"c": None}]},
+    decimal.Decimal("12.50"),
+    decimal.Decimal("0.00005"),
+    datetime.datetime(2024, 1, 2, 3, 4, 5, 678901),
+    datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc),
+    datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone(datetime.timedelta(hours=3))),
+    datetime.date(2024, 1, 2),
+    datetime.time(3, 4, 5, 6),
+    datetime.timedelta(days=1, seconds=5),
+    uuid.UUID("12345678-1234-5678-1234-567812345678"),
+    b"bytes",
+    gettext_lazy("Operation successful"),
+    ErrorDetail("This field is required.", code="required"),
+    ReturnDict({"name": [ErrorDetail("Invalid", code="invalid")]}, serializer=None),
+    ReturnList([{"id": 1}, {"id": 2}], serializer=None),
+    Size.LARGE,
+    Flavour.VANILLA,
+    {Size.LARGE: "int enum key"},
+]
+
+if tuple(int(part) for part in rest_framework.VERSION.split('.')[:2]) >= (3, 17):
+    # DRF's JSONEncoder encodes IP addresses since 3.17
+    SAMPLES.append(ipaddress.ip_address("192.168.0.1"))
+
+FINITE_SAMPLES = [value for value in SAMPLES if not (isinstance(value, float) and value != value)]
+
+
+def reference(data, **kwargs):
+    """Render `data` with DRF's own JSONRenderer."""
+    return JSONRenderer().render(data, **kwargs)
+
+
+def outcome(func, *args, **kwargs):
+    """Return the result of calling `func`, or the type of the exception it raised."""
+    try:
+        return func(*args, **kwargs)
+    except (TypeError, ValueError) as exc:
+        return type(exc)
+
+
+class TestBackendSelection:
+    """Tests for resolving backends by name."""
+
+    def test_json_backend(self):
+        """Test that 'json' always selects the standard library."""
+        assert get_json_backend('json') is stdlib_dumps
+
+    def test_auto_backend(self):
+        """Test that 'auto' prefers orjson when it is available."""
+        expected = orjson_dumps if encoders.orjson is not None else stdlib_dumps
+        assert get_json_backend('auto') is expected
+
+    def test_unknown_backend(self):
+        """Test that unknown backends are reported as a configuration error."""
+        with pytest.raises(ImproperlyConfigured):
+            get_json_backend('simplejson')
+
+    def test_missing_orjson(self, monkeypatch):
+        """Test that requesting orjson without it installed is a configuration error."""
+        monkeypatch.setattr(encoders, 'orjson', None)
+        get_json_backend.cache_clear()
+        try:
+            with pytest.raises(ImproperlyConfigured):
+                get_json_backend('orjson')
+        finally:
+            get_json_backend.cache_clear()
+
+    @override_settings(STANDARDIZED_RESPONSES={'JSON_BACKEND': 'auto'})
+    def test_renderer_reads_setting(self, monkeypatch):
+        """Test that the renderer uses the backend named in the settings."""
+        calls = []
+
+        def fake_backend(data, *args, **kwargs):
+            calls.append(data)
+            return b'{}'
+
+        monkeypatch.setattr(
+            'drf_standardized_responses.renderers.get_json_backend',
+            lambda name: calls.append(name) or fake_backend
+        )
+
+        StandardResponseRenderer().render_json({"a": 1})
+
+        assert calls == ['auto', {"a": 1}]
+
+
+@pytest.mark.parametrize('dumps', [stdlib_dumps, pytest.param(orjson_dumps, marks=requires_orjson)])
+class TestDifferential:
+    """Tests that backends are byte-identical to DRF's JSONRenderer."""
+
+    @pytest.mark.parametrize('data', SAMPLES[1:], ids=repr)
+    def test_sample(self, dumps, data):
+        """Test each sample value on its own."""
+        assert outcome(dumps, data, JSONRenderer.encoder_class) == outcome(reference, data)
+
+    def test_all_samples_nested(self, dumps):
+        """Test every finite sample value inside a single nested structure."""
+        data = {"items": FINITE_SAMPLES, "nested": {"deeper": [FINITE_SAMPLES, {"k": FINITE_SAMPLES}]}}
+        assert dumps(data, JSONRenderer.encoder_class) == reference(data)
+
+    @pytest.mark.parametrize('value', [float("nan"), float("inf"), -float("inf"), decimal.Decimal("NaN")], ids=repr)
+    def test_non_finite(self, dumps, value):
+        """Test that non-finite floats raise unless allowed, and are then written like the standard library."""
+        data = {"a": None, "nested": [{"b": value}]}
+
+        with pytest.raises(ValueError):
+            dumps(data, JSONRenderer.encoder_class)
+        assert dumps(data, JSONRenderer.encoder_class, allow_nan=True) == stdlib_dumps(
+            data, JSONRenderer.encoder_class, allow_nan=True
+        )
+
+    def test_small_floats(self, dumps):
+        """Test floats between 1e-5 and 1e-4, which orjson writes positionally."""
+        rng = random.Random(4321)
+        data = [rng.uniform(1e-5, 1e-4) for _ in range(100)] + [1e-5, 9.99e-5, 1e-4]
+        assert dumps(data, JSONRenderer.encoder_class) == reference(data)
+
+    def test_random_floats(self, dumps):
+        """Test float formatting across a wide range of magnitudes."""
+        rng = random.Random(1234)
+        data = [rng.uniform(-1, 1) * 10 ** rng.randint(-30, 30) for _ in range(2000)]
+        assert dumps(data, JSONRenderer.encoder_class) == reference(data)
+
+    def test_pretty_printed(self, dumps):
+        """Test indented output."""
+        data = {"a": [1, {"b": "c"}]}
+        expected = reference(data, accepted_media_type='application/json; indent=4')
+        assert dumps(data, JSONRenderer.encoder_class, indent=4, separators=(',', ': ')) == expected
+
+    def test_ascii_only(self, dumps):
+        """Test ASCII-escaped output."""
+        renderer = JSONRenderer()
+        renderer.ensure_ascii = True
+        data = {"name": "café"}
+        assert dumps(data, JSONRenderer.encoder_class, ensure_ascii=True) == renderer.render(data)
+
+    @pytest.mark.parametrize('data', [
+        Color.RED, {"color": Color.RED}, [1, (2, Color.RED)], {Color.RED: 1},
+    ], ids=repr)
+    def test_plain_enum(self, dumps, data):
+        """Test that plain enums go through the encoder's default(), like the standard library."""
+        assert outcome(dumps, data, JSONRenderer.encoder_class) == outcome(reference, data) == TypeError
+
+    def test_unserializable(self, dumps):
+        """Test that unserializable values raise a TypeError."""
+        with pytest.raises(TypeError):
+            dumps({"obj": object()}, JSONRenderer.encoder_class)
+
+    @pytest.mark.django_db
+    def test_queryset(self, dumps):
+        """Test that querysets are encoded as sequences."""
+        Group.objects.create(name="admins")
+        data = {"names": Group.objects.values_list("name", flat=True)}
+        assert dumps(data, JSONRenderer.encoder_class) == reference(data)
+
+
+@requires_orjson
+@pytest.mark.parametrize('backend', ['json', 'orjson'])
+def test_renderer_output_matches_across_backends(backend):
+    """Test that StandardResponseRenderer output does not depend on the backend."""
+    renderer = StandardResponseRenderer()
+    data = {"items": FINITE_SAMPLES}
+
+    expected = StandardResponseRenderer().render(data, None, {})
+    renderer.json_backend = backend
+
+    assert renderer.render(data, None, {}) == expected
@@ -0,0 +1,256 @@
+"""
+Tests for bounded logging of unhandled exceptions.
+
+This module tests deduplication keys, rate limiting, sampling and summaries
+of the exception log limiter, and the non-blocking queue handler.
+"""
+import logging
+import threading
+import time
+from queue import Queue
+
+from django.test import override_settings
+from rest_framework.test import APIRequestFactory
+
+from drf_standardized_responses import exception_logging
+from drf_standardized_responses.exception_logging import (
+    ExceptionLogLimiter,
+    NonBlockingQueueHandler,
+    describe_key,
+    exception_key,
+    install_exception_log_queue,
+    log_exception,
+)
+from drf_standardized_responses.exceptions import standardized_exception_handler
+
+
+def raise_value_error():
+    """Raise a ValueError from a fixed frame."""
+    raise ValueError("boom")
+
+
+def caught(func):
+    """Return the exception raised by `func`."""
+    try:
+        func()
+    except Exception as exc:
+        return exc
+
+
+class TestExceptionKey:
+    """Tests for deduplication keys."""
+
+    def test_key_uses_type_and_raising_frame(self):
+        """Test that occurrences from the same frame share a key."""
+        first = exception_key(caught(raise_value_error))
+        second = exception_key(caught(raise_value_error))
+
+        assert first == second
+        assert first[0] == 'ValueError'
+        assert first[3] == 'raise_value_error'
+        assert describe_key(first).startswith('ValueError at test_exception_logging.py:')
+
+    def test_key_without_traceback(self):
+        """Test that exceptions that were never raised are keyed by type."""
+        assert exception_key(KeyError()) == ('KeyError', None, None, None)
+
+
+class TestExceptionLogLimiter:
+    """Tests for ExceptionLogLimiter."""
+
+    def test_rate_limit_per_key(self, monkeypatch):
+        """Test that each key is logged `rate` times per period."""
+        clock = [100.0]
+        monkeypatch.setattr(exception_logging, 'monotonic', lambda: clock[0])
+        limiter = ExceptionLogLimiter(rate=2, period=10)
+
+        assert [limiter.should_log('a') for _ in range(4)] == [True, True, False, False]
+        assert limiter.should_log('b') is True
+
+        # A new window starts after the period
+        clock[0] += 10
+        assert limiter.should_log('a') is True
+
+    def test_rate_overrides(self):
+        """Test that exception types can have their own rate."""
+        limiter = ExceptionLogLimiter(rate=5, rate_overrides={'ConnectionError': 0})
+
+        assert limiter.should_log(('ConnectionError', None, None, None)) is False
+        assert limiter.should_log(('ValueError', None, None, None)) is True
+
+    def test_sampling(self, monkeypatch):
+        """Test that occurrences are sampled before rate limiting."""
+        samples = iter([0.1, 0.9, 0.4])
+        monkeypatch.setattr(exception_logging.random, 'random', lambda: next(samples))
+        limiter = ExceptionLogLimiter(sample_rate=0.5)
+
+        assert [limiter.should_log('a') for _ in range(3)] == [True, False, True]
+
+    def test_summaries(self, monkeypatch):
+        """Test that suppressed counts are reported once per interval."""
+        clock = [0.0]
+        monkeypatch.setattr(exception_logging, 'monotonic', lambda: clock[0])
+        limiter = ExceptionLogLimiter(rate=1, summary_interval=60)
+        for _ in range(5):
+            limiter.should_log('a')
+
+        assert limiter.pop_summaries() == []
+        clock[0] = 60.0
+        assert limiter.pop_summaries() == [('a', 4, 60.0)]
+        assert limiter.pop_summaries() == []
+
+    def test_scheduled_summaries(self):
+        """Test that suppressed counts are reported on a timer once the interval has elapsed."""
+        limiter = ExceptionLogLimiter(rate=1, summary_interval=0.01)
+        for _ in range(3):
+            limiter.should_log('a')
+        reported = []
+        done = threading.Event()
+
+        limiter.schedule_summaries(lambda summaries: (reported.extend(summaries), done.set()))
+
+        assert done.wait(5)
+        assert [(key, count) for key, count, elapsed in reported] == [('a', 2)]
+        assert limiter.timer is None
+
+    def test_scheduled_summaries_can_be_cancelled(self):
+        """Test that cancelling drops the pending timer."""
+        limiter = ExceptionLogLimiter(rate=1, summary_interval=60)
+        limiter.schedule_summaries(lambda summaries: None)
+        timer = limiter.timer
+
+        limiter.cancel_summaries()
+
+        assert limiter.timer is None
+        assert timer.finished.is_set()
+
+    def test_keys_are_bounded(self):
+        """Test that the least recently seen keys are evicted."""
+        limiter = ExceptionLogLimiter(rate=1, max_keys=2)
+        for key in 'abc':
+            limiter.should_log(key)
+
+        assert list(limiter.windows) == ['b', 'c']
+
+
+class TestHandlerLogging:
+    """Tests for the exception handler's use of the limiter."""
+
+    def handle(self):
+        """Run the handler for an unhandled exception."""
+        context = {'request': APIRequestFactory().get('/')}
+        return standardized_exception_handler(caught(raise_value_error), context)
+
+    def test_unlimited_by_default(self, caplog):
+        """Test that every occurrence is logged without EXCEPTION_LOG_RATE."""
+        with caplog.at_level(logging.ERROR, logger='drf_standardized_responses.exceptions'):
+            for _ in range(3):
+                self.handle()
+
+        assert len(caplog.records) == 3
+
+    @override_settings(STANDARDIZED_RESPONSES={
+        'EXCEPTION_LOG_RATE': 1, 'EXCEPTION_LOG_PERIOD': 3600, 'EXCEPTION_LOG_SUMMARY_INTERVAL': 60,
+    })
+    def test_duplicates_are_suppressed_and_summarized(self, caplog, monkeypatch):
+        """Test that repeated tracebacks are suppressed and reported as a summary."""
+        clock = [0.0]
+        monkeypatch.setattr(exception_logging, 'monotonic', lambda: clock[0])
+        with caplog.at_level(logging.WARNING, logger='drf_standardized_responses.exceptions'):
+            for _ in range(2):
+                self.handle()
+            clock[0] = 60.0
+            response = self.handle()
+
+        assert response.status_code == 500
+        errors = [record for record in caplog.records if record.levelno == logging.ERROR]
+        summaries = [record.getMessage() for record in caplog.records if record.levelno == logging.WARNING]
+        assert len(errors) == 1
+        assert errors[0].exc_info is not None
+        assert summaries == [
+            'Suppressed 1 occurrences of %s in the last 60s' % describe_key(exception_key(caught(raise_value_error)))
+        ]
+
+    @override_settings(STANDARDIZED_RESPONSES={'EXCEPTION_LOG_RATE': 1, 'EXCEPTION_LOG_SUMMARY_INTERVAL': 0.01})
+    def test_summary_without_further_exceptions(self, caplog):
+        """Test that suppressed occurrences are summarized even if no exception follows them."""
+        with caplog.at_level(logging.WARNING, logger='drf_standardized_responses.exceptions'):
+            self.handle()
+            self.handle()
+            deadline = time.monotonic() + 5
+            while not any(record.levelno == logging.WARNING for record in caplog.records):
+                assert time.monotonic() < deadline
+                time.sleep(0.01)
+
+        summaries = [record.getMessage() for record in caplog.records if record.levelno == logging.WARNING]
+        assert summaries[0].startswith('Suppressed 1 occurrences of ValueError')
+
+
+class TestQueueHandler:
+    """Tests for the non-blocking queue handler."""
+
+    def test_drops_records_when_full(self):
+        """Test that a full queue drops records instead of blocking."""
+        handler = NonBlockingQueueHandler(Queue(maxsize=1))
+        record = logging.LogRecord('x', logging.ERROR, __file__, 1, 'message', None, None)
+
+        handler.handle(record)
+        handler.handle(record)
+
+        assert handler.dropped == 1
+
+    def test_record_is_not_formatted_on_the_calling_thread(self):
+        """Test that the traceback is left for the listener to format."""
+        queue = Queue()
+        handler = NonBlockingQueueHandler(queue)
+        exc = caught(raise_value_error)
+        record = logging.LogRecord('x', logging.ERROR, __file__, 1, 'failed %s', ('x',), (type(exc), exc, exc.__traceback__))
+
+        handler.handle(record)
+
+        queued = queue.get_nowait()
+        assert queued.exc_text is None
+        assert queued.args == ('x',)
+
+    def test_install_forwards_to_original_handlers(self):
+        """Test that records still reach the logger's handlers through the listener."""
+        logger = logging.getLogger('tests.exception_logging.queue')
+        received = []
+
+        class ListHandler(logging.Handler):
+            def emit(self, record):
+                received.append(self.format(record))
+
+        logger.addHandler(ListHandler())
+        logger.propagate = False
+        listener = install_exception_log_queue(logger.name)
+        try:
+            logger.error("failed", exc_info=caught(raise_value_error))
+        finally:
+            listener.stop()
+
+        assert isinstance(logger.handlers[0], NonBlockingQueueHandler)
+        assert received[0].startswith('failed\nTraceback')
+        assert 'ValueError: boom' in received[0]
+
+    @override_settings(STANDARDIZED_RESPONSES={'EXCEPTION_LOG_RATE': 1, 'EXCEPTION_LOG_SUMMARY_INTERVAL': 60})
+    def test_stop_logs_pending_summaries(self):
+        """Test that stopping the listener first logs the suppressed counts."""
+        logger = logging.getLogger('tests.exception_logging.summaries')
+        received = []
+
+        class ListHandler(logging.Handler):
+            def emit(self, record):
+                received.append(record.getMessage())
+
+        logger.addHandler(ListHandler())
+        logger.propagate = False
+        listener = install_exception_log_queue(logger.name)
+        for _ in range(3):
+            log_exception(logger, caught(raise_value_error), "failed")
+        listener.stop()
+        # Stopping again, e.g. at exit, does nothing.
+        listener.stop()
+
+        assert received[0] == 'failed'
+        assert received[1].startswith('Suppressed 2 occurrences of ValueError')
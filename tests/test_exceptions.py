@@ -4,12 +4,26 @@ Tests for the standardized exception handler.
 This module tests the exception handler's functionality in
 consistently formatting API error responses.
 """
+import pytest
 from django.http import Http404
+from django.test import override_settings
 from rest_framework import status
-from rest_framework.exceptions import APIException, ValidationError, NotFound
+from rest_framework.exceptions import (
+    APIException,
+    ErrorDetail,
+    NotAuthenticated,
+    NotFound,
+    PermissionDenied,
+    Throttled,
+    ValidationError,
+)
 from rest_framework.test import APIRequestFactory
 
-from drf_standardized_responses.exceptions import standardized_exception_handler
+from drf_standardized_responses.exceptions import (
+    _standardize_exception,
+    flatten_errors,
+    standardized_exception_handler,
+)
 
 
 class TestExceptionHandler:
@@ -120,3 +134,149 @@ class TestExceptionHandler:
         assert response.data['success'] is False
         assert response.data['message'] == 'Internal server error'
         assert 'errors' not in response.data
+
+
+class TestFastPath:
+    """Tests for the fast path taken by exceptions with a plain message."""
+
+    def setup_method(self):
+        """Set up the test environment."""
+        self.context = {'request': APIRequestFactory().get('/api/test/')}
+
+    def test_skips_drf_exception_handler(self, monkeypatch):
+        """Test that plain-message exceptions never reach DRF's exception handler."""
+        import drf_standardized_responses.exceptions
+
+        def fail(exc, context):
+            raise AssertionError('exception_handler called')
+
+        monkeypatch.setattr(drf_standardized_responses.exceptions, 'exception_handler', fail)
+
+        response = standardized_exception_handler(NotFound(), self.context)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.data == {'success': False, 'message': 'Not found.', 'data': {}}
+
+    @pytest.mark.parametrize('exception', [
+        NotAuthenticated(), PermissionDenied(), NotFound('Gone'), Throttled(wait=30),
+        APIException(''), ValidationError('Single message'),
+    ])
+    def test_matches_general_path(self, exception):
+        """Test that the fast path builds exactly what the general path builds."""
+        fast = standardized_exception_handler(exception, self.context)
+        general = _standardize_exception(exception, self.context)
+
+        assert fast.status_code == general.status_code
+        assert fast.data == general.data
+        assert dict(fast.items()) == dict(general.items())
+
+    def test_retry_after_header(self):
+        """Test that throttled responses carry Retry-After."""
+        response = standardized_exception_handler(Throttled(wait=12.5), self.context)
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        # Throttled rounds the wait up to whole seconds
+        assert response['Retry-After'] == '13'
+
+    def test_www_authenticate_header(self):
+        """Test that authentication failures carry WWW-Authenticate."""
+        exception = NotAuthenticated()
+        exception.auth_header = 'Bearer realm="api"'
+
+        response = standardized_exception_handler(exception, self.context)
+
+        assert response['WWW-Authenticate'] == 'Bearer realm="api"'
+
+    def test_general_path_keeps_headers(self):
+        """Test that exceptions with structured details also keep DRF's headers."""
+        exception = Throttled(wait=5)
+        exception.detail = {'scope': ['Too many requests.']}
+
+        response = standardized_exception_handler(exception, self.context)
+
+        assert response['Retry-After'] == '5'
+        assert response.data['errors'] == {'scope': ['Too many requests.']}
+
+
+FLAT = override_settings(STANDARDIZED_RESPONSES={'ERROR_FORMAT': 'flat'})
+
+
+class TestFlatErrors:
+    """Tests for the flattened validation error format."""
+
+    def setup_method(self):
+        """Set up the test environment."""
+        self.context = {'request': APIRequestFactory().post('/api/test/')}
+
+    def test_flatten_nested_errors(self):
+        """Test that nested errors become JSON pointer entries in their original order."""
+        detail = ValidationError({
+            'name': ['This field is required.'],
+            'items': [{}, {'price': ['A valid number is required.'], 'tags': [{}, {'a/b~c': ['Too long.']}]}],
+            'non_field_errors': ['Invalid combination.'],
+        }).detail
+
+        errors, truncated = flatten_errors(detail)
+
+        assert truncated is False
+        assert [error['pointer'] for error in errors] == [
+            '/name', '/items/1/price', '/items/1/tags/1/a~1b~0c', '/non_field_errors',
+        ]
+        assert errors[0] == {'pointer': '/name', 'code': 'invalid', 'message': 'This field is required.'}
+
+    def test_flatten_keeps_error_codes(self):
+        """Test that every entry carries the code of its ErrorDetail."""
+        detail = {'email': [ErrorDetail('Required.', code='required'), ErrorDetail('Bad.', code='invalid')]}
+
+        errors, _ = flatten_errors(detail)
+
+        assert errors == [
+            {'pointer': '/email', 'code': 'required', 'message': 'Required.'},
+            {'pointer': '/email', 'code': 'invalid', 'message': 'Bad.'},
+        ]
+
+    def test_flatten_top_level_list(self):
+        """Test that errors on the whole document use the empty pointer."""
+        errors, _ = flatten_errors(ValidationError('Nope.').detail)
+
+        assert errors == [{'pointer': '', 'code': 'invalid', 'message': 'Nope.'}]
+
+    def test_flatten_stops_at_limit(self):
+        """Test that the walk stops once the limit is reached."""
+        detail = [{'name': ['Required.']} for _ in range(1000)]
+
+        errors, truncated = flatten_errors(detail, limit=3)
+
+        assert truncated is True
+        assert [error['pointer'] for error in errors] == ['/0/name', '/1/name', '/2/name']
+
+    def test_nested_by_default(self):
+        """Test that the handler keeps the nested format unless configured otherwise."""
+        errors = {'items': [{}, {'name': ['Required.']}]}
+
+        response = standardized_exception_handler(ValidationError(errors), self.context)
+
+        assert response.data['errors'] == errors
+
+    @FLAT
+    def test_handler_flat_format(self):
+        """Test that the handler returns flat errors when configured."""
+        exception = ValidationError({'items': [{}, {'name': ['Required.']}]})
+
+        response = standardized_exception_handler(exception, self.context)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data['message'] == 'Validation failed'
+        assert response.data['errors'] == [{'pointer': '/items/1/name', 'code': 'invalid', 'message': 'Required.'}]
+        assert 'meta' not in response.data
+
+    @override_settings(STANDARDIZED_RESPONSES={'ERROR_FORMAT': 'flat', 'ERROR_LIMIT': 2})
+    def test_handler_reports_truncation(self):
+        """Test that capped errors are flagged in meta."""
+        exception = ValidationError([{'name': ['Required.']} for _ in range(5)])
+
+        response = standardized_exception_handler(exception, self.context)
+
+        assert len(response.data['errors']) == 2
+        assert response.data['meta'] == {'errors': {'count': 2, 'truncated': True}}
+        assert list(response.data) == ['success', 'message', 'data', 'meta', 'errors']
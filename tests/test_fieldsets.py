@@ -0,0 +1,202 @@
+"""
+Tests for sparse fieldsets.
+
+This module tests parsing of the `fields` and `meta` query parameters, the
+projection applied by the renderer and pagination, and the serializer and
+queryset mixins.
+"""
+import pytest
+from django.contrib.auth.models import Group, User
+from django.db import connection
+from django.test import RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.request import Request
+from rest_framework.test import APIClient
+
+from drf_standardized_responses.fieldsets import (
+    get_fieldsets,
+    is_requested,
+    parse_fields,
+    project,
+    project_envelope,
+)
+from drf_standardized_responses.responses import Envelope, StandardResponse
+from tests.urls import SparseUserSerializer
+
+SPARSE = override_settings(STANDARDIZED_RESPONSES={'SPARSE_FIELDSETS': True})
+
+
+class TestParsing:
+    """Tests for parsing and matching field lists."""
+
+    def test_parse_fields(self):
+        """Test that dotted paths build a nested tree."""
+        assert parse_fields('id, author.name,author.id,,') == {'id': {}, 'author': {'name': {}, 'id': {}}}
+
+    def test_shorter_path_selects_whole_subtree(self):
+        """Test that a bare field wins over more specific paths, in any order."""
+        assert parse_fields('author,author.name') == {'author': {}}
+        assert parse_fields('author.name,author') == {'author': {}}
+
+    def test_is_requested(self):
+        """Test path matching against a tree."""
+        tree = parse_fields('pagination.count,links')
+
+        assert is_requested(None, 'pagination.next')
+        assert is_requested(tree, 'pagination.count')
+        assert is_requested(tree, 'links.self')
+        assert not is_requested(tree, 'pagination.next')
+        assert not is_requested(tree, 'timing')
+
+    def test_fieldsets_are_parsed_once(self):
+        """Test that the parsed parameters are cached on the request."""
+        request = Request(RequestFactory().get('/', {'fields': 'id', 'meta': ''}))
+
+        assert get_fieldsets(request) == ({'id': {}}, {})
+        assert get_fieldsets(request) is get_fieldsets(request._request)
+
+
+class TestProjection:
+    """Tests for projecting data and envelopes."""
+
+    def test_project_nested(self):
+        """Test that dictionaries and lists are projected recursively."""
+        data = [{'id': 1, 'name': 'a', 'author': {'id': 2, 'name': 'b'}}]
+
+        assert project(data, parse_fields('id,author.name')) == [{'id': 1, 'author': {'name': 'b'}}]
+        assert project(data, None) is data
+
+    def test_project_envelope(self):
+        """Test that `data` and `meta` are projected independently."""
+        envelope = StandardResponse.success(
+            data=[{'id': 1, 'name': 'a'}],
+            meta={'pagination': {'count': 1, 'next': None}, 'timing': {}},
+        ).data
+        request = RequestFactory().get('/', {'fields': 'id', 'meta': 'pagination.count'})
+
+        projected = project_envelope(envelope, request)
+
+        assert isinstance(projected, Envelope)
+        assert projected == {
+            'success': True, 'message': 'Operation successful',
+            'data': [{'id': 1}], 'meta': {'pagination': {'count': 1}},
+        }
+        # The original envelope is left untouched
+        assert envelope['data'] == [{'id': 1, 'name': 'a'}]
+
+    def test_empty_meta_parameter_drops_meta(self):
+        """Test that `?meta=` removes the metadata entirely."""
+        envelope = StandardResponse.success(data={}, meta={'pagination': {}}).data
+
+        projected = project_envelope(envelope, RequestFactory().get('/', {'meta': ''}))
+
+        assert 'meta' not in projected
+
+    def test_batch_items_project_their_data(self):
+        """Test that batch item envelopes keep their own keys."""
+        envelope = StandardResponse.batch([StandardResponse.success(data={'id': 1, 'name': 'a'})]).data
+
+        projected = project_envelope(envelope, RequestFactory().get('/', {'fields': 'id'}))
+
+        assert projected['data'][0]['data'] == {'id': 1}
+        assert projected['data'][0]['success'] is True
+
+
+@pytest.mark.django_db
+class TestSparseFieldsetMixin:
+    """Tests for SparseFieldsetMixin."""
+
+    def test_explicit_fields(self):
+        """Test that only the listed fields are serialized."""
+        user = User.objects.create(username='alice', email='alice@example.com')
+
+        assert SparseUserSerializer(user, fields='id,username').data == {'id': user.pk, 'username': 'alice'}
+
+    def test_fields_from_request(self):
+        """Test that the `fields` query parameter prunes serializers created with many=True."""
+        User.objects.create(username='alice')
+        request = Request(RequestFactory().get('/', {'fields': 'username'}))
+
+        serializer = SparseUserSerializer(User.objects.all(), many=True, context={'request': request})
+
+        assert serializer.data == [{'username': 'alice'}]
+
+    def test_nested_fields(self):
+        """Test that dotted paths prune nested serializers."""
+        user = User.objects.create(username='alice')
+        user.groups.add(Group.objects.create(name='staff'))
+
+        data = SparseUserSerializer(user, fields='groups.name').data
+
+        assert data == {'groups': [{'name': 'staff'}]}
+
+    def test_only_fields(self):
+        """Test that the remaining fields are mapped to model fields."""
+        assert SparseUserSerializer(fields='username,groups').get_only_fields() == ['id', 'username']
+        assert SparseUserSerializer().get_only_fields() == ['id', 'username', 'email']
+
+
+@pytest.mark.django_db
+class TestSparseViews:
+    """Integration tests for the renderer, pagination and queryset mixin."""
+
+    def setup_method(self):
+        """Set up the test client and users."""
+        self.client = APIClient()
+        self.url = reverse('sparse-users-view')
+        User.objects.bulk_create([User(username='user-%02d' % i, email='%d@example.com' % i) for i in range(15)])
+
+    def test_queryset_only_loads_requested_columns(self):
+        """Test that deferred columns are not selected."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, {'fields': 'username'})
+
+        assert response.json()['data'][0] == {'username': 'user-00'}
+        select = [query['sql'] for query in queries if 'auth_user"."username' in query['sql']][0]
+        assert 'email' not in select
+
+    def test_parameters_ignored_when_disabled(self):
+        """Test that the renderer leaves meta untouched unless SPARSE_FIELDSETS is enabled."""
+        response = self.client.get(self.url, {'meta': 'pagination.count'})
+
+        assert 'next' in response.json()['meta']['pagination']
+
+    @SPARSE
+    def test_meta_projection(self):
+        """Test that only the requested metadata is rendered."""
+        response = self.client.get(self.url, {'meta': 'pagination.count,pagination.next'})
+
+        pagination = response.json()['meta']['pagination']
+        assert list(pagination) == ['count', 'next']
+        assert pagination['count'] == 15
+        assert 'page=2' in pagination['next']
+
+    @SPARSE
+    def test_unrequested_links_are_not_built(self, monkeypatch):
+        """Test that pagination skips building links that were not requested."""
+        from drf_standardized_responses.pagination import StandardPagination
+
+        def fail(self):
+            raise AssertionError('link built')
+
+        monkeypatch.setattr(StandardPagination, 'get_next_link', fail)
+        monkeypatch.setattr(StandardPagination, 'get_previous_link', fail)
+
+        response = self.client.get(self.url, {'meta': 'pagination.count'})
+
+        assert response.json()['meta'] == {'pagination': {'count': 15}}
+
+    @SPARSE
+    def test_renderer_projects_plain_data(self):
+        """Test that views without SparseFieldsetMixin are projected by the renderer."""
+        response = self.client.get(reverse('mock-view'), {'fields': 'foo,missing'})
+
+        assert response.json()['data'] == {'foo': 'bar'}
+
+    @SPARSE
+    def test_errors_are_not_projected(self):
+        """Test that error envelopes keep all their fields."""
+        response = self.client.get(reverse('error-view'), {'fields': 'field1'})
+
+        assert set(response.json()['errors']) == {'field1', 'field2'}
@@ -0,0 +1,135 @@
+"""
+Tests for the per-stage timing instrumentation.
+
+This module tests that stage timings are recorded, exposed through the
+Server-Timing header and meta.timing, and broadcast with a signal.
+"""
+import pytest
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import serializers
+from rest_framework.test import APIClient, APIRequestFactory
+
+from drf_standardized_responses.instrumentation import (
+    TimedSerializerMixin,
+    format_server_timing,
+    get_timings,
+    timed,
+    timings_recorded,
+)
+
+
+class TimedItemSerializer(TimedSerializerMixin, serializers.Serializer):
+    id = serializers.IntegerField(source='*')
+
+
+def server_timing_stages(response):
+    """Return the stage names listed in the Server-Timing header."""
+    return {entry.split(';')[0] for entry in response['Server-Timing'].split(', ')}
+
+
+@pytest.mark.django_db
+class TestTimingIntegration:
+    """Integration tests for timing instrumentation."""
+
+    def setup_method(self):
+        """Set up the test client."""
+        self.client = APIClient()
+
+    def test_disabled_by_default(self):
+        """Test that no timings are emitted unless enabled."""
+        response = self.client.get(reverse('paginated-view'))
+
+        assert not response.has_header('Server-Timing')
+        assert 'timing' not in response.json()['meta']
+
+    @override_settings(STANDARDIZED_RESPONSES={'TIMING': True})
+    def test_server_timing_for_paginated_view(self):
+        """Test that pagination and render stages appear in Server-Timing."""
+        response = self.client.get(reverse('paginated-view'))
+
+        assert server_timing_stages(response) == {'paginate', 'count', 'links', 'render'}
+        assert 'timing' not in response.json()['meta']
+
+    @override_settings(STANDARDIZED_RESPONSES={'TIMING': True})
+    def test_server_timing_for_exception(self):
+        """Test that the exception handler stage is recorded."""
+        response = self.client.get(reverse('error-view') + '?type=not_found')
+
+        assert server_timing_stages(response) == {'exception_handler', 'render'}
+
+    @override_settings(STANDARDIZED_RESPONSES={'TIMING': True, 'TIMING_IN_META': True})
+    def test_timing_in_meta(self):
+        """Test that timings recorded before rendering are added to meta.timing."""
+        body = self.client.get(reverse('paginated-view')).json()
+
+        assert set(body['meta']['timing']) == {'paginate', 'count', 'links'}
+        assert 'pagination' in body['meta']
+
+    @override_settings(STANDARDIZED_RESPONSES={'TIMING': True, 'TIMING_IN_META': True})
+    def test_timing_in_meta_for_unwrapped_data(self):
+        """Test that meta.timing is added when the renderer wraps the data itself."""
+        body = self.client.get(reverse('mock-view')).json()
+
+        assert body['data'] == {'foo': 'bar'}
+        assert body['meta'] == {'timing': {}}
+
+    @override_settings(STANDARDIZED_RESPONSES={'TIMING': True})
+    def test_signal(self):
+        """Test that timings_recorded is sent with the final timings."""
+        received = []
+
+        def receiver(sender, request, response, timings, **kwargs):
+            received.append((response.status_code, timings))
+
+        timings_recorded.connect(receiver)
+        try:
+            self.client.get(reverse('paginated-view'))
+        finally:
+            timings_recorded.disconnect(receiver)
+
+        assert len(received) == 1
+        status_code, timings = received[0]
+        assert status_code == 200
+        assert set(timings) == {'paginate', 'count', 'links', 'render'}
+        assert all(seconds >= 0 for seconds in timings.values())
+
+
+class TestTimingHelpers:
+    """Tests for the instrumentation helpers."""
+
+    def setup_method(self):
+        """Set up the test environment."""
+        self.request = APIRequestFactory().get('/')
+
+    def test_timed_disabled(self):
+        """Test that nothing is recorded when timing is disabled."""
+        with timed(self.request, 'work'):
+            pass
+
+        assert get_timings(self.request) == {}
+
+    @override_settings(STANDARDIZED_RESPONSES={'TIMING': True})
+    def test_timed_accumulates(self):
+        """Test that repeated stages accumulate their durations."""
+        with timed(self.request, 'work'):
+            pass
+        first = get_timings(self.request)['work']
+        with timed(self.request, 'work'):
+            pass
+
+        assert get_timings(self.request)['work'] >= first
+
+    @override_settings(STANDARDIZED_RESPONSES={'TIMING': True})
+    def test_timed_serializer(self):
+        """Test that serializer `.data` access is recorded for single and many serializers."""
+        context = {'request': self.request}
+
+        assert TimedItemSerializer([1, 2], many=True, context=context).data == [{'id': 1}, {'id': 2}]
+        assert set(get_timings(self.request)) == {'serialize'}
+
+        assert TimedItemSerializer(3, context=context).data == {'id': 3}
+
+    def test_format_server_timing(self):
+        """Test the Server-Timing header format."""
+        assert format_server_timing({'render': 0.0015, 'count': 0.25}) == 'render;dur=1.500, count;dur=250.000'
@@ -0,0 +1,200 @@
+"""
+Tests for response size guardrails.
+
+This module tests truncation of oversized list payloads by the renderer and
+by ResponseLimitMixin, the continuation links and the streaming fallback.
+"""
+import json
+
+import pytest
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.response import Response
+from rest_framework.test import APIClient, APIRequestFactory
+
+from drf_standardized_responses.renderers import StandardResponseRenderer
+from drf_standardized_responses.responses import StandardResponse
+from tests.urls import CountingItemSerializer
+
+
+class ContinuationView:
+    """Stand-in view providing continuation links."""
+
+    def get_continuation_link(self, returned):
+        return '/items/?offset=%d' % returned
+
+
+class TestRendererLimits:
+    """Tests for the max_items and max_bytes limits of StandardResponseRenderer."""
+
+    def render(self, data, status=200, **attributes):
+        """Render `data` with a renderer configured with `attributes`."""
+        renderer = StandardResponseRenderer()
+        for name, value in attributes.items():
+            setattr(renderer, name, value)
+        response = Response(data, status=status)
+        return renderer.render(data, renderer_context={'response': response, 'view': ContinuationView()})
+
+    def test_no_limits_by_default(self):
+        """Test that lists are rendered in full without limits."""
+        assert json.loads(self.render(list(range(1000))))['data'] == list(range(1000))
+
+    def test_within_limits_is_unchanged(self):
+        """Test that payloads within the limits render exactly as without limits."""
+        data = StandardResponse.success(data=[{'id': i} for i in range(5)], meta={'page': 1}).data
+
+        assert self.render(data, max_items=5, max_bytes=1000) == self.render(data)
+
+    @pytest.mark.parametrize('compact', [True, False])
+    def test_truncated_by_item_count(self, compact):
+        """Test that the data list is cut at max_items and flagged in meta."""
+        body = self.render(StandardResponse.success(data=list(range(20)), meta={'page': 1}).data,
+                           max_items=3, compact=compact)
+        content = json.loads(body)
+
+        assert content['data'] == [0, 1, 2]
+        assert content['meta'] == {'page': 1, 'truncated': True, 'continuation': '/items/?offset=3'}
+        assert list(content) == ['success', 'message', 'data', 'meta']
+        # The spliced output matches encoding the truncated envelope as a whole.
+        renderer = StandardResponseRenderer()
+        renderer.compact = compact
+        assert body == renderer.render_json(content)
+
+    def test_truncated_by_bytes(self):
+        """Test that items are only kept while their encoded size fits max_bytes."""
+        data = [{'name': 'x' * 10} for _ in range(10)]  # 21 bytes per item
+
+        content = json.loads(self.render(data, max_bytes=63))
+
+        assert len(content['data']) == 3
+        assert content['meta']['truncated'] is True
+
+    def test_oversized_first_item_is_kept(self):
+        """Test that an item larger than max_bytes is still returned, so the continuation makes progress."""
+        content = json.loads(self.render([{'name': 'x' * 100}, {'name': 'y'}], max_bytes=10))
+
+        assert content['data'] == [{'name': 'x' * 100}]
+        assert content['meta']['continuation'] == '/items/?offset=1'
+
+    @override_settings(STANDARDIZED_RESPONSES={'RESPONSE_MAX_ITEMS': 3, 'TIMING': True, 'TIMING_IN_META': True})
+    def test_limits_with_timing_in_meta(self):
+        """Test that lists are still truncated when timings are added to meta."""
+        request = APIRequestFactory().get('/items/')
+        renderer = StandardResponseRenderer()
+
+        content = json.loads(renderer.render(list(range(10)), renderer_context={
+            'request': request, 'response': Response(), 'view': ContinuationView(),
+        }))
+
+        assert content['data'] == [0, 1, 2]
+        assert content['meta']['truncated'] is True
+        assert 'timing' in content['meta']
+
+    def test_encoding_stops_at_limit(self, monkeypatch):
+        """Test that items past the limit are never encoded."""
+        renderer = StandardResponseRenderer()
+        renderer.max_items = 2
+        encoded = []
+        render_json = renderer.render_json
+        monkeypatch.setattr(renderer, 'render_json', lambda data, *args: encoded.append(data) or render_json(data, *args))
+
+        renderer.render(list(range(1000)), renderer_context={'response': Response()})
+
+        assert encoded[:2] == [0, 1]
+        assert len(encoded) == 3  # the two items and the meta
+
+    def test_without_continuation(self):
+        """Test that views without get_continuation_link get a null continuation."""
+        renderer = StandardResponseRenderer()
+        renderer.max_items = 1
+
+        content = json.loads(renderer.render([1, 2], renderer_context={'response': Response()}))
+
+        assert content['meta'] == {'truncated': True, 'continuation': None}
+
+    def test_errors_are_not_truncated(self):
+        """Test that error responses are left alone."""
+        data = StandardResponse.error(errors=[{'id': ['Invalid.']}] * 5).data
+
+        content = json.loads(self.render(data, status=400, max_items=1))
+
+        assert len(content['errors']) == 5
+        assert 'meta' not in content
+
+    @override_settings(STANDARDIZED_RESPONSES={'RESPONSE_MAX_ITEMS': 2})
+    def test_limits_from_settings(self):
+        """Test that the limits default to the settings."""
+        assert json.loads(self.render(list(range(5))))['data'] == [0, 1]
+
+
+class TestResponseLimitMixin:
+    """Integration tests for ResponseLimitMixin."""
+
+    def setup_method(self):
+        """Set up the test client."""
+        self.client = APIClient()
+        CountingItemSerializer.serialized = 0
+
+    def test_truncates_and_stops_serializing(self):
+        """Test that only the items that fit (plus one to detect the overflow) are serialized."""
+        response = self.client.get(reverse('limited-list-view'))
+        content = response.json()
+
+        assert response.status_code == 200
+        assert content['data'] == [{'id': i} for i in range(10)]
+        assert content['meta'] == {'truncated': True, 'continuation': 'http://testserver/api/limited-list/?offset=10'}
+        assert CountingItemSerializer.serialized == 11
+
+    def test_follow_continuation(self):
+        """Test that following continuation links returns every item once."""
+        url, items = reverse('limited-list-view'), []
+        while url:
+            content = self.client.get(url).json()
+            items.extend(item['id'] for item in content['data'])
+            url = content.get('meta', {}).get('continuation')
+
+        assert items == list(range(25))
+
+    def test_within_limit(self):
+        """Test that responses within the limit are not flagged."""
+        content = self.client.get(reverse('limited-list-view'), {'offset': 20}).json()
+
+        assert [item['id'] for item in content['data']] == [20, 21, 22, 23, 24]
+        assert 'meta' not in content
+
+    def test_stream_fallback(self):
+        """Test that oversized responses are streamed in full with the 'stream' action."""
+        response = self.client.get(reverse('streamed-limited-list-view'))
+
+        assert response.streaming
+        content = json.loads(b''.join(response.streaming_content))
+        assert [item['id'] for item in content['data']] == list(range(25))
+
+    def test_binary_stream_fallback_is_truncated(self):
+        """Test that the 'stream' action truncates MessagePack responses, which cannot be streamed."""
+        msgpack = pytest.importorskip('msgpack')
+
+        response = self.client.get(reverse('streamed-limited-list-view'), HTTP_ACCEPT='application/msgpack')
+
+        assert not response.streaming
+        assert response['Content-Type'] == 'application/msgpack'
+        content = msgpack.unpackb(response.content)
+        assert [item['id'] for item in content['data']] == list(range(10))
+        assert content['meta']['truncated'] is True
+
+    def test_offset_within_page(self):
+        """Test that paginated views apply the offset to the current page."""
+        content = self.client.get(reverse('paginated-limited-list-view'), {'page': 2, 'offset': 7}).json()
+
+        assert [item['id'] for item in content['data']] == [17, 18, 19]
+        assert content['meta']['pagination']['current_page'] == 2
+
+    @override_settings(STANDARDIZED_RESPONSES={'RESPONSE_MAX_BYTES': 40})
+    def test_renderer_truncation_uses_view_continuation(self):
+        """Test that the renderer's byte limit gets continuation links from the view."""
+        content = self.client.get(reverse('paginated-limited-list-view'), {'page': 2}).json()
+
+        assert [item['id'] for item in content['data']] == [10, 11, 12, 13]
+        assert content['meta']['truncated'] is True
+        assert content['meta']['continuation'] == 'http://testserver/api/paginated-limited-list/?offset=4&page=2'
+        assert content['meta']['pagination']['current_page'] == 2
@@ -0,0 +1,103 @@
+"""
+Tests for the catalog of default envelope messages.
+
+This module tests that messages are resolved once per message id and
+language, and that responses use the message of the active language.
+"""
+from django.test import override_settings
+from django.utils import translation
+from django.utils.functional import lazy
+from rest_framework.exceptions import NotFound
+from rest_framework.test import APIRequestFactory
+
+from drf_standardized_responses.exceptions import standardized_exception_handler
+from drf_standardized_responses.messages import get_message, get_status_message
+from drf_standardized_responses.renderers import StandardResponseRenderer, _envelope_prefix
+from drf_standardized_responses.responses import StandardResponse
+
+lookups = []
+
+
+def translate_success():
+    """Stand-in for a gettext lookup, recording every call."""
+    language = translation.get_language()
+    lookups.append(language)
+    return {'de': 'Erfolgreich', 'fr': 'Réussi'}.get(language, 'Successful')
+
+
+LOCALIZED = override_settings(STANDARDIZED_RESPONSES={
+    'SUCCESS_MESSAGE': lazy(translate_success, str)(),
+    'STATUS_MESSAGES': {404: 'Not found'},
+})
+
+
+class TestMessageCatalog:
+    """Tests for get_message and get_status_message."""
+
+    def setup_method(self):
+        """Reset the recorded lookups."""
+        lookups.clear()
+
+    def test_defaults(self):
+        """Test the default messages."""
+        assert get_message('success') == 'Operation successful'
+        assert get_message('validation_failed') == 'Validation failed'
+        assert get_status_message(404) == 'Request failed'
+
+    @LOCALIZED
+    def test_message_is_resolved_once_per_language(self):
+        """Test that each language is looked up only once."""
+        with translation.override('de'):
+            assert [get_message('success') for _ in range(3)] == ['Erfolgreich'] * 3
+        with translation.override('fr'):
+            assert get_message('success') == 'Réussi'
+        assert get_message('success', 'de') == 'Erfolgreich'
+
+        assert lookups == ['de', 'fr']
+
+    @LOCALIZED
+    def test_status_messages(self):
+        """Test that STATUS_MESSAGES take precedence over REQUEST_FAILED_MESSAGE."""
+        assert get_status_message(404) == 'Not found'
+        assert get_status_message(409) == 'Request failed'
+
+    def test_cache_is_cleared_when_settings_change(self):
+        """Test that changed messages are picked up."""
+        assert get_message('error') == 'An error occurred'
+        with override_settings(STANDARDIZED_RESPONSES={'ERROR_MESSAGE': 'Error'}):
+            assert get_message('error') == 'Error'
+        assert get_message('error') == 'An error occurred'
+
+
+class TestLocalizedResponses:
+    """Tests for responses using the message of the active language."""
+
+    @LOCALIZED
+    def test_envelopes_use_active_language(self):
+        """Test that responses and rendered bodies carry the translated message."""
+        renderer = StandardResponseRenderer()
+        with translation.override('de'):
+            assert StandardResponse.success().data['message'] == 'Erfolgreich'
+            assert renderer.render({'a': 1}) == b'{"success":true,"message":"Erfolgreich","data":{"a":1}}'
+        with translation.override('fr'):
+            assert renderer.render({'a': 1}) == '{"success":true,"message":"Réussi","data":{"a":1}}'.encode()
+
+    @LOCALIZED
+    def test_encoded_prefix_is_cached_per_language(self):
+        """Test that repeated responses reuse the encoded envelope head of their language."""
+        renderer = StandardResponseRenderer()
+        with translation.override('de'):
+            renderer.render([])
+            misses = _envelope_prefix.cache_info().misses
+            for _ in range(3):
+                renderer.render([])
+
+        assert _envelope_prefix.cache_info().misses == misses
+
+    @LOCALIZED
+    def test_exception_handler_uses_catalog(self):
+        """Test that error messages come from the catalog."""
+        context = {'request': APIRequestFactory().get('/')}
+        response = standardized_exception_handler(NotFound(''), context)
+
+        assert response.data['message'] == 'Not found'
@@ -0,0 +1,170 @@
+"""
+Tests for the NDJSON renderer and export mode.
+
+This module tests the header and item lines of `StandardNDJSONRenderer`,
+the streamed NDJSON responses, and that `NDJSONExportMixin` streams the whole
+queryset from a cursor instead of paginating it.
+"""
+import json
+
+import pytest
+from django.contrib.auth.models import Group
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.response import Response
+from rest_framework.test import APIClient
+
+from drf_standardized_responses.renderers import StandardNDJSONRenderer
+from drf_standardized_responses.responses import StandardResponse
+from drf_standardized_responses.streaming import (
+    NDJSONStreamingResponse,
+    StandardStreamingResponse,
+    aiter_ndjson,
+    iter_ndjson,
+)
+
+
+def parse_lines(content):
+    """Split an NDJSON body into its decoded lines."""
+    assert content.endswith(b'\n')
+    return [json.loads(line) for line in content.split(b'\n')[:-1]]
+
+
+class TestNDJSONRenderer:
+    """Tests for StandardNDJSONRenderer."""
+
+    def setup_method(self):
+        """Set up the test environment."""
+        self.renderer = StandardNDJSONRenderer()
+
+    def test_header_and_item_lines(self):
+        """Test that a list is rendered as a header line followed by one line per item."""
+        content = self.renderer.render([{"id": 1}, {"id": 2}], renderer_context={'response': Response()})
+
+        assert content == (
+            b'{"success":true,"message":"Operation successful"}\n'
+            b'{"id":1}\n'
+            b'{"id":2}\n'
+        )
+
+    def test_meta_in_header(self):
+        """Test that the envelope metadata is part of the header line."""
+        data = StandardResponse.success(data=[None], meta={"count": 1}).data
+
+        lines = parse_lines(self.renderer.render(data))
+
+        assert lines == [{"success": True, "message": "Operation successful", "meta": {"count": 1}}, None]
+
+    def test_non_list_data_is_one_line(self):
+        """Test that a non-list payload is rendered as a single envelope line."""
+        lines = parse_lines(self.renderer.render({"foo": "bar"}, renderer_context={'response': Response()}))
+
+        assert lines == [{"success": True, "message": "Operation successful", "data": {"foo": "bar"}}]
+
+    def test_error_is_one_line(self):
+        """Test that error envelopes are rendered as a single line."""
+        response = Response(status=400)
+
+        lines = parse_lines(self.renderer.render({"name": ["Required."]}, renderer_context={'response': response}))
+
+        assert len(lines) == 1
+        assert lines[0]["success"] is False
+        assert lines[0]["errors"] == {"name": ["Required."]}
+
+    def test_ignores_indent(self):
+        """Test that a requested indent does not split lines."""
+        content = self.renderer.render([{"id": 1}], 'application/x-ndjson; indent=4')
+
+        assert content.count(b'\n') == 2
+
+
+class TestIterNDJSON:
+    """Tests for the iter_ndjson and aiter_ndjson generators."""
+
+    def test_matches_renderer(self):
+        """Test that the streamed lines equal the rendered envelope."""
+        items = [{"id": i} for i in range(10)]
+        renderer = StandardNDJSONRenderer()
+        expected = renderer.render(StandardResponse.success(data=items, meta={"total": 10}).data)
+
+        streamed = b''.join(iter_ndjson(iter(items), meta=lambda: {"total": 10}, buffer_size=16))
+
+        assert streamed == expected
+
+    def test_header_sent_before_items(self):
+        """Test that the header is produced before any item is consumed."""
+        consumed = []
+
+        def items():
+            for i in range(3):
+                consumed.append(i)
+                yield i
+
+        stream = iter_ndjson(items())
+
+        assert json.loads(next(stream))["success"] is True
+        assert consumed == []
+
+    def test_async_matches_sync(self):
+        """Test that aiter_ndjson produces the same bytes as iter_ndjson."""
+        from asgiref.sync import async_to_sync
+
+        async def agen():
+            for i in range(5):
+                yield i
+
+        async def collect():
+            return b''.join([chunk async for chunk in aiter_ndjson(agen(), meta={"n": 5})])
+
+        assert async_to_sync(collect)() == b''.join(iter_ndjson(range(5), meta={"n": 5}))
+
+    def test_streaming_response(self):
+        """Test the content type of NDJSON streaming responses."""
+        response = NDJSONStreamingResponse(iter([1]))
+
+        assert response['Content-Type'] == 'application/x-ndjson'
+        assert parse_lines(b''.join(response.streaming_content))[1:] == [1]
+
+    def test_standard_streaming_response_with_ndjson_renderer(self):
+        """Test that StandardStreamingResponse streams lines with an NDJSON renderer."""
+        response = StandardStreamingResponse(iter([1, 2]), renderer=StandardNDJSONRenderer())
+
+        assert parse_lines(b''.join(response.streaming_content))[1:] == [1, 2]
+
+
+@pytest.mark.django_db
+class TestNDJSONExport:
+    """Integration tests for NDJSONExportMixin."""
+
+    def setup_method(self):
+        """Set up the test client and data."""
+        self.client = APIClient()
+        Group.objects.bulk_create([Group(name="group-%02d" % i) for i in range(25)])
+
+    def test_export_streams_whole_queryset(self):
+        """Test that NDJSON requests stream every row without pagination."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('ndjson-groups-view'), HTTP_ACCEPT='application/x-ndjson')
+            lines = parse_lines(b''.join(response.streaming_content))
+
+        assert response.status_code == 200
+        assert response['Content-Type'] == 'application/x-ndjson'
+        assert lines[0] == {"success": True, "message": "Operation successful"}
+        assert [line["name"] for line in lines[1:]] == ["group-%02d" % i for i in range(25)]
+        assert not any('COUNT(' in query['sql'].upper() for query in queries.captured_queries)
+
+    def test_format_query_parameter(self):
+        """Test that `?format=ndjson` selects the export."""
+        response = self.client.get(reverse('ndjson-groups-view') + '?format=ndjson')
+
+        assert response.streaming
+        assert len(parse_lines(b''.join(response.streaming_content))) == 26
+
+    def test_json_is_paginated(self):
+        """Test that other formats are listed and paginated as usual."""
+        response = self.client.get(reverse('ndjson-groups-view'))
+
+        assert not response.streaming
+        assert len(response.json()["data"]) == 10
+        assert response.json()["meta"]["pagination"]["count"] == 25
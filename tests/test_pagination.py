@@ -6,11 +6,27 @@ standardized paginated responses.
 """
 from unittest.mock import MagicMock
 
+import django
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.db import connection
 from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from rest_framework.exceptions import NotFound
 from rest_framework.request import Request
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
-from drf_standardized_responses.pagination import StandardPagination
+from drf_standardized_responses.pagination import (
+    StandardCursorPagination,
+    StandardPagination,
+    StandardPaginator,
+)
+
+# The async entry points need async ORM and cache APIs (Django 4.2+)
+requires_async_django = pytest.mark.skipif(django.VERSION < (4, 2), reason="requires Django 4.2 or later")
 
 
 class TestStandardPagination:
@@ -104,3 +120,312 @@ class TestStandardPagination:
         # Should be capped at max_page_size
         page_size = self.pagination.get_page_size(request)
         assert page_size == 100  # max_page_size value
+
+
+@pytest.mark.django_db
+class TestStandardCursorPagination:
+    """Tests for the StandardCursorPagination class."""
+
+    def setup_method(self):
+        """Set up the test environment."""
+        self.pagination = StandardCursorPagination()
+        self.factory = RequestFactory()
+        Group.objects.bulk_create([Group(name="group-%02d" % i) for i in range(25)])
+
+    def paginate(self, url):
+        """Paginate the groups for a request to `url` and return the response data."""
+        request = Request(self.factory.get(url))
+        page = self.pagination.paginate_queryset(Group.objects.all(), request)
+        return self.pagination.get_paginated_response([group.name for group in page]).data
+
+    def test_first_page(self):
+        """Test the envelope and metadata of the first page."""
+        data = self.paginate('/groups/')
+
+        assert data["success"] is True
+        assert data["data"] == ["group-%02d" % i for i in range(24, 14, -1)]
+        pagination_meta = data["meta"]["pagination"]
+        assert set(pagination_meta) == {'next', 'previous', 'page_size', 'has_more'}
+        assert pagination_meta["page_size"] == 10
+        assert pagination_meta["has_more"] is True
+        assert pagination_meta["previous"] is None
+        assert 'cursor=' in pagination_meta["next"]
+
+    def test_follows_cursor_to_last_page(self):
+        """Test that following `next` links walks every row exactly once."""
+        names = []
+        url = '/groups/?page_size=10'
+        while url:
+            data = self.paginate(url)
+            names.extend(data["data"])
+            url = data["meta"]["pagination"]["next"]
+
+        assert names == ["group-%02d" % i for i in range(24, -1, -1)]
+        assert data["meta"]["pagination"]["has_more"] is False
+
+    def test_does_not_count(self):
+        """Test that no COUNT query is issued and a single page query runs."""
+        with CaptureQueriesContext(connection) as queries:
+            self.paginate('/groups/')
+
+        assert len(queries) == 1
+        assert 'COUNT(' not in queries[0]['sql'].upper()
+        assert 'LIMIT 11' in queries[0]['sql'].upper()
+
+
+@pytest.mark.django_db
+class TestPaginationLinks:
+    """Tests for the precomputed next/previous links of StandardPagination."""
+
+    def setup_method(self):
+        """Set up the test environment."""
+        self.factory = RequestFactory()
+        Group.objects.bulk_create([Group(name="group-%02d" % i) for i in range(25)])
+
+    def paginate(self, url, link_mode='absolute'):
+        """Paginate the groups for a request to `url` and return the pagination."""
+        pagination = StandardPagination()
+        pagination.link_mode = link_mode
+        request = Request(self.factory.get(url))
+        pagination.paginate_queryset(Group.objects.order_by('pk'), request)
+        return pagination
+
+    @pytest.mark.parametrize('url', [
+        '/groups/?page=2',
+        '/groups/?page=2&page_size=5',
+        '/groups/?z=1&page=2&a=x%20y&page_size=5',
+        '/groups/?tag=a&tag=b&page=2&empty=&page_size=5',
+        '/gr%C3%BCppen/?page=2&q=caf%C3%A9+au+lait&page_size=5',
+    ])
+    def test_absolute_links_match_drf(self, url):
+        """Test that the links are identical to DRF's replace_query_param/remove_query_param output."""
+        pagination = self.paginate(url)
+        absolute = pagination.request.build_absolute_uri()
+
+        assert pagination.get_next_link() == replace_query_param(absolute, 'page', 3)
+        assert pagination.get_previous_link() == remove_query_param(absolute, 'page')
+        assert pagination.get_page_link(4) == replace_query_param(absolute, 'page', 4)
+
+    def test_url_is_parsed_once(self, monkeypatch):
+        """Test that the request URL is built and parsed once for both links."""
+        pagination = self.paginate('/groups/?page=3&page_size=5')
+        calls = []
+        build_absolute_uri = pagination.request.build_absolute_uri
+        monkeypatch.setattr(
+            pagination.request._request, 'build_absolute_uri',
+            lambda *args: calls.append(args) or build_absolute_uri(*args),
+        )
+
+        meta = pagination.get_pagination_meta()
+
+        assert len(calls) == 1
+        assert meta['next'] == 'http://testserver/groups/?page=4&page_size=5'
+        assert meta['previous'] == 'http://testserver/groups/?page=2&page_size=5'
+
+    def test_page_size_is_not_recomputed(self, monkeypatch):
+        """Test that the metadata reuses the page size computed during pagination."""
+        pagination = self.paginate('/groups/?page_size=5')
+        monkeypatch.setattr(pagination, 'get_page_size', MagicMock(side_effect=AssertionError))
+
+        assert pagination.get_pagination_meta()['page_size'] == 5
+
+    def test_relative_links(self):
+        """Test that the 'relative' link mode omits the scheme and host."""
+        meta = self.paginate('/groups/?page=2&page_size=5', 'relative').get_pagination_meta()
+
+        assert meta['next'] == '/groups/?page=3&page_size=5'
+        assert meta['previous'] == '/groups/?page_size=5'
+
+    def test_template_links(self):
+        """Test that the 'template' link mode sends page numbers and a link template."""
+        meta = self.paginate('/groups/?page=2&page_size=5', 'template').get_pagination_meta()
+
+        assert meta['next'] == 3
+        assert meta['previous'] == 1
+        assert meta['link_template'] == '/groups/?page={page}&page_size=5'
+
+    def test_template_links_on_last_page(self):
+        """Test that missing pages are reported as None in the 'template' link mode."""
+        meta = self.paginate('/groups/?page=5&page_size=5', 'template').get_pagination_meta()
+
+        assert meta['next'] is None
+        assert meta['previous'] == 4
+
+
+@pytest.mark.django_db
+class TestCountStrategies:
+    """Tests for the count strategies of StandardPagination."""
+
+    def setup_method(self):
+        """Set up the test environment."""
+        self.pagination = StandardPagination()
+        self.factory = RequestFactory()
+        Group.objects.bulk_create([Group(name="group-%02d" % i) for i in range(25)])
+        cache.clear()
+
+    def paginate(self, queryset, url='/groups/'):
+        """Paginate `queryset` and return the pagination metadata."""
+        request = Request(self.factory.get(url))
+        self.pagination.paginate_queryset(queryset, request)
+        return self.pagination.get_pagination_meta()
+
+    def count_queries(self, queryset):
+        """Paginate `queryset` and return the number of COUNT queries issued."""
+        with CaptureQueriesContext(connection) as queries:
+            self.paginate(queryset)
+        return sum('COUNT(' in query['sql'].upper() for query in queries)
+
+    def test_exact_count(self):
+        """Test that the default strategy counts exactly on every request."""
+        meta = self.paginate(Group.objects.order_by('pk'))
+
+        assert meta["count"] == 25
+        assert meta["total_pages"] == 3
+        assert meta["count_is_exact"] is True
+        assert self.count_queries(Group.objects.order_by('pk')) == 1
+
+    def test_cached_count(self):
+        """Test that the cached strategy only counts once per query."""
+        self.pagination.count_strategy = 'cached'
+
+        assert self.count_queries(Group.objects.order_by('pk')) == 1
+        assert self.count_queries(Group.objects.order_by('pk')) == 0
+
+        meta = self.paginate(Group.objects.order_by('pk'))
+        assert meta["count"] == 25
+        # Served from the cache, so possibly stale
+        assert meta["count_is_exact"] is False
+
+    def test_cached_count_is_exact_when_counted(self):
+        """Test that the request that fills the cache reports an exact count."""
+        self.pagination.count_strategy = 'cached'
+
+        meta = self.paginate(Group.objects.order_by('pk'))
+
+        assert meta["count"] == 25
+        assert meta["count_is_exact"] is True
+
+    def test_cached_count_is_keyed_by_query(self):
+        """Test that differently filtered querysets do not share a cached count."""
+        self.pagination.count_strategy = 'cached'
+        self.paginate(Group.objects.order_by('pk'))
+
+        meta = self.paginate(Group.objects.filter(name__lt='group-05').order_by('pk'))
+
+        assert meta["count"] == 5
+
+    def test_cached_count_expires(self):
+        """Test that cached counts are stored with the configured timeout."""
+        self.pagination.count_strategy = 'cached'
+        self.pagination.count_cache_timeout = 0
+
+        self.paginate(Group.objects.order_by('pk'))
+
+        assert self.count_queries(Group.objects.order_by('pk')) == 1
+
+    def test_cached_count_of_empty_queryset(self):
+        """Test that querysets which cannot match any rows are handled."""
+        self.pagination.count_strategy = 'cached'
+
+        meta = self.paginate(Group.objects.none())
+
+        assert meta["count"] == 0
+
+    def test_estimated_count_above_threshold(self, monkeypatch):
+        """Test that large planner estimates replace the exact count."""
+        monkeypatch.setattr(StandardPaginator, 'estimate_count', lambda self: 5000000)
+        self.pagination.count_strategy = 'estimated'
+
+        meta = self.paginate(Group.objects.order_by('pk'))
+
+        assert meta["count"] == 5000000
+        assert meta["total_pages"] == 500000
+        assert meta["count_is_exact"] is False
+        assert self.count_queries(Group.objects.order_by('pk')) == 0
+
+    def test_estimated_count_below_threshold(self, monkeypatch):
+        """Test that small estimates fall back to an exact count."""
+        monkeypatch.setattr(StandardPaginator, 'estimate_count', lambda self: 30)
+        self.pagination.count_strategy = 'estimated'
+
+        meta = self.paginate(Group.objects.order_by('pk'))
+
+        assert meta["count"] == 25
+        assert meta["count_is_exact"] is True
+
+    def test_estimate_unavailable_on_sqlite(self):
+        """Test that databases without planner estimates count exactly."""
+        self.pagination.count_strategy = 'estimated'
+        self.pagination.count_estimate_threshold = 0
+
+        meta = self.paginate(Group.objects.order_by('pk'))
+
+        assert meta["count"] == 25
+        assert meta["count_is_exact"] is True
+
+    def test_lists_are_counted_exactly(self):
+        """Test that non-queryset data ignores the count strategy."""
+        self.pagination.count_strategy = 'cached'
+
+        meta = self.paginate(list(range(42)))
+
+        assert meta["count"] == 42
+        assert meta["count_is_exact"] is True
+
+
+@requires_async_django
+@pytest.mark.django_db
+class TestAsyncPagination:
+    """Tests for the async pagination entry points."""
+
+    def setup_method(self):
+        """Set up the test environment."""
+        self.pagination = StandardPagination()
+        self.factory = RequestFactory()
+        Group.objects.bulk_create([Group(name="group-%02d" % i) for i in range(25)])
+        cache.clear()
+
+    def apaginate(self, queryset, url='/groups/'):
+        """Run `apaginate_queryset` to completion and return the page."""
+        request = Request(self.factory.get(url))
+        return async_to_sync(self.pagination.apaginate_queryset)(queryset, request)
+
+    def test_matches_sync_pagination(self):
+        """Test that async pagination returns the same page and metadata."""
+        page = self.apaginate(Group.objects.order_by('pk'), '/groups/?page=2')
+
+        # The page is fully materialized, so rendering needs no database access
+        assert isinstance(page, list)
+        assert [group.name for group in page] == ["group-%02d" % i for i in range(10, 20)]
+
+        meta = self.pagination.get_pagination_meta()
+        assert meta["count"] == 25
+        assert meta["current_page"] == 2
+        assert meta["count_is_exact"] is True
+
+    def test_cached_count(self):
+        """Test that the cached strategy is honoured by `acount`."""
+        self.pagination.count_strategy = 'cached'
+        self.apaginate(Group.objects.order_by('pk'))
+
+        Group.objects.create(name="extra")
+        self.pagination = StandardPagination()
+        self.pagination.count_strategy = 'cached'
+        self.apaginate(Group.objects.order_by('pk'))
+
+        # The second request is served the stale cached count, flagged as inexact
+        meta = self.pagination.get_pagination_meta()
+        assert meta["count"] == 25
+        assert meta["count_is_exact"] is False
+
+    def test_invalid_page(self):
+        """Test that an out-of-range page raises NotFound."""
+        with pytest.raises(NotFound):
+            self.apaginate(Group.objects.order_by('pk'), '/groups/?page=9')
+
+    def test_lists_are_counted_exactly(self):
+        """Test that non-queryset data is paginated without the ORM."""
+        page = self.apaginate(list(range(42)))
+
+        assert page == list(range(10))
+        assert self.pagination.get_pagination_meta()["count"] == 42
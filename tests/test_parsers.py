@@ -0,0 +1,84 @@
+"""
+Tests for the MessagePack and CBOR parsers.
+
+This module tests parsing of binary request bodies and content negotiation
+of the matching renderers end to end.
+"""
+import io
+
+import pytest
+from django.urls import reverse
+from rest_framework.exceptions import ParseError
+from rest_framework.test import APIClient
+
+from drf_standardized_responses.parsers import CBORParser, MessagePackParser
+
+msgpack = pytest.importorskip('msgpack')
+cbor2 = pytest.importorskip('cbor2')
+
+PAYLOAD = {"name": "widget", "sizes": [1, 2, 3], "active": True, "ratio": 0.5}
+
+
+class TestParsers:
+    """Tests for MessagePackParser and CBORParser."""
+
+    def test_messagepack(self):
+        """Test that MessagePack bodies are decoded."""
+        assert MessagePackParser().parse(io.BytesIO(msgpack.packb(PAYLOAD))) == PAYLOAD
+
+    def test_cbor(self):
+        """Test that CBOR bodies are decoded."""
+        assert CBORParser().parse(io.BytesIO(cbor2.dumps(PAYLOAD))) == PAYLOAD
+
+    @pytest.mark.parametrize("parser", [MessagePackParser(), CBORParser()])
+    def test_malformed_body(self, parser):
+        """Test that malformed bodies raise ParseError."""
+        with pytest.raises(ParseError):
+            parser.parse(io.BytesIO(b'\xc1\xff'))
+
+
+@pytest.mark.django_db
+class TestContentNegotiation:
+    """Integration tests for the binary renderers and parsers."""
+
+    def setup_method(self):
+        """Set up the test client."""
+        self.client = APIClient()
+
+    def test_messagepack_round_trip(self):
+        """Test a MessagePack request answered in MessagePack."""
+        response = self.client.post(
+            reverse('echo-view'), msgpack.packb(PAYLOAD),
+            content_type='application/msgpack', HTTP_ACCEPT='application/msgpack',
+        )
+
+        assert response['Content-Type'] == 'application/msgpack'
+        assert msgpack.unpackb(response.content) == {
+            "success": True, "message": "Operation successful", "data": PAYLOAD, "meta": {"format": "msgpack"},
+        }
+
+    def test_cbor_round_trip(self):
+        """Test a CBOR request answered in CBOR."""
+        response = self.client.post(
+            reverse('echo-view'), cbor2.dumps(PAYLOAD),
+            content_type='application/cbor', HTTP_ACCEPT='application/cbor',
+        )
+
+        assert response['Content-Type'] == 'application/cbor'
+        assert cbor2.loads(response.content)["data"] == PAYLOAD
+
+    def test_errors_use_negotiated_format(self):
+        """Test that error envelopes are rendered in the negotiated format."""
+        response = self.client.get(reverse('error-view'), {'type': 'not_found'}, HTTP_ACCEPT='application/msgpack')
+
+        assert response.status_code == 404
+        assert msgpack.unpackb(response.content) == {
+            "success": False, "message": "Resource not found", "data": {},
+        }
+
+    def test_streaming_views_render_negotiated_format(self):
+        """Test that streaming list views send a whole MessagePack body when it is negotiated."""
+        response = self.client.get(reverse('export-view'), HTTP_ACCEPT='application/msgpack')
+
+        assert response['Content-Type'] == 'application/msgpack'
+        assert msgpack.unpackb(response.content)["success"] is True
@@ -0,0 +1,211 @@
+"""
+Tests for background prefetching of the next page.
+
+This module tests that serving a page of a cached list view renders the
+following page into the response cache, and that prefetches are not repeated
+or chained.
+"""
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from django.core.cache import cache
+from django.test import RequestFactory, override_settings
+from django.urls import reverse
+from django.utils import translation
+from rest_framework.test import APIClient
+from rest_framework.throttling import BaseThrottle
+
+from drf_standardized_responses import prefetch
+from drf_standardized_responses.prefetch import is_prefetch_request, make_page_request, run_prefetch
+from tests.urls import PrefetchListView
+
+
+class InlineExecutor:
+    """Executor running every task immediately, in the calling thread."""
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+inline_executor = InlineExecutor()
+
+
+class RecordingExecutor:
+    """Executor recording the tasks submitted to it without running them."""
+
+    def __init__(self):
+        self.tasks = []
+
+    def submit(self, fn, *args, **kwargs):
+        self.tasks.append(args)
+        return Future()
+
+
+recording_executor = RecordingExecutor()
+
+
+class CountingThrottle(BaseThrottle):
+    """Throttle allowing every request and counting the ones it checked."""
+
+    checked = 0
+
+    def allow_request(self, request, view):
+        CountingThrottle.checked += 1
+        return True
+
+INLINE = override_settings(STANDARDIZED_RESPONSES={'PREFETCH_EXECUTOR': 'tests.test_prefetch.inline_executor'})
+
+
+class TestPrefetch:
+    """Integration tests for prefetch_next_page with CachedResponseMixin."""
+
+    def setup_method(self):
+        """Set up the test client and clear cached state."""
+        self.client = APIClient()
+        self.url = reverse('prefetch-list-view')
+        cache.clear()
+        PrefetchListView.calls = []
+
+    @INLINE
+    def test_next_page_is_prefetched(self):
+        """Test that serving a page renders the next one into the cache."""
+        response = self.client.get(self.url)
+        assert response.status_code == 200
+        assert PrefetchListView.calls == [None, '2']
+
+        response = self.client.get(self.url, {'page': 2})
+
+        assert response.status_code == 200
+        assert response.json()['meta']['pagination']['current_page'] == 2
+        # Page 2 came from the cache; serving it prefetched page 3.
+        assert PrefetchListView.calls == [None, '2', '3']
+
+    @INLINE
+    def test_prefetched_page_matches_direct_response(self):
+        """Test that the prefetched envelope is the one the client would have received."""
+        self.client.get(self.url)
+        prefetched = self.client.get(self.url, {'page': 2}).content
+        cache.clear()
+
+        assert self.client.get(self.url, {'page': 2}).content == prefetched
+
+    @INLINE
+    def test_no_prefetch_after_last_page(self):
+        """Test that nothing is scheduled from the last page."""
+        self.client.get(self.url, {'page': 3})
+
+        assert PrefetchListView.calls == ['3']
+
+    @INLINE
+    def test_prefetch_is_not_repeated(self):
+        """Test that a cached or already scheduled next page is not prefetched again."""
+        self.client.get(self.url)
+        cache.clear()
+        self.client.get(self.url)
+        self.client.get(self.url)
+
+        # After clearing, page 2 is fetched once more but only scheduled once.
+        assert PrefetchListView.calls == [None, '2', None, '2']
+
+    @INLINE
+    def test_error_pages_are_not_prefetched(self):
+        """Test that requests for invalid pages do not schedule prefetches."""
+        response = self.client.get(self.url, {'page': 9})
+
+        assert response.status_code == 404
+        assert PrefetchListView.calls == ['9']
+
+    @INLINE
+    def test_prefetch_is_not_throttled(self, monkeypatch):
+        """Test that prefetches do not count against the client's throttles."""
+        monkeypatch.setattr(PrefetchListView, 'throttle_classes', [CountingThrottle])
+        CountingThrottle.checked = 0
+
+        self.client.get(self.url)
+        assert PrefetchListView.calls == [None, '2']
+        assert CountingThrottle.checked == 1
+
+        self.client.get(self.url, {'page': 2})
+        assert CountingThrottle.checked == 2
+
+    @override_settings(STANDARDIZED_RESPONSES={'PREFETCH_EXECUTOR': 'tests.test_prefetch.recording_executor'})
+    def test_lock_is_released(self):
+        """Test that the page is marked as being prefetched until the prefetch finishes."""
+        recording_executor.tasks = []
+        self.client.get(self.url)
+        lock_cache, lock_key = recording_executor.tasks[0][5]
+        assert lock_cache.get(lock_key) is True
+
+        run_prefetch(*recording_executor.tasks[0])
+
+        assert lock_cache.get(lock_key) is None
+
+    def test_default_thread_pool(self, monkeypatch):
+        """Test that the default executor prefetches in a worker thread."""
+        executor = ThreadPoolExecutor(max_workers=1)
+        monkeypatch.setattr(prefetch, '_executor', executor)
+
+        self.client.get(self.url)
+        executor.shutdown(wait=True)
+
+        assert PrefetchListView.calls == [None, '2']
+        self.client.get(self.url, {'page': 2})
+        assert PrefetchListView.calls == [None, '2']
+
+
+    @override_settings(STANDARDIZED_RESPONSES={'PREFETCH_EXECUTOR': 'tests.test_prefetch.recording_executor'})
+    def test_language_is_passed_to_task(self):
+        """Test that the prefetch task is given the language active for the client's request."""
+        recording_executor.tasks = []
+
+        with translation.override('fr'):
+            self.client.get(self.url)
+
+        assert recording_executor.tasks[0][4] == 'fr'
+
+
+class TestPageRequests:
+    """Tests for the requests used by prefetch tasks."""
+
+    def test_make_page_request(self):
+        """Test that only the page number changes and conditional headers are dropped."""
+        request = RequestFactory().get('/items/', {'page': 2, 'q': 'x'}, HTTP_IF_NONE_MATCH='"abc"')
+        request._standardized_timings = {'render': 1.0}
+
+        page_request = make_page_request(request, 'page', 3)
+
+        assert page_request.get_full_path() == '/items/?page=3&q=x'
+        assert page_request.GET['q'] == 'x'
+        assert 'HTTP_IF_NONE_MATCH' not in page_request.META
+        assert not hasattr(page_request, '_standardized_timings')
+        assert is_prefetch_request(page_request) is True
+        # The original request is unchanged.
+        assert request.GET['page'] == '2'
+        assert request.META['HTTP_IF_NONE_MATCH'] == '"abc"'
+        assert is_prefetch_request(request) is False
+
+    def test_runs_in_language(self):
+        """Test that a prefetch renders in the given language on a worker thread."""
+        languages = []
+
+        def view(request):
+            languages.append(translation.get_language())
+
+        request = RequestFactory().get('/items/?page=2')
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(run_prefetch, view, request, (), {}, 'de').result()
+
+        assert languages == ['de']
+
+    def test_failures_are_logged(self, caplog):
+        """Test that a failing prefetch is logged instead of raised."""
+        def view(request):
+            raise RuntimeError("boom")
+
+        request = RequestFactory().get('/items/?page=2')
+        with caplog.at_level(logging.ERROR, logger='drf_standardized_responses.prefetch'):
+            assert run_prefetch(view, request, (), {}) is None
+
+        assert caplog.records[0].getMessage() == 'Prefetching /items/?page=2 failed'
@@ -4,12 +4,22 @@ Tests for the StandardResponseRenderer class.
 This module tests the renderer's functionality in consistently
 formatting API responses and preventing double-wrapping of responses.
 """
+import datetime
+import decimal
 import json
+import uuid
 
+import pytest
+from asgiref.sync import async_to_sync
 from rest_framework import status
 from rest_framework.response import Response
 
-from drf_standardized_responses.renderers import StandardResponseRenderer
+from drf_standardized_responses.renderers import (
+    StandardCBORRenderer,
+    StandardMessagePackRenderer,
+    StandardResponseRenderer,
+)
+from drf_standardized_responses.responses import Envelope, StandardResponse
 
 
 class TestStandardResponseRenderer:
@@ -20,23 +30,63 @@ class TestStandardResponseRenderer:
         self.renderer = StandardResponseRenderer()
 
     def test_render_already_formatted_response(self):
-        """Test that the renderer doesn't rewrap already formatted responses."""
-        formatted_data = {
+        """Test that the renderer doesn't rewrap envelopes built by StandardResponse."""
+        response = StandardResponse.success(data={"key": "value"}, message="Already formatted")
+        renderer_context = {"response": response}
+
+        # Render the response
+        rendered = self.renderer.render(response.data, None, renderer_context)
+
+        # Check that the rendered output is the same as the input
+        result = json.loads(rendered.decode('utf-8'))
+        assert result == {
             "success": True,
             "message": "Already formatted",
             "data": {"key": "value"}
         }
 
+    def test_render_plain_dict_with_envelope_keys(self):
+        """Test that payloads which merely contain envelope keys are still wrapped."""
+        data = {"success": "yes", "message": "user supplied"}
+
         # Create mock renderer context
-        response = Response(formatted_data, status=status.HTTP_200_OK)
+        response = Response(data, status=status.HTTP_200_OK)
         renderer_context = {"response": response}
 
         # Render the response
-        rendered = self.renderer.render(formatted_data, None, renderer_context)
+        rendered = self.renderer.render(data, None, renderer_context)
 
-        # Check that the rendered output is the same as the input
+        # Check that the payload ends up under the data key
         result = json.loads(rendered.decode('utf-8'))
-        assert result == formatted_data
+        assert result["success"] is True
+        assert result["data"] == data
+
+    def test_spliced_envelope_matches_full_encoding(self):
+        """Test that envelopes rendered member by member equal the encoded dict."""
+        envelopes = [
+            StandardResponse.success(data=[1, "caf\u00e9"], message="Listed \u2028", meta={"count": 2}).data,
+            StandardResponse.error(message="Invalid", errors={"name": ["Required"]}, status_code=400).data,
+            Envelope(success=True, message="Null meta", data={}, meta=None),
+        ]
+
+        for envelope in envelopes:
+            spliced = self.renderer.render(envelope, None, {})
+            assert spliced == self.renderer.render_json(dict(envelope))
+
+    def test_spliced_envelope_with_long_separators(self):
+        """Test that member separators follow the renderer's compact setting."""
+        self.renderer.compact = False
+        envelope = StandardResponse.success(data={"a": 1}, meta={"b": 2}).data
+
+        assert self.renderer.render(envelope, None, {}) == self.renderer.render_json(dict(envelope))
+
+    def test_envelope_in_unexpected_order_is_encoded_whole(self):
+        """Test that envelopes not starting with success, message, data are encoded as a whole."""
+        envelope = Envelope(message="Reordered", success=True, data=[])
+
+        rendered = self.renderer.render(envelope, None, {})
+
+        assert rendered == self.renderer.render_json(dict(envelope))
 
     def test_render_success_response(self):
         """Test that the renderer properly wraps success responses."""
@@ -141,3 +191,163 @@ class TestStandardResponseRenderer:
         assert result["success"] is True
         assert "message" in result
         assert result["data"] == data
+
+    def test_spliced_success_matches_full_envelope(self):
+        """Test that the spliced fast path is byte-identical to encoding the full envelope."""
+        data = {"items": [1, 2.5, None], "name": "caf\u00e9 \u2028", "nested": {"ok": True}}
+
+        spliced = self.renderer.render(data, None, {})
+
+        self.renderer.splice_envelope = False
+        full = self.renderer.render(data, None, {})
+
+        assert spliced == full
+
+    def test_spliced_success_with_none_data(self):
+        """Test that the spliced fast path renders `None` payloads as an empty object."""
+        rendered = self.renderer.render(None, None, {})
+
+        assert json.loads(rendered.decode('utf-8'))["data"] == {}
+
+    def test_spliced_success_respects_separators(self):
+        """Test that the envelope prefix follows the renderer's compact setting."""
+        self.renderer.compact = False
+        data = [{"key": "value"}]
+
+        spliced = self.renderer.render(data, None, {})
+
+        self.renderer.splice_envelope = False
+        assert spliced == self.renderer.render(data, None, {})
+
+    def test_indented_success_falls_back_to_full_envelope(self):
+        """Test that pretty-printed output still renders the complete envelope."""
+        rendered = self.renderer.render({"key": "value"}, "application/json; indent=4", {})
+
+        assert rendered.startswith(b'{\n    "success": true')
+        assert json.loads(rendered.decode('utf-8'))["data"] == {"key": "value"}
+
+    def test_arender_matches_render(self):
+        """Test that the async entry point renders the same bytes."""
+        response = Response({"key": "value"})
+        context = {"response": response}
+
+        rendered = async_to_sync(self.renderer.arender)({"key": "value"}, None, context)
+
+        assert rendered == self.renderer.render({"key": "value"}, None, context)
+
+
+    def test_empty_envelopes_are_served_from_cache(self):
+        """Test that payload-less error envelopes reuse the cached encoded body."""
+        response = StandardResponse.error(message="Not found.", status_code=404)
+        context = {"response": response}
+
+        first = self.renderer.render(response.data, None, context)
+        second = self.renderer.render(StandardResponse.error(message="Not found.").data, None, context)
+
+        assert first is second
+        assert json.loads(first) == {"success": False, "message": "Not found.", "data": {}}
+
+    def test_cached_envelopes_keep_success_type(self):
+        """Test that envelopes with a non-boolean success value do not reuse the boolean ones."""
+        for success in (True, 1, False, 0):
+            envelope = Envelope(success=success, message="Same message", data={})
+            assert self.renderer.render(envelope, None, {}) == self.renderer.render_json(dict(envelope))
+
+            envelope = Envelope(success=success, message="Same message", data=[1])
+            assert self.renderer.render(envelope, None, {}) == self.renderer.render_json(dict(envelope))
+
+BINARY_FORMATS = {
+    'msgpack': (StandardMessagePackRenderer, 'msgpack', lambda module, content: module.unpackb(content, raw=False)),
+    'cbor': (StandardCBORRenderer, 'cbor2', lambda module, content: module.loads(content)),
+}
+
+# (data, status code) pairs covering every envelope branch of the renderer
+EQUIVALENCE_CASES = [
+    ({"key": "value"}, 200),
+    ([1, 2.5, None, True, "text"], 200),
+    (None, 204),
+    ({"id": 1, "nested": {"list": [{"a": 1}]}}, 201),
+    ({"field": ["This field is required."]}, 400),
+    ({"message": "Custom failure", "code": "x"}, 409),
+    ("Plain error", 500),
+    ({"when": datetime.time(12, 30)}, 200),
+]
+
+
+class TestBinaryRenderers:
+    """Cross-format equivalence tests for the MessagePack and CBOR renderers."""
+
+    @pytest.fixture(params=sorted(BINARY_FORMATS))
+    def binary(self, request):
+        """Yield a binary renderer and a decoder for its output, skipping missing libraries."""
+        renderer_class, module_name, decode = BINARY_FORMATS[request.param]
+        module = pytest.importorskip(module_name)
+        return renderer_class(), lambda content: decode(module, content)
+
+    @pytest.mark.parametrize("data, status_code", EQUIVALENCE_CASES)
+    def test_same_envelope_as_json(self, binary, data, status_code):
+        """Test that binary output decodes to the same envelope as the JSON output."""
+        renderer, decode = binary
+
+        # Error rendering pops `message`, so each renderer gets its own copy
+        binary_content = renderer.render(
+            _copy(data), None, {"response": Response(status=status_code)}
+        )
+        json_content = StandardResponseRenderer().render(
+            _copy(data), None, {"response": Response(status=status_code)}
+        )
+
+        assert decode(binary_content) == json.loads(json_content)
+
+    def test_standard_response_envelope(self, binary):
+        """Test that envelopes built by StandardResponse are passed through unchanged."""
+        renderer, decode = binary
+        response = StandardResponse.success(data=[{"id": 1}], meta={"pagination": {"count": 1}})
+
+        content = renderer.render(response.data, None, {"response": response})
+
+        assert decode(content) == {
+            "success": True, "message": "Operation successful",
+            "data": [{"id": 1}], "meta": {"pagination": {"count": 1}},
+        }
+
+    def test_msgpack_converts_like_json_encoder(self):
+        """Test that MessagePack converts decimals and UUIDs like the JSON encoder does."""
+        msgpack = pytest.importorskip('msgpack')
+        data = {"price": decimal.Decimal("9.5"), "uuid": uuid.UUID(int=1)}
+
+        content = StandardMessagePackRenderer().render(data, None, {})
+
+        assert msgpack.unpackb(content)["data"] == {"price": 9.5, "uuid": str(uuid.UUID(int=1))}
+
+    def test_cbor_keeps_native_types(self):
+        """Test that CBOR encodes UUIDs and decimals with its native types."""
+        cbor2 = pytest.importorskip('cbor2')
+        data = {"price": decimal.Decimal("9.5"), "uuid": uuid.UUID(int=1)}
+
+        content = StandardCBORRenderer().render(data, None, {})
+
+        assert cbor2.loads(content)["data"] == data
+
+    def test_cbor_naive_datetime(self):
+        """Test that CBOR converts naive datetimes like the JSON encoder, keeping aware ones native."""
+        cbor2 = pytest.importorskip('cbor2')
+        aware = datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc)
+        data = [{"created": datetime.datetime(2024, 1, 2, 3, 4, 5, 678000), "updated": aware}]
+
+        content = StandardCBORRenderer().render(data, None, {})
+
+        created = json.loads(StandardResponseRenderer().render(data, None, {}))["data"][0]["created"]
+        assert cbor2.loads(content)["data"] == [{"created": created, "updated": aware}]
+
+    def test_media_types(self):
+        """Test the negotiated media types and formats."""
+        assert (StandardMessagePackRenderer.media_type, StandardMessagePackRenderer.format) == (
+            'application/msgpack', 'msgpack'
+        )
+        assert (StandardCBORRenderer.media_type, StandardCBORRenderer.format) == ('application/cbor', 'cbor')
+
+
+def _copy(data):
+    """Return a shallow copy of `data` if it is a dict."""
+    return dict(data) if isinstance(data, dict) else data
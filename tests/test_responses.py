@@ -5,8 +5,10 @@ This module tests the functionality of the StandardResponse class in providing
 standardized API responses.
 """
 from rest_framework import status
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.response import Response
 
-from drf_standardized_responses.responses import StandardResponse
+from drf_standardized_responses.responses import Envelope, StandardResponse
 
 
 class TestStandardResponse:
@@ -100,3 +102,52 @@ class TestStandardResponse:
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert response.data["success"] is False
         assert response.data["errors"] == errors
+
+    def test_responses_use_envelope_type(self):
+        """Test that success and error responses carry Envelope data in envelope order."""
+        success = StandardResponse.success(data=[1], meta={"count": 1})
+        error = StandardResponse.error(errors=["Error 1"])
+
+        assert isinstance(success.data, Envelope)
+        assert isinstance(error.data, Envelope)
+        assert list(success.data) == ["success", "message", "data", "meta"]
+        assert list(error.data) == ["success", "message", "data", "errors"]
+
+    def test_batch_response(self):
+        """Test that batch collects sub-operation results with aggregate counts."""
+        response = StandardResponse.batch([
+            StandardResponse.success(data={"id": 1}),
+            StandardResponse.error(message="Nope", errors={"id": ["Invalid."]}),
+            Response([1, 2], status=status.HTTP_201_CREATED),
+        ], meta={"request_id": "abc"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert isinstance(response.data, Envelope)
+        assert response.data["success"] is False
+        assert response.data["meta"] == {
+            "request_id": "abc",
+            "batch": {"total": 3, "succeeded": 2, "failed": 1},
+        }
+        assert response.data["data"] == [
+            {"success": True, "message": "Operation successful", "data": {"id": 1}, "status": 200},
+            {"success": False, "message": "Nope", "data": {}, "errors": {"id": ["Invalid."]}, "status": 400},
+            {"success": True, "message": "Operation successful", "data": [1, 2], "status": 201},
+        ]
+
+    def test_batch_translates_exceptions(self):
+        """Test that exceptions are translated like the exception handler does."""
+        response = StandardResponse.batch([NotFound("Missing"), ValidationError({"name": ["Required."]})])
+
+        missing, invalid = response.data["data"]
+        assert missing == {"success": False, "message": "Missing", "data": {}, "status": 404}
+        assert invalid["message"] == "Validation failed"
+        assert invalid["errors"] == {"name": ["Required."]}
+        assert response.data["message"] == "Batch completed with errors"
+
+    def test_empty_batch(self):
+        """Test that an empty batch succeeds with zero counts."""
+        response = StandardResponse.batch([])
+
+        assert response.data["success"] is True
+        assert response.data["data"] == []
+        assert response.data["meta"]["batch"] == {"total": 0, "succeeded": 0, "failed": 0}
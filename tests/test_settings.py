@@ -0,0 +1,191 @@
+"""
+Tests for the STANDARDIZED_RESPONSES settings object.
+
+This module tests validation, derived data and the settings-driven defaults
+of responses, the exception handler and pagination.
+"""
+import pytest
+from django.conf import settings as django_settings
+from django.core.exceptions import ImproperlyConfigured
+from django.test import override_settings
+from rest_framework.exceptions import APIException, NotFound, ValidationError
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from drf_standardized_responses.exceptions import standardized_exception_handler
+from drf_standardized_responses.pagination import StandardCursorPagination, StandardPagination
+from drf_standardized_responses.renderers import StandardResponseRenderer, _empty_envelope, prepare_envelope_cache
+from drf_standardized_responses.responses import StandardResponse
+from drf_standardized_responses.settings import DEFAULTS, IMPORT_STRINGS, ResponseSettings, response_settings
+
+MESSAGES = override_settings(STANDARDIZED_RESPONSES={
+    'SUCCESS_MESSAGE': 'OK',
+    'ERROR_MESSAGE': 'Error',
+    'VALIDATION_ERROR_MESSAGE': 'Invalid input',
+    'REQUEST_FAILED_MESSAGE': 'Failed',
+    'SERVER_ERROR_MESSAGE': 'Oops',
+    'BATCH_COMPLETED_MESSAGE': 'All done',
+    'BATCH_FAILED_MESSAGE': 'Some failed',
+    'STATUS_MESSAGES': {404: 'Missing'},
+})
+
+
+def make_settings(user_settings):
+    """Return a settings object for `user_settings`."""
+    settings = ResponseSettings(None, DEFAULTS, IMPORT_STRINGS)
+    settings._user_settings = user_settings
+    return settings
+
+
+class TestValidation:
+    """Tests for ResponseSettings.validate and load."""
+
+    def test_defaults_are_valid(self):
+        """Test that the defaults pass validation."""
+        make_settings({}).load()
+
+    def test_unknown_setting(self):
+        """Test that misspelled settings are rejected."""
+        with pytest.raises(ImproperlyConfigured, match="Unknown setting STANDARDIZED_RESPONSES\\['PAGESIZE'\\]"):
+            make_settings({'PAGESIZE': 20}).validate()
+
+    @pytest.mark.parametrize('name, value', [
+        ('JSON_BACKEND', 'ujson'),
+        ('ERROR_FORMAT', 'tree'),
+        ('PAGE_SIZE', 0),
+        ('PAGE_SIZE', '10'),
+        ('MAX_PAGE_SIZE', True),
+        ('EXCEPTION_LOG_SAMPLE_RATE', 1.5),
+        ('SUCCESS_MESSAGE', None),
+        ('STATUS_MESSAGES', {'404': 'Missing'}),
+        ('RESPONSE_CACHE_KEY_COMPONENTS', ('path', 'querystring')),
+        ('RESPONSE_CACHE_KEY_COMPONENTS', 'path'),
+        ('COMPRESSION_ENCODINGS', ('br', 'deflate')),
+        ('COMPRESSION_LEVELS', {'gzip': 'fast'}),
+        ('COMPRESSION_LEVELS', {'lz4': 1}),
+        ('EXCEPTION_LOG_RATE_OVERRIDES', {'ConnectionError': -1}),
+        ('EXCEPTION_LOG_RATE_OVERRIDES', {ConnectionError: 1}),
+        ('TIMING', 'yes'),
+        ('SPARSE_FIELDSETS', 1),
+        ('EXCEPTION_LOG_QUEUE', None),
+    ])
+    def test_invalid_values(self, name, value):
+        """Test that invalid values are rejected with the expected values in the message."""
+        with pytest.raises(ImproperlyConfigured, match='Invalid value .* expected'):
+            make_settings({name: value}).validate()
+
+    def test_optional_values(self):
+        """Test that settings documented as optional accept None."""
+        make_settings({'MAX_PAGE_SIZE': None, 'ERROR_LIMIT': None, 'EXCEPTION_LOG_RATE': None}).validate()
+
+    def test_collection_values(self):
+        """Test that valid names, mappings and flags pass validation."""
+        make_settings({
+            'RESPONSE_CACHE_KEY_COMPONENTS': ['path', 'language'],
+            'COMPRESSION_ENCODINGS': ('zstd', 'gzip'),
+            'COMPRESSION_LEVELS': {'zstd': -1, 'gzip': 9},
+            'EXCEPTION_LOG_RATE_OVERRIDES': {'ConnectionError': 1, 'TimeoutError': None},
+            'TIMING': True,
+        }).validate()
+
+    def test_load_caches_every_setting(self):
+        """Test that load() reads every setting up front."""
+        settings = make_settings({'PAGE_SIZE': 25})
+        settings.load()
+
+        assert settings._cached_attrs == set(DEFAULTS)
+        assert vars(settings)['PAGE_SIZE'] == 25
+
+    def test_validated_on_first_use(self, monkeypatch):
+        """Test that settings are validated when first read, without the app's ready() hook."""
+        monkeypatch.setattr(django_settings, 'STANDARDIZED_RESPONSES', {'PAGE_SIZE': 'ten'}, raising=False)
+        unloaded = ResponseSettings(None, DEFAULTS, IMPORT_STRINGS)
+
+        with pytest.raises(ImproperlyConfigured, match="'PAGE_SIZE'"):
+            unloaded.PAGE_SIZE
+
+    def test_override_settings_is_validated(self):
+        """Test that invalid settings applied with override_settings are rejected."""
+        with pytest.raises(ImproperlyConfigured, match='Unknown setting'):
+            with override_settings(STANDARDIZED_RESPONSES={'PAGE_SIZE': 20, 'NOPE': 1}):
+                pass
+        with pytest.raises(ImproperlyConfigured, match="'PAGE_SIZE'"):
+            with override_settings(STANDARDIZED_RESPONSES={'PAGE_SIZE': 'ten'}):
+                pass
+
+        assert response_settings.PAGE_SIZE == 10
+
+    def test_status_messages_are_reset_on_reload(self):
+        """Test that derived data is recomputed after a reload."""
+        with override_settings(STANDARDIZED_RESPONSES={'STATUS_MESSAGES': {404: 'Missing'}}):
+            assert response_settings.status_messages == {404: 'Missing'}
+        assert response_settings.status_messages == {}
+
+
+class TestConfiguredMessages:
+    """Tests for the message settings."""
+
+    def setup_method(self):
+        """Set up the test environment."""
+        self.context = {'request': APIRequestFactory().get('/')}
+
+    @MESSAGES
+    def test_response_defaults(self):
+        """Test that StandardResponse uses the configured default messages."""
+        assert StandardResponse.success().data['message'] == 'OK'
+        assert StandardResponse.error().data['message'] == 'Error'
+        assert StandardResponse.success(message='Created').data['message'] == 'Created'
+        assert StandardResponse.batch([StandardResponse.success(data=1)]).data['message'] == 'All done'
+        assert StandardResponse.batch([NotFound()]).data['message'] == 'Some failed'
+
+    @MESSAGES
+    def test_exception_handler_messages(self):
+        """Test that the exception handler uses the configured messages."""
+        def message(exc):
+            return standardized_exception_handler(exc, self.context).data['message']
+
+        assert message(ValidationError({'name': ['Required.']})) == 'Invalid input'
+        assert message(NotFound('')) == 'Missing'
+        assert message(APIException('')) == 'Failed'
+        assert message(RuntimeError()) == 'Oops'
+
+    @MESSAGES
+    def test_renderer_defaults(self):
+        """Test that the renderer wraps raw data with the configured messages."""
+        renderer = StandardResponseRenderer()
+
+        assert renderer.render({'a': 1}) == b'{"success":true,"message":"OK","data":{"a":1}}'
+
+    @MESSAGES
+    def test_prepare_envelope_cache(self):
+        """Test that the empty envelopes of the configured messages are pre-encoded."""
+        prepare_envelope_cache()
+        hits = _empty_envelope.cache_info().hits
+
+        _empty_envelope(False, 'Missing', False, True)
+
+        assert _empty_envelope.cache_info().hits == hits + 1
+
+
+class TestConfiguredPageSizes:
+    """Tests for the PAGE_SIZE and MAX_PAGE_SIZE settings."""
+
+    @override_settings(STANDARDIZED_RESPONSES={'PAGE_SIZE': 25, 'MAX_PAGE_SIZE': 50})
+    @pytest.mark.parametrize('pagination_class', [StandardPagination, StandardCursorPagination])
+    def test_page_sizes_from_settings(self, pagination_class):
+        """Test that the pagination classes read their page sizes from the settings."""
+        pagination = pagination_class()
+        factory = APIRequestFactory()
+
+        assert pagination.page_size == 25
+        assert pagination.get_page_size(Request(factory.get('/'))) == 25
+        assert pagination.get_page_size(Request(factory.get('/', {'page_size': 500}))) == 50
+
+    @override_settings(STANDARDIZED_RESPONSES={'PAGE_SIZE': 25})
+    def test_subclasses_override_settings(self):
+        """Test that a page size set on a subclass takes precedence."""
+        class SmallPagination(StandardPagination):
+            page_size = 5
+
+        assert SmallPagination().page_size == 5
+        assert SmallPagination.max_page_size == 100
@@ -0,0 +1,295 @@
+"""
+Tests for the streaming response helpers.
+
+This module tests that streamed envelopes are byte-identical to the
+non-streamed rendering and that items are consumed lazily.
+"""
+import json
+
+import django
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import Group
+from django.core.exceptions import ImproperlyConfigured
+from django.urls import reverse
+from rest_framework.exceptions import NotAcceptable
+from rest_framework.test import APIClient
+
+from drf_standardized_responses.pagination import StandardPagination
+from drf_standardized_responses.renderers import (
+    StandardCBORRenderer,
+    StandardMessagePackRenderer,
+    StandardResponseRenderer,
+)
+from drf_standardized_responses.responses import StandardResponse
+from drf_standardized_responses.streaming import (
+    StandardStreamingResponse,
+    aiter_envelope,
+    aiter_serialized,
+    can_stream,
+    iter_envelope,
+    iter_serialized,
+)
+
+# The async entry points need async ORM and streaming APIs (Django 4.2+)
+requires_async_django = pytest.mark.skipif(django.VERSION < (4, 2), reason="requires Django 4.2 or later")
+
+
+class TestIterEnvelope:
+    """Tests for the iter_envelope generator."""
+
+    def setup_method(self):
+        """Set up the test environment."""
+        self.renderer = StandardResponseRenderer()
+
+    def render_full(self, data, meta=None, message="Operation successful"):
+        """Render the complete envelope in one go for comparison."""
+        envelope = StandardResponse.success(data=data, meta=meta, message=message).data
+        return self.renderer.render_json(envelope)
+
+    def test_matches_full_rendering(self):
+        """Test that the streamed bytes equal the rendered envelope."""
+        items = [{"id": i, "name": "Item %d" % i} for i in range(10)]
+        meta = {"pagination": {"count": 10}}
+
+        streamed = b''.join(iter_envelope(items, meta=meta, renderer=self.renderer))
+
+        assert streamed == self.render_full(items, meta)
+
+    def test_empty_items_without_meta(self):
+        """Test streaming an empty list with no metadata."""
+        streamed = b''.join(iter_envelope([], message="Nothing here"))
+
+        assert streamed == self.render_full([], message="Nothing here")
+
+    def test_none_items(self):
+        """Test that `None` items are encoded as JSON null."""
+        streamed = b''.join(iter_envelope([None, 1]))
+
+        assert json.loads(streamed)["data"] == [None, 1]
+
+    def test_long_separators(self):
+        """Test that non-compact output matches the renderer's separators."""
+        self.renderer.compact = False
+        items = [{"a": 1}, {"b": 2}]
+
+        streamed = b''.join(iter_envelope(items, meta={"x": 1}, renderer=self.renderer))
+
+        assert streamed == self.render_full(items, {"x": 1})
+
+    def test_meta_callable_runs_after_items(self):
+        """Test that callable metadata is evaluated once all items are emitted."""
+        seen = []
+
+        def items():
+            for i in range(3):
+                seen.append(i)
+                yield i
+
+        streamed = b''.join(iter_envelope(items(), meta=lambda: {"count": len(seen)}))
+
+        assert json.loads(streamed)["meta"] == {"count": 3}
+
+    def test_buffers_into_chunks(self):
+        """Test that items are grouped into chunks of roughly `buffer_size` bytes."""
+        items = ["x" * 100 for _ in range(50)]
+
+        chunks = list(iter_envelope(items, buffer_size=1000))
+
+        assert 1 < len(chunks) < len(items)
+        assert json.loads(b''.join(chunks))["data"] == items
+
+    def test_items_are_consumed_lazily(self):
+        """Test that nothing is pulled from the iterable before the stream is read."""
+        consumed = []
+
+        def items():
+            for i in range(3):
+                consumed.append(i)
+                yield i
+
+        stream = iter_envelope(items(), buffer_size=1)
+        assert consumed == []
+
+        next(stream)
+        assert consumed == [0]
+
+
+class TestIterSerialized:
+    """Tests for the iter_serialized generator."""
+
+    def test_without_serializer(self):
+        """Test that items are yielded unchanged without a serializer."""
+        assert list(iter_serialized(None, [1, 2])) == [1, 2]
+
+    @pytest.mark.django_db
+    def test_queryset_uses_iterator(self):
+        """Test that querysets are consumed through a cursor and not cached."""
+        from rest_framework import serializers
+
+        class GroupSerializer(serializers.ModelSerializer):
+            class Meta:
+                model = Group
+                fields = ['name']
+
+        Group.objects.bulk_create([Group(name="g%d" % i) for i in range(5)])
+        queryset = Group.objects.order_by('name')
+
+        result = list(iter_serialized(GroupSerializer(), queryset, chunk_size=2))
+
+        assert result == [{"name": "g%d" % i} for i in range(5)]
+        assert queryset._result_cache is None
+
+
+async def collect(stream):
+    """Drain an async generator into a list."""
+    return [chunk async for chunk in stream]
+
+
+async def agen(items):
+    """Yield `items` from an async generator."""
+    for item in items:
+        yield item
+
+
+@requires_async_django
+class TestAsyncStreaming:
+    """Tests for the async streaming helpers."""
+
+    def test_aiter_envelope_matches_sync(self):
+        """Test that the async envelope is byte-identical to the sync one."""
+        items = [{"id": i} for i in range(20)]
+        meta = {"pagination": {"count": 20}}
+
+        chunks = async_to_sync(collect)(aiter_envelope(agen(items), meta=meta, buffer_size=32))
+
+        assert len(chunks) > 1
+        assert b''.join(chunks) == b''.join(iter_envelope(items, meta=meta))
+
+    def test_awaitable_meta(self):
+        """Test that a callable meta returning a coroutine is awaited after the items."""
+        seen = []
+
+        async def items():
+            for i in range(3):
+                seen.append(i)
+                yield i
+
+        async def meta():
+            return {"count": len(seen)}
+
+        chunks = async_to_sync(collect)(aiter_envelope(items(), meta=meta))
+
+        assert json.loads(b''.join(chunks))["meta"] == {"count": 3}
+
+    @pytest.mark.django_db
+    def test_aiter_serialized_queryset(self):
+        """Test that querysets are consumed with async iteration."""
+        from rest_framework import serializers
+
+        class GroupSerializer(serializers.ModelSerializer):
+            class Meta:
+                model = Group
+                fields = ['name']
+
+        Group.objects.bulk_create([Group(name="g%d" % i) for i in range(5)])
+        queryset = Group.objects.order_by('name')
+
+        result = async_to_sync(collect)(aiter_serialized(GroupSerializer(), queryset, chunk_size=2))
+
+        assert result == [{"name": "g%d" % i} for i in range(5)]
+        assert queryset._result_cache is None
+
+    def test_aiter_serialized_plain_iterable(self):
+        """Test that plain iterables are accepted."""
+        assert async_to_sync(collect)(aiter_serialized(None, [1, 2])) == [1, 2]
+
+    def test_streaming_response_with_async_iterable(self):
+        """Test that StandardStreamingResponse streams async iterables asynchronously."""
+        response = StandardStreamingResponse(agen([1, 2]), meta={"x": 1})
+
+        assert response.is_async
+        content = b''.join(async_to_sync(collect)(response.streaming_content))
+        assert json.loads(content) == {
+            "success": True, "message": "Operation successful", "data": [1, 2], "meta": {"x": 1},
+        }
+
+
+class TestAsyncSupport:
+    """Tests for the Django version check of the async entry points."""
+
+    def test_old_django_is_rejected(self, monkeypatch):
+        """Test that async entry points raise a clear error before Django 4.2."""
+        monkeypatch.setattr('django.VERSION', (4, 1, 0, 'final', 0))
+
+        with pytest.raises(ImproperlyConfigured, match='requires Django 4.2 or later'):
+            StandardStreamingResponse(agen([1]))
+        with pytest.raises(ImproperlyConfigured, match='aiter_serialized'):
+            async_to_sync(collect)(aiter_serialized(None, [1]))
+        with pytest.raises(ImproperlyConfigured, match='apaginate_queryset'):
+            async_to_sync(StandardPagination().apaginate_queryset)([1], None)
+
+
+@pytest.mark.django_db
+class TestStreamingViews:
+    """Integration tests for StandardStreamingResponse and StreamingListMixin."""
+
+    def setup_method(self):
+        """Set up the test client."""
+        self.client = APIClient()
+
+    def test_response_attributes(self):
+        """Test the status code and content type of a streaming response."""
+        response = StandardStreamingResponse(iter([1]), status=201)
+
+        assert response.status_code == 201
+        assert response['Content-Type'] == 'application/json'
+        assert response.streaming
+
+    @pytest.mark.parametrize('renderer', [StandardMessagePackRenderer(), StandardCBORRenderer()], ids=repr)
+    def test_binary_renderer_is_not_acceptable(self, renderer):
+        """Test that binary renderers are refused instead of streaming a format the client did not ask for."""
+        assert not can_stream(renderer)
+        with pytest.raises(NotAcceptable):
+            StandardStreamingResponse(iter([{"a": 1}]), renderer=renderer)
+
+    def test_binary_page_is_rendered(self):
+        """Test that a paginated streaming view renders the page as a whole in MessagePack."""
+        msgpack = pytest.importorskip('msgpack')
+
+        response = self.client.get(reverse('streaming-view') + '?page=2', HTTP_ACCEPT='application/msgpack')
+
+        assert not response.streaming
+        assert response['Content-Type'] == 'application/msgpack'
+        body = msgpack.unpackb(response.content)
+        assert body["data"] == [{"id": i} for i in range(10, 20)]
+        assert body["meta"]["pagination"]["current_page"] == 2
+
+    def test_binary_export_is_rendered(self):
+        """Test that an unpaginated streaming view renders every item in CBOR."""
+        cbor2 = pytest.importorskip('cbor2')
+
+        response = self.client.get(reverse('export-view'), HTTP_ACCEPT='application/cbor')
+
+        assert not response.streaming
+        assert response['Content-Type'] == 'application/cbor'
+        assert cbor2.loads(response.content)["data"] == [{"id": i} for i in range(100)]
+
+    def test_streamed_page(self):
+        """Test that a paginated view streams the page with pagination metadata."""
+        response = self.client.get(reverse('streaming-view') + '?page=2')
+        body = json.loads(b''.join(response.streaming_content))
+
+        assert response.status_code == 200
+        assert body["success"] is True
+        assert body["data"] == [{"id": i} for i in range(10, 20)]
+        assert body["meta"]["pagination"]["current_page"] == 2
+        assert body["meta"]["pagination"]["count"] == 100
+
+    def test_streamed_export(self):
+        """Test that an unpaginated view streams every item."""
+        response = self.client.get(reverse('export-view'))
+        body = json.loads(b''.join(response.streaming_content))
+
+        assert body["data"] == [{"id": i} for i in range(100)]
+        assert "meta" not in body
@@ -3,6 +3,23 @@ from rest_framework.generics import GenericAPIView
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.exceptions import ValidationError, NotFound, PermissionDenied
+from rest_framework import serializers
+
+from rest_framework.generics import ListAPIView
+
+from django.contrib.auth.models import Group, User
+from rest_framework import viewsets
+from rest_framework.routers import SimpleRouter
+
+from drf_standardized_responses.batch import BatchMixin
+
+from drf_standardized_responses.cache import CachedResponseMixin, cache_response
+from drf_standardized_responses.conditional import ConditionalListMixin
+from drf_standardized_responses.fieldsets import SparseFieldsetMixin, SparseQuerysetMixin
+from drf_standardized_responses.limits import ResponseLimitMixin
+from drf_standardized_responses.pagination import StandardPagination
+from drf_standardized_responses.responses import StandardResponse
+from drf_standardized_responses.streaming import NDJSONExportMixin, StreamingListMixin
 
 # The pagination class is now set in the test settings, so views will use it by default.
 
@@ -20,6 +37,93 @@ class PaginatedView(GenericAPIView):
             return self.get_paginated_response(page)
         return Response(queryset)
 
+class ItemSerializer(serializers.Serializer):
+    id = serializers.IntegerField(source='*')
+
+class StreamingPaginatedView(StreamingListMixin, GenericAPIView):
+    queryset = list(range(100))
+    serializer_class = ItemSerializer
+
+    def get(self, request, *args, **kwargs):
+        return self.list(request, *args, **kwargs)
+
+class StreamingExportView(StreamingPaginatedView):
+    pagination_class = None
+
+class CachedView(APIView):
+    calls = 0
+
+    @cache_response(timeout=60)
+    def get(self, request, *args, **kwargs):
+        CachedView.calls += 1
+        if 'fail' in request.query_params:
+            return StandardResponse.error(message='Failed', status_code=400)
+        if 'large' in request.query_params:
+            return StandardResponse.success(data={'calls': CachedView.calls, 'items': list(range(1000))})
+        return StandardResponse.success(data={'calls': CachedView.calls})
+
+class CachedListView(CachedResponseMixin, ListAPIView):
+    serializer_class = ItemSerializer
+    calls = 0
+
+    def get_queryset(self):
+        CachedListView.calls += 1
+        return list(range(30))
+
+    def post(self, request, *args, **kwargs):
+        return StandardResponse.success(status_code=201)
+
+class PrefetchPagination(StandardPagination):
+    prefetch_next_page = True
+
+class PrefetchListView(CachedResponseMixin, ListAPIView):
+    serializer_class = ItemSerializer
+    pagination_class = PrefetchPagination
+    calls = []
+
+    def get_queryset(self):
+        PrefetchListView.calls.append(self.request.query_params.get('page'))
+        return list(range(30))
+
+class CountingItemSerializer(ItemSerializer):
+    serialized = 0
+
+    def to_representation(self, instance):
+        CountingItemSerializer.serialized += 1
+        return super().to_representation(instance)
+
+class LimitedListView(ResponseLimitMixin, ListAPIView):
+    serializer_class = CountingItemSerializer
+    pagination_class = None
+    max_response_items = 10
+    queryset = list(range(25))
+
+class StreamedLimitedListView(LimitedListView):
+    response_limit_action = 'stream'
+
+class PaginatedLimitedListView(ResponseLimitMixin, ListAPIView):
+    serializer_class = ItemSerializer
+    queryset = list(range(25))
+
+class UserSerializer(serializers.ModelSerializer):
+    serialized = 0
+
+    class Meta:
+        model = User
+        fields = ['id', 'username']
+
+    def to_representation(self, instance):
+        UserSerializer.serialized += 1
+        return super().to_representation(instance)
+
+class LastLoginPagination(StandardPagination):
+    last_modified_field = 'last_login'
+
+class ConditionalUserListView(ConditionalListMixin, ListAPIView):
+    queryset = User.objects.order_by('pk')
+    serializer_class = UserSerializer
+    pagination_class = LastLoginPagination
+
 class ErrorView(APIView):
     def get(self, request, *args, **kwargs):
         error_type = request.query_params.get('type', 'validation')
@@ -40,15 +144,56 @@ class ErrorView(APIView):
 class PreformattedResponseView(APIView):
     def get(self, request, *args, **kwargs):
         # Return a response that's already in the standard format
-        return Response({
-            "success": True,
-            "message": "Pre-formatted response",
-            "data": {"test": "value"}
-        })
+        return StandardResponse.success(data={"test": "value"}, message="Pre-formatted response")
+
+class GroupSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Group
+        fields = ['id', 'name']
+
+class GroupBatchViewSet(BatchMixin, viewsets.ModelViewSet):
+    queryset = Group.objects.order_by('pk')
+    serializer_class = GroupSerializer
+    batch_max_operations = 5
+
+class SparseUserSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    groups = GroupSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = User
+        fields = ['id', 'username', 'email', 'groups']
+
+class SparseUserListView(SparseQuerysetMixin, ListAPIView):
+    queryset = User.objects.order_by('pk')
+    serializer_class = SparseUserSerializer
+
+class NDJSONGroupListView(NDJSONExportMixin, ListAPIView):
+    queryset = Group.objects.order_by('pk')
+    serializer_class = GroupSerializer
+    stream_chunk_size = 2
+
+class EchoView(APIView):
+    def post(self, request, *args, **kwargs):
+        return StandardResponse.success(data=request.data, meta={'format': request.accepted_renderer.format})
+
+router = SimpleRouter()
+router.register('api/groups', GroupBatchViewSet, basename='group')
 
 urlpatterns = [
     path('api/mock/', MockView.as_view(), name='mock-view'),
     path('api/paginated/', PaginatedView.as_view(), name='paginated-view'),
+    path('api/streaming/', StreamingPaginatedView.as_view(), name='streaming-view'),
+    path('api/export/', StreamingExportView.as_view(), name='export-view'),
+    path('api/cached/', CachedView.as_view(), name='cached-view'),
+    path('api/cached-list/', CachedListView.as_view(), name='cached-list-view'),
+    path('api/prefetch-list/', PrefetchListView.as_view(), name='prefetch-list-view'),
+    path('api/limited-list/', LimitedListView.as_view(), name='limited-list-view'),
+    path('api/streamed-limited-list/', StreamedLimitedListView.as_view(), name='streamed-limited-list-view'),
+    path('api/paginated-limited-list/', PaginatedLimitedListView.as_view(), name='paginated-limited-list-view'),
+    path('api/conditional-users/', ConditionalUserListView.as_view(), name='conditional-users-view'),
     path('api/error/', ErrorView.as_view(), name='error-view'),
     path('api/preformatted/', PreformattedResponseView.as_view(), name='preformatted-view'),
-]
+    path('api/sparse-users/', SparseUserListView.as_view(), name='sparse-users-view'),
+    path('api/echo/', EchoView.as_view(), name='echo-view'),
+    path('api/ndjson-groups/', NDJSONGroupListView.as_view(), name='ndjson-groups-view'),
+] + router.urls